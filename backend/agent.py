@@ -19,8 +19,8 @@ def create_agent(user_id: UUID, payload: schemas.AgentCreate, db: Session = Depe
         user_id=user_id,
         name=payload.name,
         personality=payload.personality,
-        focus_areas=payload.focus_areas,
-        integrations=payload.integrations,
+        focus_areas=payload.focus_areas or [],
+        integrations=payload.integrations or {},
     )
     db.add(agent)
     db.commit()
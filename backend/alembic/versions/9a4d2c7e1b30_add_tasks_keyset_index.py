@@ -0,0 +1,28 @@
+"""add tasks keyset index
+
+Revision ID: 9a4d2c7e1b30
+Revises: 674847534c9f
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4d2c7e1b30'
+down_revision = '674847534c9f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_workspace_created",
+        "tasks",
+        ["workspace_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_workspace_created", table_name="tasks")
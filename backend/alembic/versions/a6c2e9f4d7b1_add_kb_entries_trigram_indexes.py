@@ -0,0 +1,38 @@
+"""add kb entries trigram search indexes
+
+Revision ID: a6c2e9f4d7b1
+Revises: f3a8d6c1b2e5
+Create Date: 2026-10-17 17:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c2e9f4d7b1'
+down_revision = 'f3a8d6c1b2e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pg_trgm"')
+    op.create_index(
+        "ix_kb_entries_title_trgm",
+        "kb_entries",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_kb_entries_content_trgm",
+        "kb_entries",
+        ["content"],
+        postgresql_using="gin",
+        postgresql_ops={"content": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_kb_entries_content_trgm", table_name="kb_entries")
+    op.drop_index("ix_kb_entries_title_trgm", table_name="kb_entries")
@@ -0,0 +1,38 @@
+"""add templates trigram search indexes
+
+Revision ID: b3e8f0d4a9c2
+Revises: 9a4d2c7e1b30
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e8f0d4a9c2'
+down_revision = '9a4d2c7e1b30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pg_trgm"')
+    op.create_index(
+        "ix_templates_title_trgm",
+        "templates",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_templates_description_trgm",
+        "templates",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_templates_description_trgm", table_name="templates")
+    op.drop_index("ix_templates_title_trgm", table_name="templates")
@@ -0,0 +1,29 @@
+"""add kb entries list sort index
+
+Revision ID: b8d4f1a3c6e0
+Revises: a6c2e9f4d7b1
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d4f1a3c6e0'
+down_revision = 'a6c2e9f4d7b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # list_kb_entries filters by kb_id and reads newest first under a LIMIT.
+    op.create_index(
+        "ix_kb_entries_kb_created",
+        "kb_entries",
+        ["kb_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_kb_entries_kb_created", table_name="kb_entries")
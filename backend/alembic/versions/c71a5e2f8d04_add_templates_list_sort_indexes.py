@@ -0,0 +1,37 @@
+"""add templates list sort indexes
+
+Revision ID: c71a5e2f8d04
+Revises: b3e8f0d4a9c2
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c71a5e2f8d04'
+down_revision = 'b3e8f0d4a9c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Match list_templates' keyset ORDER BY for each side of its system-or-workspace filter.
+    op.create_index(
+        "ix_templates_workspace_sort",
+        "templates",
+        ["workspace_id", sa.text("is_recommended DESC"), sa.text("updated_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("visibility <> 'system'"),
+    )
+    op.create_index(
+        "ix_templates_system_sort",
+        "templates",
+        [sa.text("is_recommended DESC"), sa.text("updated_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("visibility = 'system'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_templates_system_sort", table_name="templates")
+    op.drop_index("ix_templates_workspace_sort", table_name="templates")
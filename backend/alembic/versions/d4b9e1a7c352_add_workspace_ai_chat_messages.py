@@ -0,0 +1,78 @@
+"""move workspace ai chat messages into their own table
+
+Revision ID: d4b9e1a7c352
+Revises: c71a5e2f8d04
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4b9e1a7c352'
+down_revision = 'c71a5e2f8d04'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workspace_ai_chat_messages",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column(
+            "chat_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("workspace_ai_chats.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("role", sa.String(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+    op.create_index(
+        "ix_workspace_ai_chat_messages_chat_created",
+        "workspace_ai_chat_messages",
+        ["chat_id", "created_at"],
+    )
+    # Keep transcript order for legacy entries that lack a timestamp.
+    op.execute(
+        """
+        INSERT INTO workspace_ai_chat_messages (chat_id, role, content, created_at)
+        SELECT
+            c.id,
+            COALESCE(m.value->>'role', 'assistant'),
+            COALESCE(m.value->>'content', ''),
+            COALESCE((m.value->>'created_at')::timestamptz, c.created_at + m.position * interval '1 microsecond')
+        FROM workspace_ai_chats AS c
+        CROSS JOIN LATERAL jsonb_array_elements(c.messages) WITH ORDINALITY AS m(value, position)
+        """
+    )
+    op.drop_column("workspace_ai_chats", "messages")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "workspace_ai_chats",
+        sa.Column("messages", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'[]'::jsonb")),
+    )
+    op.execute(
+        """
+        UPDATE workspace_ai_chats AS c
+        SET messages = m.messages
+        FROM (
+            SELECT
+                chat_id,
+                jsonb_agg(
+                    jsonb_build_object('role', role, 'content', content, 'created_at', created_at)
+                    ORDER BY created_at
+                ) AS messages
+            FROM workspace_ai_chat_messages
+            GROUP BY chat_id
+        ) AS m
+        WHERE m.chat_id = c.id
+        """
+    )
+    op.drop_index("ix_workspace_ai_chat_messages_chat_created", table_name="workspace_ai_chat_messages")
+    op.drop_table("workspace_ai_chat_messages")
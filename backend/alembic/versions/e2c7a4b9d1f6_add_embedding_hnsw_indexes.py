@@ -0,0 +1,36 @@
+"""add hnsw indexes for kb and prd embeddings
+
+Revision ID: e2c7a4b9d1f6
+Revises: d4b9e1a7c352
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c7a4b9d1f6'
+down_revision = 'd4b9e1a7c352'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # vector_l2_ops matches the `<->` ordering used by the KB, document and PRD searches.
+    for name, table in (
+        ("ix_kb_entries_embedding_hnsw", "kb_entries"),
+        ("ix_prd_embeddings_embedding_hnsw", "prd_embeddings"),
+    ):
+        op.create_index(
+            name,
+            table,
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "vector_l2_ops"},
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_prd_embeddings_embedding_hnsw", table_name="prd_embeddings")
+    op.drop_index("ix_kb_entries_embedding_hnsw", table_name="kb_entries")
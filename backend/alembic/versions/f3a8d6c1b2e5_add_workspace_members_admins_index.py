@@ -0,0 +1,30 @@
+"""add partial index on workspace admins
+
+Revision ID: f3a8d6c1b2e5
+Revises: e2c7a4b9d1f6
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a8d6c1b2e5'
+down_revision = 'e2c7a4b9d1f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves _ensure_remaining_admins' COUNT; the predicate mirrors workspaces.ADMIN_ROLE_VALUES.
+    op.create_index(
+        "ix_workspace_members_admins",
+        "workspace_members",
+        ["workspace_id"],
+        postgresql_where=sa.text("lower(role) IN ('admin', 'owner')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workspace_members_admins", table_name="workspace_members")
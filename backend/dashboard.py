@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from backend import models, schemas
@@ -25,11 +25,16 @@ def _coerce_status(value: str | None) -> str:
     return "active"
 
 
-@router.get("/overview", response_model=schemas.DashboardOverviewResponse)
+@router.get(
+    "/overview",
+    response_model=None,
+    responses={200: {"model": schemas.DashboardOverviewResponse}},
+)
 def get_dashboard_overview(workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
     ensure_membership(db, workspace_id, user_id, required_role="viewer")
     metrics = collect_dashboard_metrics(db, workspace_id)
-    return schemas.DashboardOverviewResponse(**metrics)
+    overview = schemas.DashboardOverviewResponse(**metrics)
+    return Response(content=overview.model_dump_json(), media_type="application/json")
 
 
 def _coach_prompt(metrics: dict[str, Any], kb_entries: list[models.KnowledgeBaseEntry]) -> str:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 from uuid import UUID
@@ -10,6 +11,33 @@ from sqlalchemy.orm import Session
 from backend import models, schemas
 
 
+# Invalidation is per process, so keep the TTL short enough that other workers converge quickly.
+METRICS_CACHE_TTL_SECONDS = 30
+_METRICS_CACHE: dict[UUID, tuple[float, Dict[str, Any]]] = {}
+_METRICS_CACHE_SIZE = 1024
+
+
+def cached_dashboard_metrics(db: Session, workspace_id: UUID) -> Dict[str, Any]:
+    """Return recent workspace metrics, recomputing at most once per TTL window.
+
+    Callers must treat the returned dict as read-only; it is shared between requests.
+    """
+    now = time.monotonic()
+    cached = _METRICS_CACHE.get(workspace_id)
+    if cached and now - cached[0] < METRICS_CACHE_TTL_SECONDS:
+        return cached[1]
+    metrics = collect_dashboard_metrics(db, workspace_id)
+    if len(_METRICS_CACHE) >= _METRICS_CACHE_SIZE:
+        _METRICS_CACHE.clear()
+    _METRICS_CACHE[workspace_id] = (now, metrics)
+    return metrics
+
+
+def invalidate_dashboard_metrics(workspace_id: UUID | None) -> None:
+    if workspace_id is not None:
+        _METRICS_CACHE.pop(workspace_id, None)
+
+
 def collect_dashboard_metrics(db: Session, workspace_id: UUID) -> Dict[str, Any]:
     """Aggregate workspace data used by both the dashboard and AI coach."""
     now = datetime.now(timezone.utc)
@@ -1,5 +1,6 @@
 import os
-from sqlalchemy import create_engine
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -14,10 +15,41 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set. Please add it to your .env file.")
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# QueuePool sizing for Postgres; each worker process gets its own pool.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+POOL_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+POOL_WARM_SIZE = int(os.getenv("DB_POOL_WARM_SIZE", "5"))
+
+engine_options = {"pool_pre_ping": True}
+if not DATABASE_URL.startswith("sqlite"):
+    engine_options.update(
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+    )
+
+engine = create_engine(DATABASE_URL, **engine_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+def warm_pool(count: int = POOL_WARM_SIZE) -> None:
+    """Open ``count`` connections concurrently so early requests skip connect/auth latency."""
+    count = min(count, POOL_SIZE)
+    if count <= 0 or DATABASE_URL.startswith("sqlite"):
+        return
+
+    def _open(_: int):
+        connection = engine.connect()
+        connection.execute(text("SELECT 1"))
+        return connection
+
+    # Hold every connection until all are open so the pool ends up with `count` distinct ones.
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        connections = list(executor.map(_open, range(count)))
+    for connection in connections:
+        connection.close()
+
 def get_db():
     db = SessionLocal()
     try:
@@ -1,6 +1,9 @@
+import os
+from functools import lru_cache
 from typing import Sequence
 from uuid import UUID
 
+import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
 from backend.ai_providers import get_openai_client
@@ -21,3 +24,41 @@ def generate_embedding(
         input=text,
     )
     return response.data[0].embedding
+
+
+def generate_embeddings(
+    texts: Sequence[str],
+    *,
+    db: Session | None = None,
+    workspace_id: UUID | None = None,
+) -> list[Sequence[float]]:
+    """
+    Embed several chunks in one OpenAI request, preserving input order.
+    """
+    if not texts:
+        return []
+    client = get_openai_client(db, workspace_id)
+    response = client.embeddings.create(
+        model="text-embedding-3-small",
+        input=list(texts),
+    )
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+# HNSW candidates kept per scan; searches filter by workspace/KB afterwards, so keep well above LIMIT.
+HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "100"))
+
+
+def widen_ann_search(db: Session) -> None:
+    """Raise hnsw.ef_search for the current transaction before a filtered nearest-neighbour query."""
+    db.execute(sa.text(f"SET LOCAL hnsw.ef_search = {HNSW_EF_SEARCH:d}"))
+
+
+@lru_cache(maxsize=8)
+def _vector_format(dimensions: int) -> str:
+    return "[" + ",".join(["%.10f"] * dimensions) + "]"
+
+
+def to_vector_literal(values: Sequence[float]) -> str:
+    """Render an embedding as a pgvector text literal with one %-format call."""
+    return _vector_format(len(values)) % tuple(values)
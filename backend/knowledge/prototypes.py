@@ -8,7 +8,7 @@ from textwrap import dedent
 from typing import Any
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from openai import OpenAIError
 from sqlalchemy.orm import Session
 
@@ -154,44 +154,37 @@ def build_project_context_summary(db: Session, project: Project) -> str:
     return "\n".join(lines)
 
 
-def render_prototype_html(spec: schemas.PrototypeSpec) -> str:
-    """Generate a minimal HTML preview for the prototype."""
-    def render_component_html(component: schemas.PrototypeComponent) -> str:
-        title = component.title or component.kind.title()
-        desc = component.description or ""
-        body = ""
-        if component.kind == "form" and component.fields:
-            fields_html = "".join(
-                f"<div class=\"preview-field\"><label>{field}</label><input placeholder='Enter {field.lower()}' /></div>"
-                for field in component.fields
-            )
-            body = f"<div class=\"preview-form\">{fields_html}<button class=\"button\">Submit</button></div>"
-        elif component.kind == "list" and component.sample_items:
-            items = "".join(f"<li>{item}</li>" for item in component.sample_items)
-            body = f"<ul class=\"preview-list\">{items}</ul>"
-        elif component.kind == "stats" and component.sample_items:
-            items = "".join(f"<div class=\"preview-stat\">{item}</div>" for item in component.sample_items)
-            body = f"<div class=\"preview-stats\">{items}</div>"
-        else:
-            body = f"<p>{desc}</p>" if desc else ""
-
-        actions = "".join(f"<span class=\"chip\">{action}</span>" for action in component.actions or [])
-
-        return (
-            "<div class=\"component\">"
-            f"<h4>{title}</h4>"
-            f"{body}"
-            f"<div class=\"actions\">{actions}</div>"
-            "</div>"
+def _render_component_html(component: schemas.PrototypeComponent) -> str:
+    title = component.title or component.kind.title()
+    desc = component.description or ""
+    body = ""
+    if component.kind == "form" and component.fields:
+        fields_html = "".join(
+            f"<div class=\"preview-field\"><label>{field}</label><input placeholder='Enter {field.lower()}' /></div>"
+            for field in component.fields
         )
+        body = f"<div class=\"preview-form\">{fields_html}<button class=\"button\">Submit</button></div>"
+    elif component.kind == "list" and component.sample_items:
+        items = "".join(f"<li>{item}</li>" for item in component.sample_items)
+        body = f"<ul class=\"preview-list\">{items}</ul>"
+    elif component.kind == "stats" and component.sample_items:
+        items = "".join(f"<div class=\"preview-stat\">{item}</div>" for item in component.sample_items)
+        body = f"<div class=\"preview-stats\">{items}</div>"
+    else:
+        body = f"<p>{desc}</p>" if desc else ""
+
+    actions = "".join(f"<span class=\"chip\">{action}</span>" for action in component.actions or [])
 
-    sections: list[str] = []
-    for screen in spec.key_screens:
-        actions_html = "".join(f"<li>{action}</li>" for action in screen.primary_actions)
-        notes_html = f"<p class=\"notes\">{screen.layout_notes}</p>" if screen.layout_notes else ""
-        components_html = "".join(render_component_html(component) for component in screen.components)
-        sections.append(
-            """
+    return (
+        "<div class=\"component\">"
+        f"<h4>{title}</h4>"
+        f"{body}"
+        f"<div class=\"actions\">{actions}</div>"
+        "</div>"
+    )
+
+
+_SCREEN_SECTION_HTML = """
             <section class=\"prototype-screen\">
                 <h3>{name}</h3>
                 <p class=\"goal\">{goal}</p>
@@ -199,7 +192,18 @@ def render_prototype_html(spec: schemas.PrototypeSpec) -> str:
                 {notes}
                 <div class=\"components\">{components}</div>
             </section>
-            """.format(
+            """
+
+
+def render_prototype_html(spec: schemas.PrototypeSpec) -> str:
+    """Generate a minimal HTML preview for the prototype."""
+    sections: list[str] = []
+    for screen in spec.key_screens:
+        actions_html = "".join(f"<li>{action}</li>" for action in screen.primary_actions)
+        notes_html = f"<p class=\"notes\">{screen.layout_notes}</p>" if screen.layout_notes else ""
+        components_html = "".join(_render_component_html(component) for component in screen.components)
+        sections.append(
+            _SCREEN_SECTION_HTML.format(
                 name=screen.name,
                 goal=screen.goal,
                 actions=actions_html,
@@ -931,7 +935,7 @@ def list_prototypes(project_id: str, workspace_id: UUID, db: Session = Depends(g
         .order_by(Prototype.created_at.desc())
         .all()
     )
-    return prototypes
+    return Response(content=schemas.dump_prototype_list(prototypes), media_type="application/json")
 
 
 @router.post("", response_model=schemas.PrototypeResponse, status_code=status.HTTP_201_CREATED)
@@ -964,7 +968,11 @@ def generate_prototype_batch(
         spec = _generate_spec_for_variant(project, roadmap, payload, db, variant_index=index, total_variants=total)
         prototype = _persist_prototype(db, project=project, roadmap=roadmap, payload=payload, spec=spec)
         prototypes.append(prototype)
-    return prototypes
+    return Response(
+        content=schemas.dump_prototype_list(prototypes),
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.delete("/{prototype_id}")
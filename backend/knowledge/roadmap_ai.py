@@ -106,15 +106,15 @@ def build_context_block(project: Project, knowledge_section: str) -> str:
     return "\n".join(lines)
 
 
-def store_conversation(db: Session, project_id: str, messages: list[schemas.RoadmapChatMessage]) -> None:
+def store_conversation(db: Session, project_id: str, messages: list[dict[str, str]]) -> None:
     db.query(RoadmapConversation).filter(RoadmapConversation.project_id == project_id).delete()
     for msg in messages:
         db.add(
             RoadmapConversation(
                 id=uuid.uuid4(),
                 project_id=project_id,
-                message_role=msg.role,
-                message_content=msg.content,
+                message_role=msg["role"],
+                message_content=msg["content"],
             )
         )
     db.commit()
@@ -188,7 +188,7 @@ def generate_roadmap_endpoint(
         project.description,
         payload.prompt,
     ]
-    query_terms.extend(msg.content for msg in history_messages if msg.role == "user")
+    query_terms.extend(msg["content"] for msg in history_messages if msg["role"] == "user")
     context_query = "\n".join(filter(None, query_terms))
     kb_entries = get_relevant_entries(db, project.workspace_id, context_query, top_n=5)
     context_bundle = bundle_context_entries(kb_entries)
@@ -203,7 +203,7 @@ def generate_roadmap_endpoint(
 
     effective_history = history_messages.copy()
     if prompt:
-        effective_history.append(schemas.RoadmapChatMessage(role="user", content=prompt))
+        effective_history.append({"role": "user", "content": prompt})
 
     agent_prompt = None
     if payload.user_id:
@@ -237,9 +237,7 @@ def generate_roadmap_endpoint(
             )
         except HTTPException:
             pass
-    openai_messages.extend(
-        {"role": msg.role, "content": msg.content} for msg in effective_history
-    )
+    openai_messages.extend(effective_history)
 
     try:
         client = get_openai_client(db, payload.workspace_id)
@@ -284,14 +282,12 @@ def generate_roadmap_endpoint(
     if action not in {"ask_followup", "present_roadmap"}:
         raise HTTPException(status_code=500, detail="Assistant returned an unknown action.")
 
-    updated_history = effective_history + [
-        schemas.RoadmapChatMessage(role="assistant", content=assistant_message)
-    ]
+    updated_history = effective_history + [{"role": "assistant", "content": assistant_message}]
 
     roadmap_markdown: str | None = None
     note_key = data.get("note_key")
     suggestions_raw = data.get("suggestions")
-    suggestions: list[str] | None = None
+    suggestions: list[str] = []
     if isinstance(suggestions_raw, list):
         cleaned = [str(item) for item in suggestions_raw if isinstance(item, (str, int, float))]
         if cleaned:
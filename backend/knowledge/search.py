@@ -1,12 +1,18 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, defer, selectinload
 from uuid import UUID
 import sqlalchemy as sa
 
 from backend.database import get_db
 from backend import models
-from backend.knowledge.embeddings import generate_embedding
-from backend.knowledge_base_service import ensure_workspace_kb, build_entry_content, EMBED_TEXT_LIMIT
+from backend.knowledge.embeddings import widen_ann_search
+from backend.knowledge_base_service import (
+    EMBED_TEXT_LIMIT,
+    build_entry_content,
+    contains_pattern,
+    ensure_workspace_kb,
+    query_vector_literal,
+)
 from backend.rbac import ensure_membership
 
 router = APIRouter(prefix="/knowledge/search", tags=["knowledge-search"])
@@ -28,42 +34,12 @@ def search_knowledge(
     if not normalized_query:
         return []
 
-    params: dict[str, object] = {
-        "kb_id": str(kb.id),
-        "limit": limit,
-    }
-    filters: list[str] = []
-    if entry_type:
-        filters.append("type = :entry_type")
-        params["entry_type"] = entry_type
-    if project_id:
-        filters.append("project_id = :project_id")
-        params["project_id"] = str(project_id)
-
-    entry_ids: list[UUID] = []
-    try:
-        query_embedding = generate_embedding(
-            normalized_query[:EMBED_TEXT_LIMIT],
-            db=db,
-            workspace_id=workspace_id,
-        )
-        vector_literal = "[" + ",".join(f"{value:.10f}" for value in query_embedding) + "]"
-        params["embedding"] = vector_literal
-        sql = (
-            "SELECT id FROM kb_entries "
-            "WHERE kb_id = :kb_id AND embedding IS NOT NULL"
-        )
-        if filters:
-            sql += " AND " + " AND ".join(filters)
-        sql += " ORDER BY embedding <-> (:embedding)::vector LIMIT :limit"
-        rows = db.execute(sa.text(sql), params).fetchall()
-        entry_ids = [row[0] for row in rows]
-    except Exception:
-        entry_ids = []
-
     entries_query = (
         db.query(models.KnowledgeBaseEntry)
-        .options(joinedload(models.KnowledgeBaseEntry.documents))
+        .options(
+            defer(models.KnowledgeBaseEntry.embedding),
+            selectinload(models.KnowledgeBaseEntry.documents).defer(models.Document.embedding),
+        )
         .filter(models.KnowledgeBaseEntry.kb_id == kb.id)
     )
     if entry_type:
@@ -71,22 +47,34 @@ def search_knowledge(
     if project_id:
         entries_query = entries_query.filter(models.KnowledgeBaseEntry.project_id == project_id)
 
-    entries: list[models.KnowledgeBaseEntry]
-    if entry_ids:
-        entries = entries_query.filter(models.KnowledgeBaseEntry.id.in_(entry_ids)).all()
-        entry_map = {entry.id: entry for entry in entries}
-        ordered = [entry_map[eid] for eid in entry_ids if eid in entry_map]
-        entries = ordered
-    else:
-        like_value = f"%{normalized_query.lower()}%"
+    entries: list[models.KnowledgeBaseEntry] = []
+    try:
+        vector_literal = query_vector_literal(db, workspace_id, normalized_query[:EMBED_TEXT_LIMIT])
+        widen_ann_search(db)
+        entries = (
+            entries_query.filter(models.KnowledgeBaseEntry.embedding.isnot(None))
+            .order_by(sa.text("kb_entries.embedding <-> (:embedding)::vector"))
+            .params(embedding=vector_literal)
+            .limit(limit)
+            .all()
+        )
+    except Exception:
+        entries = []
+
+    if not entries:
+        # Degraded mode: ILIKE hits the kb_entries pg_trgm indexes, closest trigram matches first.
+        like_value = contains_pattern(normalized_query)
         entries = (
             entries_query.filter(
                 sa.or_(
-                    sa.func.lower(models.KnowledgeBaseEntry.title).like(like_value),
-                    sa.func.lower(models.KnowledgeBaseEntry.content).like(like_value),
+                    models.KnowledgeBaseEntry.title.ilike(like_value, escape="\\"),
+                    models.KnowledgeBaseEntry.content.ilike(like_value, escape="\\"),
                 )
             )
-            .order_by(models.KnowledgeBaseEntry.created_at.desc())
+            .order_by(
+                sa.func.word_similarity(normalized_query, models.KnowledgeBaseEntry.title).desc(),
+                models.KnowledgeBaseEntry.created_at.desc(),
+            )
             .limit(limit)
             .all()
         )
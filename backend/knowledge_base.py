@@ -7,7 +7,7 @@ from uuid import UUID
 
 import sqlalchemy as sa
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi.responses import FileResponse, PlainTextResponse, Response
 from sqlalchemy.orm import Session, joinedload
 
 from backend import models, schemas
@@ -17,6 +17,7 @@ from backend.knowledge.file_utils import extract_text_from_file
 from backend.knowledge_base_service import (
     KB_ENTRY_TYPES,
     build_entry_content,
+    contains_pattern,
     delete_uploaded_file,
     ensure_workspace_kb,
     store_uploaded_file,
@@ -31,7 +32,7 @@ def _serialize_entry(entry: models.KnowledgeBaseEntry) -> schemas.KnowledgeBaseE
     file_url = None
     if entry.file_path:
         file_url = f"/knowledge-base/entries/{entry.id}/download"
-    return schemas.KnowledgeBaseEntryResponse(
+    return schemas.KnowledgeBaseEntryResponse.model_construct(
         id=entry.id,
         kb_id=entry.kb_id,
         type=entry.type,
@@ -75,7 +76,8 @@ def get_workspace_knowledge_base(workspace_id: UUID, user_id: UUID, db: Session
 
 @router.get(
     "/workspaces/{workspace_id}/entries",
-    response_model=list[schemas.KnowledgeBaseEntryResponse],
+    response_model=None,
+    responses={200: {"model": list[schemas.KnowledgeBaseEntryResponse]}},
 )
 def list_kb_entries(
     workspace_id: UUID,
@@ -91,25 +93,20 @@ def list_kb_entries(
     kb = ensure_workspace_kb(db, workspace_id)
     query = (
         db.query(models.KnowledgeBaseEntry)
-        .options(
-            joinedload(models.KnowledgeBaseEntry.documents),
-            joinedload(models.KnowledgeBaseEntry.creator),
-        )
+        .options(joinedload(models.KnowledgeBaseEntry.creator))
         .filter(models.KnowledgeBaseEntry.kb_id == kb.id)
         .order_by(models.KnowledgeBaseEntry.created_at.desc())
     )
     if entry_type:
         query = query.filter(models.KnowledgeBaseEntry.type == entry_type)
     if search:
-        like_value = f"%{search.lower()}%"
-        tag_string = sa.func.lower(
-            sa.func.coalesce(sa.func.array_to_string(models.KnowledgeBaseEntry.tags, " "), "")
-        )
+        like_value = contains_pattern(search)
+        tag_string = sa.func.coalesce(sa.func.array_to_string(models.KnowledgeBaseEntry.tags, " "), "")
         query = query.filter(
             sa.or_(
-                sa.func.lower(models.KnowledgeBaseEntry.title).like(like_value),
-                sa.func.lower(models.KnowledgeBaseEntry.content).like(like_value),
-                tag_string.like(like_value),
+                models.KnowledgeBaseEntry.title.ilike(like_value, escape="\\"),
+                models.KnowledgeBaseEntry.content.ilike(like_value, escape="\\"),
+                tag_string.ilike(like_value, escape="\\"),
             )
         )
     if tag:
@@ -117,7 +114,10 @@ def list_kb_entries(
     if project_id:
         query = query.filter(models.KnowledgeBaseEntry.project_id == project_id)
     entries = query.limit(limit).all()
-    return [_serialize_entry(entry) for entry in entries]
+    return Response(
+        content=schemas.dump_kb_entries([_serialize_entry(entry) for entry in entries]),
+        media_type="application/json",
+    )
 
 
 @router.post(
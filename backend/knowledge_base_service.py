@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import uuid
 from pathlib import Path
@@ -7,10 +8,10 @@ from uuid import UUID
 import logging
 
 import sqlalchemy as sa
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, defer, selectinload
 
 from backend import models
-from backend.knowledge.embeddings import generate_embedding
+from backend.knowledge.embeddings import generate_embedding, to_vector_literal, widen_ann_search
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,11 @@ KB_ENTRY_TYPES = {"document", "prd", "insight", "research", "repo", "ai_output",
 UPLOAD_ROOT = Path("backend/static/kb_uploads")
 EMBED_TEXT_LIMIT = 8000
 
+# Query embeddings depend only on the text, so retries and sibling requests reuse them
+# without any invalidation; the vector search itself still runs against live rows.
+_QUERY_VECTOR_CACHE: dict[tuple[UUID, bytes], str] = {}
+_QUERY_VECTOR_CACHE_SIZE = 2048
+
 
 def ensure_workspace_kb(db: Session, workspace_id: UUID) -> models.KnowledgeBase:
     kb = (
@@ -34,6 +40,12 @@ def ensure_workspace_kb(db: Session, workspace_id: UUID) -> models.KnowledgeBase
     return kb
 
 
+def contains_pattern(text: str) -> str:
+    """Wrap user text in an ILIKE substring pattern, escaping its wildcards (use ``escape="\\"``)."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 def build_entry_content(entry: models.KnowledgeBaseEntry, clip: int | None = None) -> str:
     base = entry.content or ""
     if entry.type in {"document", "repo"}:
@@ -50,19 +62,34 @@ def build_entry_content(entry: models.KnowledgeBaseEntry, clip: int | None = Non
     return base
 
 
-def _entry_text_source(entry: models.KnowledgeBaseEntry, text_override: str | None = None) -> str:
+def _entry_text_source(
+    entry: models.KnowledgeBaseEntry,
+    text_override: str | None = None,
+    limit: int = EMBED_TEXT_LIMIT,
+) -> str:
+    """Return at most ``limit`` characters of embeddable text for an entry."""
     text = (text_override or entry.content or "").strip()
     if text:
-        return text
+        return text[:limit]
     if entry.documents:
         chunks = sorted(
             entry.documents,
             key=lambda doc: int(doc.chunk_index) if str(doc.chunk_index).isdigit() else 0,
         )
-        doc_text = " ".join(doc.content for doc in chunks if doc.content)
+        # Only the string building is bounded here; entry.documents still loads every chunk row.
+        parts: list[str] = []
+        size = 0
+        for doc in chunks:
+            if not doc.content:
+                continue
+            parts.append(doc.content)
+            size += len(doc.content) + 1
+            if size > limit:
+                break
+        doc_text = " ".join(parts)
         if doc_text:
-            return doc_text
-    return entry.title or ""
+            return doc_text[:limit]
+    return (entry.title or "")[:limit]
 
 
 def get_kb_context_entries(db: Session, workspace_id: UUID, limit: int = 5) -> list[models.KnowledgeBaseEntry]:
@@ -70,6 +97,8 @@ def get_kb_context_entries(db: Session, workspace_id: UUID, limit: int = 5) -> l
     # Prioritize document/repo entries, then others by recency
     entries = (
         db.query(models.KnowledgeBaseEntry)
+        # build_entry_content reads documents for every entry; load them in one query.
+        .options(selectinload(models.KnowledgeBaseEntry.documents))
         .filter(models.KnowledgeBaseEntry.kb_id == kb.id)
         .order_by(models.KnowledgeBaseEntry.type.in_(["document", "repo"]).desc(), models.KnowledgeBaseEntry.created_at.desc())
         .limit(limit)
@@ -89,9 +118,8 @@ def update_entry_embedding(
     if not text:
         entry.embedding = None
         return
-    clipped = text[:EMBED_TEXT_LIMIT]
     try:
-        embedding = generate_embedding(clipped, db=db, workspace_id=workspace_id)
+        embedding = generate_embedding(text, db=db, workspace_id=workspace_id)
     except Exception as exc:  # pragma: no cover - relies on OpenAI
         logger.warning("Failed to generate embedding for KB entry %s: %s", entry.id, exc)
         return
@@ -99,6 +127,19 @@ def update_entry_embedding(
     db.add(entry)
 
 
+def query_vector_literal(db: Session, workspace_id: UUID, text: str) -> str:
+    """Embed a search query as a pgvector literal, reusing earlier embeddings of the same text per workspace."""
+    key = (workspace_id, hashlib.blake2b(text.encode(), digest_size=16).digest())
+    literal = _QUERY_VECTOR_CACHE.get(key)
+    if literal is None:
+        embedding = generate_embedding(text, db=db, workspace_id=workspace_id)
+        literal = to_vector_literal(embedding)
+        if len(_QUERY_VECTOR_CACHE) >= _QUERY_VECTOR_CACHE_SIZE:
+            _QUERY_VECTOR_CACHE.clear()
+        _QUERY_VECTOR_CACHE[key] = literal
+    return literal
+
+
 def get_relevant_entries(db: Session, workspace_id: UUID, query: str, top_n: int = 5) -> list[models.KnowledgeBaseEntry]:
     kb = ensure_workspace_kb(db, workspace_id)
     normalized_query = (query or "").strip()
@@ -106,33 +147,28 @@ def get_relevant_entries(db: Session, workspace_id: UUID, query: str, top_n: int
         return get_kb_context_entries(db, workspace_id, limit=top_n)
 
     try:
-        query_embedding = generate_embedding(normalized_query[:EMBED_TEXT_LIMIT], db=db, workspace_id=workspace_id)
+        vector_literal = query_vector_literal(db, workspace_id, normalized_query[:EMBED_TEXT_LIMIT])
     except Exception as exc:  # pragma: no cover - relies on OpenAI
         logger.warning("Falling back to recency context for workspace %s: %s", workspace_id, exc)
         return get_kb_context_entries(db, workspace_id, limit=top_n)
 
-    vector_literal = "[" + ",".join(f"{value:.10f}" for value in query_embedding) + "]"
-    rows = db.execute(
-        sa.text(
-            "SELECT id FROM kb_entries "
-            "WHERE kb_id = :kb_id AND embedding IS NOT NULL "
-            "ORDER BY embedding <-> (:embedding)::vector LIMIT :limit"
-        ),
-        {"kb_id": str(kb.id), "embedding": vector_literal, "limit": top_n},
-    ).fetchall()
-
-    if not rows:
-        return get_kb_context_entries(db, workspace_id, limit=top_n)
-
-    entry_ids = [row[0] for row in rows]
-    entries = (
+    widen_ann_search(db)
+    # Rank and load in one statement; snippet documents follow in one selectin query. Vectors stay unloaded.
+    ordered: list[models.KnowledgeBaseEntry] = (
         db.query(models.KnowledgeBaseEntry)
-        .options(joinedload(models.KnowledgeBaseEntry.documents))
-        .filter(models.KnowledgeBaseEntry.id.in_(entry_ids))
+        .options(
+            defer(models.KnowledgeBaseEntry.embedding),
+            selectinload(models.KnowledgeBaseEntry.documents).defer(models.Document.embedding),
+        )
+        .filter(models.KnowledgeBaseEntry.kb_id == kb.id, models.KnowledgeBaseEntry.embedding.isnot(None))
+        .order_by(sa.text("kb_entries.embedding <-> (:embedding)::vector"))
+        .params(embedding=vector_literal)
+        .limit(top_n)
         .all()
     )
-    entry_map = {entry.id: entry for entry in entries}
-    ordered: list[models.KnowledgeBaseEntry] = [entry_map[eid] for eid in entry_ids if eid in entry_map]
+
+    if not ordered:
+        return get_kb_context_entries(db, workspace_id, limit=top_n)
 
     if len(ordered) < top_n:
         seen = {entry.id for entry in ordered}
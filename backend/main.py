@@ -1,12 +1,14 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from uuid import UUID
-from .database import Base, engine, SessionLocal, get_db
+from .database import Base, engine, SessionLocal, get_db, warm_pool
 from backend.knowledge import search, comments, prototypes, links, prototype_agent
 from backend.knowledge import roadmap_ai
 from .database import Base, engine, SessionLocal
@@ -28,7 +30,14 @@ from backend.rbac import ensure_membership, ensure_project_access
 # Create tables if they don’t already exist
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Pre-open pooled connections so the first requests after a deploy are not cold.
+    await run_in_threadpool(warm_pool)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 static_dir = Path(__file__).resolve().parent / "static"
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
@@ -42,14 +51,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Dependency for DB session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # -----------------------------
 # Pydantic Schemas
 # -----------------------------
@@ -54,6 +54,9 @@ class Workspace(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Return onupdate/server values via RETURNING so handlers need no refresh SELECT after a write.
+    __mapper_args__ = {"eager_defaults": True}
+
     members = relationship("WorkspaceMember", back_populates="workspace", cascade="all, delete-orphan")
     projects = relationship("Project", back_populates="workspace", cascade="all, delete-orphan")
     knowledge_base = relationship("KnowledgeBase", back_populates="workspace", cascade="all, delete-orphan", uselist=False)
@@ -676,13 +679,30 @@ class WorkspaceAIChat(Base):
     workspace_id = Column(UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     title = Column(String, nullable=True)
-    messages = Column(JSONB, nullable=False, default=list)
     context_entries = Column(JSONB, nullable=True)
     last_message_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     workspace = relationship("Workspace", back_populates="ai_chats")
     user = relationship("User")
+    messages = relationship(
+        "WorkspaceAIChatMessage",
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        order_by="WorkspaceAIChatMessage.created_at",
+    )
+
+
+class WorkspaceAIChatMessage(Base):
+    __tablename__ = "workspace_ai_chat_messages"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    chat_id = Column(UUID(as_uuid=True), ForeignKey("workspace_ai_chats.id", ondelete="CASCADE"), nullable=False)
+    role = Column(String, nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    chat = relationship("WorkspaceAIChat", back_populates="messages")
 
 
 class StrategicPillar(Base):
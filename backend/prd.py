@@ -10,6 +10,7 @@ from .workspaces import get_project_in_workspace
 from backend.rbac import ensure_project_access
 from backend.knowledge_base_service import ensure_workspace_kb, get_relevant_entries
 from backend.ai_providers import get_openai_client
+from backend.dashboard_service import invalidate_dashboard_metrics
 from backend.template_service import get_template_version
 from backend.ai_guardrails import DECLINE_PHRASE, bundle_context_entries, render_context_block, verify_citations
 from backend.prd_service import (
@@ -231,11 +232,10 @@ User instructions: {prd_data.prompt}
     _record_prd_entry(db, project.workspace_id, new_prd, user_id)
     refresh_prd_embeddings(db, new_prd)
     db.commit()
+    invalidate_dashboard_metrics(project.workspace_id)
 
-    response = schemas.PRDResponse.model_validate(new_prd)
-    response.context_entries = context_items
-    response.verification = verification
-    return response
+    response = schemas.fast_from_orm(schemas.PRDResponse, new_prd)
+    return response.model_copy(update={"context_entries": context_items, "verification": verification})
 
 
 # ---------------------------------------------------------
@@ -343,10 +343,9 @@ def refine_prd(
     _record_prd_entry(db, project.workspace_id, refined_prd, user_id)
     refresh_prd_embeddings(db, refined_prd)
     db.commit()
-    response = schemas.PRDResponse.model_validate(refined_prd)
-    response.context_entries = context_items
-    response.verification = verification
-    return response
+    invalidate_dashboard_metrics(project.workspace_id)
+    response = schemas.fast_from_orm(schemas.PRDResponse, refined_prd)
+    return response.model_copy(update={"context_entries": context_items, "verification": verification})
 
 
 @router.post("/{project_id}/prds/{prd_id}/save", response_model=schemas.PRDResponse)
@@ -394,25 +393,35 @@ def save_prd_version(
     _record_prd_entry(db, project.workspace_id, new_prd, user_id)
     refresh_prd_embeddings(db, new_prd)
     db.commit()
-    return schemas.PRDResponse.model_validate(new_prd)
+    invalidate_dashboard_metrics(project.workspace_id)
+    return schemas.fast_from_orm(schemas.PRDResponse, new_prd)
 
 
 # -----------------------------
 # List all PRDs for a project
 # -----------------------------
-@router.get("/{project_id}/prds", response_model=list[schemas.PRDResponse])
+@router.get(
+    "/{project_id}/prds",
+    response_model=None,
+    responses={200: {"model": list[schemas.PRDResponse]}},
+)
 def list_prds(project_id: str, workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
     ensure_project_access(db, workspace_id, UUID(project_id), user_id, required_role="viewer")
     project = get_project_in_workspace(db, project_id, workspace_id)
-    return (
+    prds = (
         db.query(models.PRD)
         .filter(models.PRD.project_id == project_id, models.PRD.workspace_id == project.workspace_id)
         .order_by(models.PRD.version.desc())
         .all()
     )
+    return Response(content=schemas.dump_prds(prds), media_type="application/json")
 
 
-@router.get("/{project_id}/prds/history", response_model=list[schemas.PRDVersionSummary])
+@router.get(
+    "/{project_id}/prds/history",
+    response_model=None,
+    responses={200: {"model": list[schemas.PRDVersionSummary]}},
+)
 def get_prd_history(project_id: str, workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
     ensure_project_access(db, workspace_id, UUID(project_id), user_id, required_role="viewer")
     project = get_project_in_workspace(db, project_id, workspace_id)
@@ -443,7 +452,7 @@ def get_prd_history(project_id: str, workspace_id: UUID, user_id: UUID, db: Sess
                 decision_count=int(decision_count or 0),
             )
         )
-    return history
+    return Response(content=schemas.dump_prd_history(history), media_type="application/json")
 
 
 # -----------------------------
@@ -460,7 +469,7 @@ def get_prd(project_id: str, prd_id: UUID, workspace_id: UUID, user_id: UUID, db
     )
     if not prd:
         raise HTTPException(status_code=404, detail="PRD not found")
-    return prd
+    return schemas.fast_from_orm(schemas.PRDResponse, prd)
 
 
 @router.get("/{project_id}/prds/compare", response_model=schemas.PRDDiffResponse)
@@ -712,6 +721,7 @@ def delete_prd(project_id: str, prd_id: UUID, workspace_id: UUID, user_id: UUID,
             replacement.is_active = True
 
     db.commit()
+    invalidate_dashboard_metrics(project.workspace_id)
 
     return Response(status_code=204)
 
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from typing import Iterable
+import logging
+from typing import Iterable, Sequence
 from uuid import UUID
 import uuid as uuid_pkg
 
 import sqlalchemy as sa
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
 from backend import models, schemas
-from backend.knowledge.embeddings import generate_embedding
-from backend.knowledge_base_service import EMBED_TEXT_LIMIT
+from backend.knowledge.embeddings import generate_embedding, generate_embeddings, widen_ann_search
+from backend.knowledge_base_service import EMBED_TEXT_LIMIT, query_vector_literal
+
+logger = logging.getLogger(__name__)
 
 PRD_EMBED_CHUNK_SIZE = 1200
 
@@ -53,15 +56,9 @@ def refresh_prd_embeddings(db: Session, prd: models.PRD) -> None:
     if not prd.workspace_id:
         return
     db.query(models.PRDEmbedding).filter(models.PRDEmbedding.prd_id == prd.id).delete()
-    chunks = _chunk_markdown(prd.content)
-    for index, chunk in enumerate(chunks):
-        _store_embedding(
-            db,
-            prd=prd,
-            chunk=chunk,
-            chunk_index=index,
-            chunk_type="body",
-        )
+    pending: list[tuple[str, int, str, UUID | None]] = [
+        (chunk, index, "body", None) for index, chunk in enumerate(_chunk_markdown(prd.content))
+    ]
     notes = (
         db.query(models.PRDDecisionNote)
         .filter(models.PRDDecisionNote.prd_id == prd.id)
@@ -69,14 +66,60 @@ def refresh_prd_embeddings(db: Session, prd: models.PRD) -> None:
     )
     for note in notes:
         payload = f"Decision (v{note.version}): {note.decision}\nRationale: {note.rationale or 'Not provided'}"
-        _store_embedding(
-            db,
-            prd=prd,
-            chunk=payload,
-            chunk_index=0,
-            chunk_type="decision",
-            decision_note_id=note.id,
+        pending.append((payload, 0, "decision", note.id))
+    if not pending:
+        return
+    try:
+        embeddings = generate_embeddings(
+            [chunk[:EMBED_TEXT_LIMIT] for chunk, *_ in pending],
+            db=db,
+            workspace_id=prd.workspace_id,
+        )
+    except Exception:
+        logger.warning("Batched embedding failed for PRD %s; embedding chunks one by one", prd.id, exc_info=True)
+        for chunk, chunk_index, chunk_type, decision_note_id in pending:
+            _store_embedding(
+                db,
+                prd=prd,
+                chunk=chunk,
+                chunk_index=chunk_index,
+                chunk_type=chunk_type,
+                decision_note_id=decision_note_id,
+            )
+        return
+    db.add_all(
+        _embedding_record(
+            prd,
+            chunk=chunk,
+            chunk_index=chunk_index,
+            chunk_type=chunk_type,
+            decision_note_id=decision_note_id,
+            embedding=embedding,
         )
+        for (chunk, chunk_index, chunk_type, decision_note_id), embedding in zip(pending, embeddings)
+    )
+
+
+def _embedding_record(
+    prd: models.PRD,
+    *,
+    chunk: str,
+    chunk_index: int,
+    chunk_type: str,
+    decision_note_id: UUID | None,
+    embedding: Sequence[float],
+) -> models.PRDEmbedding:
+    return models.PRDEmbedding(
+        prd_id=prd.id,
+        project_id=prd.project_id,
+        workspace_id=prd.workspace_id,
+        version=prd.version,
+        chunk_index=chunk_index,
+        chunk_type=chunk_type,
+        chunk=chunk,
+        decision_note_id=decision_note_id,
+        embedding=embedding,
+    )
 
 
 def _store_embedding(
@@ -91,15 +134,13 @@ def _store_embedding(
     try:
         embedding = generate_embedding(chunk[:EMBED_TEXT_LIMIT], db=db, workspace_id=prd.workspace_id)
     except Exception:
+        logger.warning("Failed to embed %s chunk %s of PRD %s", chunk_type, chunk_index, prd.id, exc_info=True)
         return
-    record = models.PRDEmbedding(
-        prd_id=prd.id,
-        project_id=prd.project_id,
-        workspace_id=prd.workspace_id,
-        version=prd.version,
+    record = _embedding_record(
+        prd,
+        chunk=chunk,
         chunk_index=chunk_index,
         chunk_type=chunk_type,
-        chunk=chunk,
         decision_note_id=decision_note_id,
         embedding=embedding,
     )
@@ -134,36 +175,28 @@ def search_prd_embeddings(
     if not normalized:
         return []
     try:
-        query_embedding = generate_embedding(normalized[:EMBED_TEXT_LIMIT], db=db, workspace_id=workspace_id)
+        vector_literal = query_vector_literal(db, workspace_id, normalized[:EMBED_TEXT_LIMIT])
     except Exception:
         return []
     fetch_limit = max(limit * 3, limit + 2) if versions else limit
-    vector_literal = "[" + ",".join(f"{value:.10f}" for value in query_embedding) + "]"
-    base_sql = (
-        "SELECT id FROM prd_embeddings "
-        "WHERE workspace_id = :workspace_id "
-        "AND embedding IS NOT NULL "
+    records_query = (
+        db.query(models.PRDEmbedding)
+        .options(defer(models.PRDEmbedding.embedding))
+        .filter(
+            models.PRDEmbedding.workspace_id == workspace_id,
+            models.PRDEmbedding.embedding.isnot(None),
+        )
     )
-    params: dict[str, str | int] = {
-        "workspace_id": str(workspace_id),
-        "embedding": vector_literal,
-        "limit": fetch_limit,
-    }
     if project_id:
-        base_sql += "AND project_id = :project_id "
-        params["project_id"] = str(project_id)
-    base_sql += "ORDER BY embedding <-> (:embedding)::vector LIMIT :limit"
-    rows = db.execute(sa.text(base_sql), params).fetchall()
-    if not rows:
-        return []
-    ids = [str(row[0]) for row in rows]
-    records = (
-        db.query(models.PRDEmbedding)
-        .filter(models.PRDEmbedding.id.in_(ids))
+        records_query = records_query.filter(models.PRDEmbedding.project_id == project_id)
+    widen_ann_search(db)
+    # Nearest chunks by L2 distance; the embedding column itself stays deferred.
+    ordered: list[models.PRDEmbedding] = (
+        records_query.order_by(sa.text("prd_embeddings.embedding <-> (:embedding)::vector"))
+        .params(embedding=vector_literal)
+        .limit(fetch_limit)
         .all()
     )
-    record_map = {str(rec.id): rec for rec in records}
-    ordered: list[models.PRDEmbedding] = [record_map[rec_id] for rec_id in ids if rec_id in record_map]
     if versions:
         version_set = {int(v) for v in versions}
         filtered = [rec for rec in ordered if rec.version in version_set]
@@ -22,16 +22,18 @@ PROJECT_ROLE_ORDER: dict[ProjectRole, int] = {"viewer": 1, "contributor": 2, "ow
 
 
 
+# Every stored spelling we recognise, mapped once to its canonical role.
+_NORMALIZED_ROLES: dict[str, WorkspaceRole] = {**{role: role for role in ROLE_ORDER}, **ROLE_ALIASES}
+
+
 def normalize_role(role: str | None) -> WorkspaceRole:
+    # Stored roles are almost always already lowercase, so try them as-is first.
+    normalized = _NORMALIZED_ROLES.get(role)  # type: ignore[arg-type]
+    if normalized is not None:
+        return normalized
     if not role:
         return "viewer"
-    lowered = role.lower()
-    if lowered in ROLE_ORDER:
-        return lowered  # type: ignore[return-value]
-    alias = ROLE_ALIASES.get(lowered)
-    if alias:
-        return alias
-    return "viewer"
+    return _NORMALIZED_ROLES.get(role.lower(), "viewer")
 
 
 def validate_role_input(role: str | None) -> WorkspaceRole:
@@ -92,14 +94,44 @@ def ensure_membership(
     *,
     required_role: WorkspaceRole = "viewer",
 ) -> WorkspacePermission:
-    membership = (
-        db.query(models.WorkspaceMember)
-        .filter(
-            models.WorkspaceMember.workspace_id == workspace_id,
-            models.WorkspaceMember.user_id == user_id,
+    membership = _load_membership(db, workspace_id, user_id)
+    return check_membership(membership, required_role=required_role)
+
+
+# Session.info key for memberships already resolved in this session (one session per request).
+_MEMBERSHIP_CACHE_KEY = "workspace_memberships"
+
+
+def _load_membership(db: Session, workspace_id: UUID, user_id: UUID) -> models.WorkspaceMember | None:
+    cache = db.info.setdefault(_MEMBERSHIP_CACHE_KEY, {})
+    key = (str(workspace_id), str(user_id))
+    membership = cache.get(key)
+    if membership is None:
+        membership = (
+            db.query(models.WorkspaceMember)
+            .filter(
+                models.WorkspaceMember.workspace_id == workspace_id,
+                models.WorkspaceMember.user_id == user_id,
+            )
+            .first()
         )
-        .first()
-    )
+        # Misses are not cached so a membership created later in the session is still found.
+        if membership is not None:
+            cache[key] = membership
+    return membership
+
+
+def forget_membership(db: Session, workspace_id: UUID, user_id: UUID) -> None:
+    """Drop a cached membership after deleting it outside the ORM unit of work."""
+    db.info.get(_MEMBERSHIP_CACHE_KEY, {}).pop((str(workspace_id), str(user_id)), None)
+
+
+def check_membership(
+    membership: models.WorkspaceMember | None,
+    *,
+    required_role: WorkspaceRole = "viewer",
+) -> WorkspacePermission:
+    """Authorize a membership row that the caller loaded alongside other data."""
     if not membership:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -117,14 +149,7 @@ def ensure_membership(
 
 
 def get_membership_role(db: Session, workspace_id: UUID, user_id: UUID) -> WorkspaceRole | None:
-    membership = (
-        db.query(models.WorkspaceMember)
-        .filter(
-            models.WorkspaceMember.workspace_id == workspace_id,
-            models.WorkspaceMember.user_id == user_id,
-        )
-        .first()
-    )
+    membership = _load_membership(db, workspace_id, user_id)
     if not membership:
         return None
     return normalize_role(membership.role)
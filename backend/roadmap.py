@@ -10,6 +10,7 @@ from .models import Project, Roadmap
 from .workspaces import get_project_in_workspace
 from backend.rbac import ensure_project_access
 from backend.ai_providers import get_openai_client
+from backend.dashboard_service import invalidate_dashboard_metrics
 
 router = APIRouter()
 
@@ -70,6 +71,7 @@ def generate_roadmap(id: str, workspace_id: UUID, user_id: UUID, db: Session = D
     roadmap = Roadmap(project_id=id, workspace_id=project.workspace_id, content=roadmap_json, is_active=True)
     db.add(roadmap)
     db.commit()
+    invalidate_dashboard_metrics(project.workspace_id)
     db.refresh(roadmap)
 
     return roadmap
@@ -66,7 +66,7 @@ def _process_chat_turn(
 
     request_payload = schemas.RoadmapGenerateRequest(
         prompt=prompt,
-        conversation_history=existing_history,
+        conversation_history=[message.model_dump() for message in existing_history],
         user_id=payload.user_id,
         workspace_id=payload.workspace_id,
         template_id=payload.template_id,
@@ -88,7 +88,7 @@ def _process_chat_turn(
 
     record = _serialize_chat(chat)
     return schemas.RoadmapChatResponse(
-        **record.model_dump(),
+        **dict(record),
         assistant_message=response.message,
         roadmap=response.roadmap,
         context_entries=response.context_entries,
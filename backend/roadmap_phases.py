@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic_core import to_json
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 
@@ -117,12 +119,17 @@ def _phase_query(db: Session, project: models.Project):
     )
 
 
-@router.get("/phases", response_model=list[schemas.RoadmapPhaseResponse])
+@router.get(
+    "/phases",
+    response_model=None,
+    responses={200: {"model": list[schemas.RoadmapPhaseResponse]}},
+)
 def list_roadmap_phases(project_id: str, workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
     ensure_project_access(db, workspace_id, UUID(project_id), user_id, required_role="viewer")
     project = _phase_scope(db, project_id, workspace_id)
     phases = _phase_query(db, project).all()
-    return [_phase_to_schema(phase) for phase in phases]
+    body = schemas.dump_roadmap_phases([_phase_to_schema(phase) for phase in phases])
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/phases", response_model=schemas.RoadmapPhaseResponse)
@@ -382,12 +389,10 @@ def link_milestone_task(
     return _milestone_to_schema(milestone)
 
 
-@router.get("/progress", response_model=schemas.RoadmapProgressResponse)
-def roadmap_progress(project_id: str, workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
-    ensure_project_access(db, workspace_id, UUID(project_id), user_id, required_role="viewer")
-    project = _phase_scope(db, project_id, workspace_id)
-    phases = _phase_query(db, project).all()
-    phase_payloads: list[schemas.RoadmapProgressPhase] = []
+def _roadmap_progress(project_id: str, phases: list[models.RoadmapPhase]) -> dict[str, Any]:
+    # Egress-only payload in the RoadmapProgressResponse shape; built as plain dicts so the
+    # nested phase/milestone tree is not validated object by object before encoding.
+    phase_payloads: list[dict[str, Any]] = []
     total_tasks = 0
     done_tasks = 0
     for phase in phases:
@@ -399,35 +404,47 @@ def roadmap_progress(project_id: str, workspace_id: UUID, user_id: UUID, db: Ses
             phase_total += milestone_total
             phase_done += milestone_done
             milestones.append(
-                schemas.RoadmapProgressMilestone(
-                    id=milestone.id,
-                    title=milestone.title,
-                    progress_percent=percent,
-                    total_tasks=milestone_total,
-                    completed_tasks=milestone_done,
-                )
+                {
+                    "id": milestone.id,
+                    "title": milestone.title,
+                    "progress_percent": percent,
+                    "total_tasks": milestone_total,
+                    "completed_tasks": milestone_done,
+                }
             )
         total_tasks += phase_total
         done_tasks += phase_done
         progress = round((phase_done / phase_total) * 100, 1) if phase_total else 0.0
         phase_payloads.append(
-            schemas.RoadmapProgressPhase(
-                phase_id=phase.id,
-                title=phase.title,
-                progress_percent=progress,
-                total_tasks=phase_total,
-                completed_tasks=phase_done,
-                milestones=milestones,
-            )
+            {
+                "phase_id": phase.id,
+                "title": phase.title,
+                "progress_percent": progress,
+                "total_tasks": phase_total,
+                "completed_tasks": phase_done,
+                "milestones": milestones,
+            }
         )
     overall = round((done_tasks / total_tasks) * 100, 1) if total_tasks else 0.0
-    return schemas.RoadmapProgressResponse(
-        project_id=UUID(project_id),
-        phases=phase_payloads,
-        overall_progress=overall,
-        total_tasks=total_tasks,
-        completed_tasks=done_tasks,
-    )
+    return {
+        "project_id": UUID(project_id),
+        "phases": phase_payloads,
+        "overall_progress": overall,
+        "total_tasks": total_tasks,
+        "completed_tasks": done_tasks,
+    }
+
+
+@router.get(
+    "/progress",
+    response_model=None,
+    responses={200: {"model": schemas.RoadmapProgressResponse}},
+)
+def roadmap_progress(project_id: str, workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
+    ensure_project_access(db, workspace_id, UUID(project_id), user_id, required_role="viewer")
+    project = _phase_scope(db, project_id, workspace_id)
+    phases = _phase_query(db, project).all()
+    return Response(content=to_json(_roadmap_progress(project_id, phases)), media_type="application/json")
 
 
 def _phase_context(phase: models.RoadmapPhase) -> str:
@@ -615,8 +632,8 @@ def apply_ai_updates(
 def execution_insights(project_id: str, workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
     ensure_project_access(db, workspace_id, UUID(project_id), user_id, required_role="viewer")
     project = _phase_scope(db, project_id, workspace_id)
-    progress = roadmap_progress(project_id, workspace_id, user_id, db)
     phases = _phase_query(db, project).all()
+    progress = _roadmap_progress(project_id, phases)
     blockers: list[str] = []
     tasks_query = (
         db.query(models.Task)
@@ -629,7 +646,7 @@ def execution_insights(project_id: str, workspace_id: UUID, user_id: UUID, db: S
         if task.status != "done" and task.due_date and task.due_date < now:
             blockers.append(f"{task.title} overdue ({task.due_date.date()})")
     summary_text = (
-        f"Overall progress {progress.overall_progress}%. Blockers: {', '.join(blockers) if blockers else 'None'}."
+        f"Overall progress {progress['overall_progress']}%. Blockers: {', '.join(blockers) if blockers else 'None'}."
     )
     try:
         client = get_openai_client(db, workspace_id)
@@ -651,8 +668,8 @@ def execution_insights(project_id: str, workspace_id: UUID, user_id: UUID, db: S
     suggestions = roadmap_reprioritize(project_id, workspace_id, user_id, db)
     return schemas.RoadmapExecutionInsights(
         project_id=UUID(project_id),
-        overall_progress=progress.overall_progress,
-        phase_summaries=progress.phases,
+        overall_progress=progress["overall_progress"],
+        phase_summaries=progress["phases"],
         blockers=blockers,
         velocity_last_7_days=velocity_last_7,
         ai_summary=ai_summary,
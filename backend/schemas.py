@@ -1,17 +1,77 @@
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, Literal, Any
+"""Pydantic request/response schemas.
+
+Trust boundary: request models (``*Create``, ``*Update``, ``*Request``, auth payloads)
+always run full validation because they carry client input. Response models built
+from SQLAlchemy rows may use ``fast_from_orm``, which skips validation via
+``model_construct``; only use it when the row's column types already match the
+schema (UUID columns are ``UUID``, timestamps are ``datetime``).
+
+A request model that FastAPI has already parsed is validated; pass the instance
+(or ``model_copy(update=...)``) to services instead of rebuilding it from
+``model_dump()``. To extend one model into another, unpack ``dict(instance)``
+so nested models are reused as-is rather than dumped and validated again.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, StringConstraints, TypeAdapter, create_model, field_validator, with_config
+from dataclasses import dataclass
+from functools import cache
+from typing import Annotated, Optional, Literal, Any, TypeVar, get_args
+from typing_extensions import TypedDict
 from datetime import datetime
 from uuid import UUID
 
+# Cheap shape check for emails we only echo back or match against stored users.
+# Sign-up (AuthCreate) and invitations keep EmailStr for full RFC validation.
+Email = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)]
+
 WorkspaceRoleLiteral = Literal["admin", "editor", "viewer"]
 ProjectRoleLiteral = Literal["owner", "contributor", "viewer"]
 TaskStatusLiteral = Literal["todo", "in_progress", "done"]
+ChatRole = Literal["user", "assistant"]
+AIProvider = Literal["openai"]
+VerificationStatusLiteral = Literal["passed", "failed", "skipped", "declined"]
+
+# Rarely-hit models build their core schema on first use rather than at import.
+_LAZY_CONFIG = ConfigDict(defer_build=True)
+# Shared configs for models read straight off SQLAlchemy rows.
+_ORM_CONFIG = ConfigDict(from_attributes=True)
+_FROZEN_ORM_CONFIG = ConfigDict(from_attributes=True, frozen=True)
+_LAZY_ORM_CONFIG = ConfigDict(from_attributes=True, defer_build=True)
+
+
+def make_partial(base: type[BaseModel], name: str, config: ConfigDict | None = None) -> type[BaseModel]:
+    """Build a PATCH-style model from ``base``: same fields, all optional, defaulting to None."""
+    fields = {key: (info.annotation | None, None) for key, info in base.model_fields.items()}
+    return create_model(name, __config__=config, __module__=__name__, **fields)
+
 
 class VerificationDetails(BaseModel):
-    status: Literal["passed", "failed", "skipped", "declined"]
+    status: VerificationStatusLiteral
     message: str
 
 
+# Defined ahead of the response models that embed it so their schemas resolve at import.
+KnowledgeBaseEntryType = Literal[
+    "document",
+    "prd",
+    "insight",
+    "research",
+    "repo",
+    "ai_output",
+    "roadmap",
+    "prototype",
+]
+
+
+class KnowledgeBaseContextItem(BaseModel):
+    id: UUID
+    title: str
+    type: KnowledgeBaseEntryType
+    snippet: str
+    marker: str | None = None
+
+    model_config = ConfigDict(frozen=True)
+
 
 # ---------------------------------------------------------
 # PRD Schemas
@@ -22,9 +82,6 @@ class PRDCreate(BaseModel):
     prompt: str           # Optional user prompt
     template_id: UUID | None = None
 
-    class Config:
-        extra = "ignore"  # Ignore extra/missing fields so `{}` works
-
 
 class PRDRefine(BaseModel):
     instructions: str  # user feedback for refinement
@@ -43,11 +100,10 @@ class PRDResponse(BaseModel):
     updated_at: datetime
     workspace_id: UUID | None = None
     created_by: UUID | None = None
-    context_entries: list["KnowledgeBaseContextItem"] | None = None
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
     verification: VerificationDetails | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = _FROZEN_ORM_CONFIG
 
 
 class PRDSaveRequest(BaseModel):
@@ -111,7 +167,7 @@ class PRDQARequest(BaseModel):
 
 class PRDQAResponse(BaseModel):
     answer: str
-    context_entries: list["KnowledgeBaseContextItem"] = Field(default_factory=list)
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
     used_versions: list[int] = Field(default_factory=list)
     verification: VerificationDetails | None = None
 
@@ -130,8 +186,7 @@ class DocumentResponse(BaseModel):
     has_embedding: bool
     workspace_id: UUID | None = None
 
-    class Config:
-        orm_mode = True
+    model_config = _ORM_CONFIG
 
 
 # ---------------------------------------------------------
@@ -139,28 +194,57 @@ class DocumentResponse(BaseModel):
 # ---------------------------------------------------------
 
 class RoadmapChatMessage(BaseModel):
-    role: Literal["user", "assistant"]
+    role: ChatRole
     content: str
 
 
+ROADMAP_HISTORY_LIMIT = 200
+_ROADMAP_HISTORY_KEYS = frozenset({"role", "content"})
+_ROADMAP_HISTORY_ROLES = frozenset(get_args(ChatRole))
+
+
+def _validate_roadmap_history(history: list[dict[str, str]] | None) -> list[dict[str, str]] | None:
+    # History is forwarded verbatim to the LLM, so keep plain dicts and check them in one pass.
+    if not history:
+        return history
+    if len(history) > ROADMAP_HISTORY_LIMIT:
+        raise ValueError(f"conversation_history cannot exceed {ROADMAP_HISTORY_LIMIT} messages")
+    for message in history:
+        if message.keys() != _ROADMAP_HISTORY_KEYS:
+            raise ValueError("conversation_history messages must only contain 'role' and 'content'")
+        if message["role"] not in _ROADMAP_HISTORY_ROLES:
+            raise ValueError("conversation_history role must be 'user' or 'assistant'")
+    return history
+
+
 class RoadmapGenerateRequest(BaseModel):
     prompt: str
-    conversation_history: list[RoadmapChatMessage] = Field(default_factory=list)
+    conversation_history: list[dict[str, str]] | None = None
     user_id: UUID | None = None
     workspace_id: UUID
     template_id: UUID | None = None
 
+    @field_validator("conversation_history")
+    @classmethod
+    def validate_conversation_history(cls, value: list[dict[str, str]] | None) -> list[dict[str, str]] | None:
+        return _validate_roadmap_history(value)
+
 
 class RoadmapGenerateResponse(BaseModel):
     message: str
-    conversation_history: list[RoadmapChatMessage]
+    conversation_history: list[dict[str, str]]
     roadmap: str | None = None
     action: str
-    suggestions: list[str] | None = None
-    context_entries: list["KnowledgeBaseContextItem"] | None = None
+    suggestions: list[str] = Field(default_factory=list)
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
     kb_entry_id: UUID | None = None
     verification: VerificationDetails | None = None
 
+    @field_validator("conversation_history")
+    @classmethod
+    def validate_conversation_history(cls, value: list[dict[str, str]] | None) -> list[dict[str, str]] | None:
+        return _validate_roadmap_history(value)
+
 
 class RoadmapChatTurnRequest(BaseModel):
     workspace_id: UUID
@@ -184,9 +268,9 @@ class RoadmapChatRecord(BaseModel):
 class RoadmapChatResponse(RoadmapChatRecord):
     assistant_message: str
     roadmap: str | None = None
-    context_entries: list["KnowledgeBaseContextItem"] | None = None
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
     action: str
-    suggestions: list[str] | None = None
+    suggestions: list[str] = Field(default_factory=list)
     kb_entry_id: UUID | None = None
     verification: VerificationDetails | None = None
 
@@ -200,13 +284,7 @@ class RoadmapPhaseCreate(BaseModel):
     status: str | None = None
 
 
-class RoadmapPhaseUpdate(BaseModel):
-    title: str | None = None
-    description: str | None = None
-    order_index: int | None = None
-    start_date: datetime | None = None
-    due_date: datetime | None = None
-    status: str | None = None
+RoadmapPhaseUpdate = make_partial(RoadmapPhaseCreate, "RoadmapPhaseUpdate")
 
 
 class RoadmapMilestoneCreate(BaseModel):
@@ -226,7 +304,10 @@ class RoadmapMilestoneUpdate(BaseModel):
     ai_summary: str | None = None
 
 
-class RoadmapLinkedTask(BaseModel):
+# Leaf records built from trusted rows in bulk: slotted dataclasses rather than models.
+# Parents still validate dict input into them and pass instances through untouched.
+@dataclass(slots=True, frozen=True)
+class RoadmapLinkedTask:
     id: UUID
     title: str
     status: TaskStatusLiteral
@@ -333,34 +414,53 @@ class RoadmapExecutionInsights(BaseModel):
     suggestions: list[RoadmapReprioritizeSuggestion] = Field(default_factory=list)
 
 
+# Unknown token groups are kept as-is; only the keys a client sent are echoed back.
+@with_config(ConfigDict(extra="allow"))
+class DesignTokens(TypedDict, total=False):
+    colors: dict[str, str]
+    typography: dict[str, str]
+    radii: str
+    spacing: list[int | float]
+
+
 class BuilderChatMessage(BaseModel):
-    role: Literal["user", "assistant"]
+    role: ChatRole
     content: str
 
+    model_config = _LAZY_CONFIG
+
 
 class BuilderChatRequest(BaseModel):
     workspace_id: UUID
     user_id: UUID
     project_id: UUID | None = None
     prompt: str
-    history: list[BuilderChatMessage] = Field(default_factory=list)
+    history: list[BuilderChatMessage] | None = None
+
+    model_config = _LAZY_CONFIG
 
 
 class BuilderChatResponse(BaseModel):
     message: str
     code: str
-    design_tokens: dict[str, Any]
-    context_entries: list["KnowledgeBaseContextItem"] | None = None
-    suggestions: list[str] | None = None
+    design_tokens: DesignTokens
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
+    suggestions: list[str] = Field(default_factory=list)
+
+    model_config = _LAZY_CONFIG
 
 
 class BuilderPreviewRequest(BaseModel):
     code: str
 
+    model_config = _LAZY_CONFIG
+
 
 class BuilderPreviewResponse(BaseModel):
     preview_html: str
 
+    model_config = _LAZY_CONFIG
+
 
 class BuilderSaveRequest(BaseModel):
     workspace_id: UUID
@@ -370,7 +470,9 @@ class BuilderSaveRequest(BaseModel):
     prompt: str
     code: str
     preview_html: str | None = None
-    design_tokens: dict[str, Any] | None = None
+    design_tokens: DesignTokens | None = None
+
+    model_config = _LAZY_CONFIG
 
 
 class BuilderPrototypeResponse(BaseModel):
@@ -381,10 +483,12 @@ class BuilderPrototypeResponse(BaseModel):
     prompt: str
     code: str
     preview_html: str | None = None
-    design_tokens: dict[str, Any] | None = None
+    design_tokens: DesignTokens | None = None
     created_by: UUID | None = None
     created_at: datetime
 
+    model_config = _LAZY_CONFIG
+
 
 TaskPriorityLiteral = Literal["low", "medium", "high", "critical"]
 
@@ -407,18 +511,7 @@ class TaskCreate(TaskBase):
     pass
 
 
-class TaskUpdate(BaseModel):
-    project_id: UUID | None = None
-    epic_id: UUID | None = None
-    title: str | None = None
-    description: str | None = None
-    status: TaskStatusLiteral | None = None
-    priority: TaskPriorityLiteral | None = None
-    assignee_id: UUID | None = None
-    due_date: datetime | None = None
-    roadmap_id: UUID | None = None
-    kb_entry_id: UUID | None = None
-    prd_id: UUID | None = None
+TaskUpdate = make_partial(TaskBase, "TaskUpdate")
 
 
 class TaskResponse(TaskBase):
@@ -429,8 +522,7 @@ class TaskResponse(TaskBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = _FROZEN_ORM_CONFIG
 
 
 class TaskCommentCreate(BaseModel):
@@ -444,8 +536,7 @@ class TaskCommentResponse(BaseModel):
     content: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 class TaskGenerationItem(BaseModel):
@@ -465,9 +556,25 @@ class TaskGenerationRequest(BaseModel):
     instructions: str | None = None
 
 
+class TaskGenerationSource(BaseModel):
+    project_id: UUID
+    prd_id: UUID | None = None
+    roadmap_id: UUID | None = None
+    instructions: str | None = None
+
+
+TASK_GENERATION_BATCH_LIMIT = 10
+
+
+class TaskGenerationBatchRequest(BaseModel):
+    workspace_id: UUID
+    user_id: UUID
+    sources: list[TaskGenerationSource] = Field(min_length=1, max_length=TASK_GENERATION_BATCH_LIMIT)
+
+
 class TaskGenerationResponse(BaseModel):
     tasks: list[TaskGenerationItem]
-    context_entries: list["KnowledgeBaseContextItem"] | None = None
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
 
 
 TemplateVisibilityLiteral = Literal["private", "shared", "system"]
@@ -484,8 +591,7 @@ class TemplateVersionResponse(BaseModel):
     created_by: UUID | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = _LAZY_ORM_CONFIG
 
 
 class TemplateResponse(BaseModel):
@@ -505,8 +611,7 @@ class TemplateResponse(BaseModel):
     updated_at: datetime
     latest_version: TemplateVersionResponse
 
-    class Config:
-        from_attributes = True
+    model_config = _LAZY_ORM_CONFIG
 
 
 class TemplateDetailResponse(TemplateResponse):
@@ -523,27 +628,25 @@ class TemplateCreate(BaseModel):
     content_format: TemplateFormatLiteral = "markdown"
     metadata: dict[str, Any] | None = None
 
+    model_config = _LAZY_CONFIG
 
-class TemplateUpdate(BaseModel):
-    title: str | None = None
-    description: str | None = None
-    category: str | None = None
-    visibility: TemplateVisibilityLiteral | None = None
-    tags: list[str] | None = None
-    content: str | None = None
-    content_format: TemplateFormatLiteral | None = None
-    metadata: dict[str, Any] | None = None
+
+TemplateUpdate = make_partial(TemplateCreate, "TemplateUpdate", _LAZY_CONFIG)
 
 
 class TemplateForkRequest(BaseModel):
     title: str | None = None
     visibility: TemplateVisibilityLiteral | None = None
 
+    model_config = _LAZY_CONFIG
+
 
 class TemplateApplyResponse(BaseModel):
     template: TemplateResponse
     version: TemplateVersionResponse
 
+    model_config = _LAZY_CONFIG
+
 
 class RoadmapUpdateRequest(BaseModel):
     content: str
@@ -561,19 +664,15 @@ class RoadmapContentResponse(BaseModel):
 class AgentBase(BaseModel):
     name: str
     personality: Optional[str] = None
-    focus_areas: list[str] = Field(default_factory=list)
-    integrations: dict[str, Any] = Field(default_factory=dict)
+    focus_areas: list[str] | None = None
+    integrations: dict[str, Any] | None = None
 
 
 class AgentCreate(AgentBase):
     pass
 
 
-class AgentUpdate(BaseModel):
-    name: Optional[str] = None
-    personality: Optional[str] = None
-    focus_areas: Optional[list[str]] = None
-    integrations: Optional[dict[str, Any]] = None
+AgentUpdate = make_partial(AgentBase, "AgentUpdate")
 
 
 class AgentResponse(AgentBase):
@@ -582,8 +681,7 @@ class AgentResponse(AgentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = _FROZEN_ORM_CONFIG
 
 
 # ---------------------------------------------------------
@@ -597,13 +695,13 @@ class AuthCreate(BaseModel):
 
 
 class AuthLogin(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
 class AuthResponse(BaseModel):
     id: UUID
-    email: EmailStr
+    email: Email
     workspace_id: UUID | None = None
     workspace_name: str | None = None
     workspace_role: WorkspaceRoleLiteral | None = None
@@ -631,8 +729,7 @@ class WorkspaceResponse(BaseModel):
     updated_at: datetime
     role: WorkspaceRoleLiteral | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = _FROZEN_ORM_CONFIG
 
 
 class WorkspaceCreate(BaseModel):
@@ -646,7 +743,7 @@ class WorkspaceUpdate(BaseModel):
 class WorkspaceMemberResponse(BaseModel):
     id: UUID
     user_id: UUID
-    email: EmailStr
+    email: Email
     display_name: str
     role: WorkspaceRoleLiteral
     joined_at: datetime
@@ -657,6 +754,7 @@ class WorkspaceMemberRoleUpdate(BaseModel):
 
 
 class WorkspaceInviteRequest(BaseModel):
+    # Stored and mailed, so it gets full validation rather than the Email shape check.
     email: EmailStr
     role: WorkspaceRoleLiteral | None = None
 
@@ -664,7 +762,7 @@ class WorkspaceInviteRequest(BaseModel):
 class WorkspaceInvitationResponse(BaseModel):
     id: UUID
     workspace_id: UUID
-    email: EmailStr
+    email: Email
     role: WorkspaceRoleLiteral
     token: str
     invited_by: UUID | None = None
@@ -673,17 +771,21 @@ class WorkspaceInvitationResponse(BaseModel):
     accepted_at: datetime | None = None
     cancelled_at: datetime | None = None
 
+    model_config = _LAZY_CONFIG
+
 
 class WorkspaceInvitationAcceptRequest(BaseModel):
     user_id: UUID
 
+    model_config = _LAZY_CONFIG
+
 
 # ---------------------------------------------------------
 # Workspace AI Provider
 # ---------------------------------------------------------
 
 class WorkspaceAIProviderStatus(BaseModel):
-    provider: Literal["openai"]
+    provider: AIProvider
     is_enabled: bool
     has_api_key: bool
     masked_key_preview: str | None = None
@@ -693,7 +795,7 @@ class WorkspaceAIProviderStatus(BaseModel):
 
 
 class WorkspaceAIProviderSave(BaseModel):
-    provider: Literal["openai"] = "openai"
+    provider: AIProvider = "openai"
     api_key: str
     organization: str | None = None
     project: str | None = None
@@ -701,7 +803,7 @@ class WorkspaceAIProviderSave(BaseModel):
 
 
 class WorkspaceAIProviderTestRequest(BaseModel):
-    provider: Literal["openai"] = "openai"
+    provider: AIProvider = "openai"
     api_key: str | None = None
     organization: str | None = None
     project: str | None = None
@@ -717,7 +819,8 @@ class WorkspaceAIProviderTestResponse(BaseModel):
 # Dashboard
 # ---------------------------------------------------------
 
-class DashboardPRDItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DashboardPRDItem:
     id: UUID
     title: str
     status: str
@@ -757,12 +860,16 @@ class DashboardCoachRequest(BaseModel):
     workspace_id: UUID
     user_id: UUID
 
+    model_config = _LAZY_CONFIG
+
 
 class DashboardCoachResponse(BaseModel):
     message: str
     suggestions: list[str]
     confidence: float
 
+    model_config = _LAZY_CONFIG
+
 
 class WorkspaceRecommendation(BaseModel):
     title: str
@@ -779,7 +886,7 @@ class WorkspaceInsightResponse(BaseModel):
     recommendations: list[WorkspaceRecommendation]
     confidence: float | None = None
     metrics: DashboardOverviewResponse
-    context_entries: list["KnowledgeBaseContextItem"] = Field(default_factory=list)
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
     generated_at: datetime
     verification: VerificationDetails | None = None
 
@@ -791,7 +898,7 @@ class WorkspaceInsightRegenerateRequest(BaseModel):
 
 
 class WorkspaceChatMessage(BaseModel):
-    role: Literal["user", "assistant"]
+    role: ChatRole
     content: str
     created_at: datetime
 
@@ -807,7 +914,7 @@ class WorkspaceChatTurnResponse(BaseModel):
     session_id: UUID
     answer: str
     messages: list[WorkspaceChatMessage]
-    context_entries: list["KnowledgeBaseContextItem"] = Field(default_factory=list)
+    context_entries: list[KnowledgeBaseContextItem] = Field(default_factory=list)
     updated_at: datetime
     verification: VerificationDetails | None = None
 
@@ -872,18 +979,6 @@ class StrategyAskResponse(BaseModel):
 # Knowledge Base
 # ---------------------------------------------------------
 
-KnowledgeBaseEntryType = Literal[
-    "document",
-    "prd",
-    "insight",
-    "research",
-    "repo",
-    "ai_output",
-    "roadmap",
-    "prototype",
-]
-
-
 class KnowledgeBaseResponse(BaseModel):
     id: UUID
     workspace_id: UUID
@@ -901,7 +996,7 @@ class KnowledgeBaseEntryResponse(BaseModel):
     file_url: str | None = None
     source_url: str | None = None
     created_by: UUID | None = None
-    created_by_email: EmailStr | None = None
+    created_by_email: Email | None = None
     project_id: UUID | None = None
     tags: list[str] = Field(default_factory=list)
     created_at: datetime
@@ -924,19 +1019,11 @@ class KnowledgeBaseEntryUpdate(BaseModel):
     tags: list[str] | None = None
 
 
-class KnowledgeBaseContextItem(BaseModel):
-    id: UUID
-    title: str
-    type: KnowledgeBaseEntryType
-    snippet: str
-    marker: str | None = None
-
-
 class ProjectMemberResponse(BaseModel):
     id: UUID | None = None
     project_id: UUID
     user_id: UUID
-    email: EmailStr
+    email: Email
     display_name: str
     role: ProjectRoleLiteral
     inherited: bool = False
@@ -958,7 +1045,7 @@ class ProjectMemberRoleUpdate(BaseModel):
 
 
 class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
+    email: Email
 
 
 class ForgotPasswordResponse(BaseModel):
@@ -985,9 +1072,7 @@ class ProjectCommentCreate(ProjectCommentBase):
     author_id: UUID | None = None
 
 
-class ProjectCommentUpdate(BaseModel):
-    content: str | None = None
-    tags: list[str] | None = None
+ProjectCommentUpdate = make_partial(ProjectCommentBase, "ProjectCommentUpdate")
 
 
 class ProjectCommentResponse(ProjectCommentBase):
@@ -998,8 +1083,7 @@ class ProjectCommentResponse(ProjectCommentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 # ---------------------------------------------------------
@@ -1025,6 +1109,8 @@ class PrototypeComponent(BaseModel):
     sample_items: list[str] | None = None
     dataset: list[dict[str, Any]] | None = None
 
+    model_config = _LAZY_CONFIG
+
 
 class PrototypeScreen(BaseModel):
     name: str
@@ -1033,6 +1119,8 @@ class PrototypeScreen(BaseModel):
     layout_notes: str | None = None
     components: list[PrototypeComponent] = Field(default_factory=list)
 
+    model_config = _LAZY_CONFIG
+
 
 class PrototypeSpec(BaseModel):
     title: str
@@ -1045,6 +1133,8 @@ class PrototypeSpec(BaseModel):
     call_to_action: str | None = None
     metadata: dict[str, Any] | None = None
 
+    model_config = _LAZY_CONFIG
+
 
 class PrototypeResponse(BaseModel):
     id: UUID
@@ -1061,8 +1151,7 @@ class PrototypeResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = _LAZY_ORM_CONFIG
 
 
 class PrototypeGenerateRequest(BaseModel):
@@ -1071,6 +1160,8 @@ class PrototypeGenerateRequest(BaseModel):
     focus: str | None = None
     count: int | None = 1
 
+    model_config = _LAZY_CONFIG
+
 
 # ---------------------------------------------------------
 # Project links
@@ -1094,8 +1185,7 @@ class ProjectLinkResponse(ProjectLinkBase):
     workspace_id: UUID | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 # ---------------------------------------------------------
@@ -1105,10 +1195,12 @@ class ProjectLinkResponse(ProjectLinkBase):
 
 class PrototypeAgentMessage(BaseModel):
     id: UUID
-    role: Literal["user", "assistant"]
+    role: ChatRole
     content: str
     created_at: datetime
 
+    model_config = _LAZY_CONFIG
+
 
 class PrototypeSessionResponse(BaseModel):
     id: UUID
@@ -1120,15 +1212,133 @@ class PrototypeSessionResponse(BaseModel):
     bundle_url: str | None = None
     messages: list[PrototypeAgentMessage]
 
-    class Config:
-        from_attributes = True
+    model_config = _LAZY_ORM_CONFIG
 
 
 class PrototypeSessionCreateRequest(BaseModel):
     workspace_id: UUID
     prompt: str | None = None
 
+    model_config = _LAZY_CONFIG
+
 
 class PrototypeSessionMessageRequest(BaseModel):
     workspace_id: UUID
     message: str
+
+    model_config = _LAZY_CONFIG
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+_MISSING = object()
+
+
+def fast_from_orm(model_cls: type[_ModelT], row: Any) -> _ModelT:
+    # Fields the row does not carry (e.g. PRDResponse.context_entries) fall back to their defaults.
+    values = {}
+    for field in model_cls.model_fields:
+        value = getattr(row, field, _MISSING)
+        if value is not _MISSING:
+            values[field] = value
+    return model_cls.model_construct(**values)
+
+
+# KnowledgeBaseContextItem is declared near the top, so every eagerly built model that
+# embeds it is complete at class creation. This sweep is then a no-op; it fails the
+# import (rather than the first request) if a model ends up ahead of a dependency.
+for _model in (
+    PRDResponse,
+    PRDQAResponse,
+    RoadmapGenerateResponse,
+    RoadmapChatResponse,
+    TaskGenerationResponse,
+    WorkspaceInsightResponse,
+    WorkspaceChatTurnResponse,
+):
+    _model.model_rebuild()
+
+
+# ---------------------------------------------------------
+# Bulk serializers
+# ---------------------------------------------------------
+# List adapters are built on first use (not at import) and then reused by every
+# request. Routers that return these helpers' output set response_model=None so
+# FastAPI does not validate the list a second time.
+
+
+@cache
+def task_list_adapter() -> TypeAdapter[list[TaskResponse]]:
+    return TypeAdapter(list[TaskResponse])
+
+
+@cache
+def prd_list_adapter() -> TypeAdapter[list[PRDResponse]]:
+    return TypeAdapter(list[PRDResponse])
+
+
+@cache
+def prd_history_adapter() -> TypeAdapter[list[PRDVersionSummary]]:
+    return TypeAdapter(list[PRDVersionSummary])
+
+
+@cache
+def task_comment_list_adapter() -> TypeAdapter[list[TaskCommentResponse]]:
+    return TypeAdapter(list[TaskCommentResponse])
+
+
+@cache
+def roadmap_phase_list_adapter() -> TypeAdapter[list[RoadmapPhaseResponse]]:
+    return TypeAdapter(list[RoadmapPhaseResponse])
+
+
+@cache
+def workspace_list_adapter() -> TypeAdapter[list[WorkspaceResponse]]:
+    return TypeAdapter(list[WorkspaceResponse])
+
+
+@cache
+def kb_entry_list_adapter() -> TypeAdapter[list[KnowledgeBaseEntryResponse]]:
+    return TypeAdapter(list[KnowledgeBaseEntryResponse])
+
+
+@cache
+def prototype_list_adapter() -> TypeAdapter[list[PrototypeResponse]]:
+    return TypeAdapter(list[PrototypeResponse])
+
+
+def dump_tasks(rows: list[Any]) -> list[dict[str, Any]]:
+    # Task rows come straight from the ORM, so skip validation and only serialize.
+    return task_list_adapter().dump_python([fast_from_orm(TaskResponse, row) for row in rows], mode="json")
+
+
+def dump_prds(rows: list[Any]) -> bytes:
+    return prd_list_adapter().dump_json([fast_from_orm(PRDResponse, row) for row in rows])
+
+
+def dump_prd_history(items: list[PRDVersionSummary]) -> bytes:
+    return prd_history_adapter().dump_json(items)
+
+
+def dump_task_comments(rows: list[Any]) -> bytes:
+    adapter = task_comment_list_adapter()
+    return adapter.dump_json([fast_from_orm(TaskCommentResponse, row) for row in rows])
+
+
+def dump_workspaces(workspaces: list[WorkspaceResponse]) -> bytes:
+    return workspace_list_adapter().dump_json(workspaces)
+
+
+def dump_kb_entries(entries: list[KnowledgeBaseEntryResponse]) -> bytes:
+    return kb_entry_list_adapter().dump_json(entries)
+
+
+def dump_roadmap_phases(phases: list[RoadmapPhaseResponse]) -> bytes:
+    return roadmap_phase_list_adapter().dump_json(phases)
+
+
+def dump_prototype_list(items: list[Any]) -> bytes:
+    # Accepts PrototypeResponse models or ORM rows and encodes the whole list in one serializer call.
+    adapter = prototype_list_adapter()
+    return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
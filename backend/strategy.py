@@ -1,19 +1,30 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import asdict, is_dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend import models, schemas
 from backend.ai_providers import get_openai_client
-from backend.dashboard_service import collect_dashboard_metrics
-from backend.database import get_db
+from backend.dashboard_service import cached_dashboard_metrics
+from backend.database import SessionLocal, get_db
 from backend.rbac import ensure_project_access
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/strategy", tags=["strategy"])
 
 
@@ -24,35 +35,38 @@ def _get_project(db: Session, project_id: UUID) -> models.Project:
     return project
 
 
+def _pillar_to_dict(record: models.StrategicPillar) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        "title": record.title,
+        "description": record.description or "",
+        "progress_percent": float(record.progress_percent or 0.0),
+        "related_prds": record.related_prds or [],
+        "related_roadmaps": record.related_roadmaps or [],
+        "related_tasks": record.related_tasks or [],
+    }
+
+
+def _insight_to_dict(record: models.StrategicInsight) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        "title": record.title,
+        "description": record.description,
+        "severity": record.severity,
+        "source_type": record.source_type,
+        "source_id": record.source_id,
+        "suggested_action": record.suggested_action,
+        "impact_score": record.impact_score,
+    }
+
+
+# Values come straight from typed columns, so these trusted reads skip validation.
 def _serialize_pillars(records: list[models.StrategicPillar]) -> list[schemas.StrategicPillar]:
-    return [
-        schemas.StrategicPillar(
-            id=record.id,
-            title=record.title,
-            description=record.description or "",
-            progress_percent=float(record.progress_percent or 0.0),
-            related_prds=record.related_prds or [],
-            related_roadmaps=record.related_roadmaps or [],
-            related_tasks=record.related_tasks or [],
-        )
-        for record in records
-    ]
+    return [schemas.StrategicPillar.model_construct(**_pillar_to_dict(record)) for record in records]
 
 
 def _serialize_insights(records: list[models.StrategicInsight]) -> list[schemas.StrategicInsight]:
-    return [
-        schemas.StrategicInsight(
-            id=record.id,
-            title=record.title,
-            description=record.description,
-            severity=record.severity,
-            source_type=record.source_type,
-            source_id=record.source_id,
-            suggested_action=record.suggested_action,
-            impact_score=record.impact_score,
-        )
-        for record in records
-    ]
+    return [schemas.StrategicInsight.model_construct(**_insight_to_dict(record)) for record in records]
 
 
 def _summarize_snapshot(snapshot: models.StrategicSnapshot | None) -> schemas.StrategySummary:
@@ -72,27 +86,46 @@ def _summarize_snapshot(snapshot: models.StrategicSnapshot | None) -> schemas.St
 
 
 def _pull_project_context(db: Session, project: models.Project) -> dict[str, Any]:
+    # Column-only queries: rows come back as plain tuples, skipping ORM identity-map bookkeeping.
     prds = (
-        db.query(models.PRD)
+        db.query(
+            models.PRD.id,
+            models.PRD.feature_name,
+            models.PRD.goals,
+            models.PRD.content,
+            func.coalesce(models.PRD.updated_at, models.PRD.created_at),
+        )
         .filter(models.PRD.project_id == project.id)
         .order_by(models.PRD.updated_at.desc().nullslast())
         .limit(20)
         .all()
     )
     tasks = (
-        db.query(models.Task)
+        db.query(
+            models.Task.id,
+            models.Task.title,
+            models.Task.status,
+            models.Task.priority,
+            models.Task.description,
+            models.Task.due_date,
+        )
         .filter(models.Task.project_id == project.id)
         .order_by(models.Task.updated_at.desc().nullslast())
         .limit(50)
         .all()
     )
     roadmaps = (
-        db.query(models.Roadmap)
+        db.query(
+            models.Roadmap.id,
+            models.Roadmap.content,
+            func.coalesce(models.Roadmap.updated_at, models.Roadmap.created_at),
+        )
         .filter(models.Roadmap.project_id == project.id)
         .order_by(models.Roadmap.updated_at.desc().nullslast())
         .limit(5)
         .all()
     )
+    roadmap_title = f"{project.title} Roadmap"
 
     return {
         "project": {
@@ -103,95 +136,148 @@ def _pull_project_context(db: Session, project: models.Project) -> dict[str, Any
         },
         "prds": [
             {
-                "id": str(prd.id),
-                "title": prd.feature_name or "PRD",
-                "goals": prd.goals,
-                "content": prd.content,
-                "updated_at": (prd.updated_at or prd.created_at).isoformat() if prd.updated_at or prd.created_at else None,
+                "id": str(prd_id),
+                "title": feature_name or "PRD",
+                "goals": goals,
+                "content": content,
+                "updated_at": touched_at.isoformat() if touched_at else None,
             }
-            for prd in prds
+            for prd_id, feature_name, goals, content, touched_at in prds
         ],
         "tasks": [
             {
-                "id": str(task.id),
-                "title": task.title,
-                "status": task.status,
-                "priority": task.priority,
-                "description": task.description,
-                "due_date": task.due_date.isoformat() if task.due_date else None,
+                "id": str(task_id),
+                "title": title,
+                "status": task_status,
+                "priority": priority,
+                "description": description,
+                "due_date": due_date.isoformat() if due_date else None,
             }
-            for task in tasks
+            for task_id, title, task_status, priority, description, due_date in tasks
         ],
         "roadmaps": [
             {
-                "id": str(roadmap.id),
-                "title": getattr(roadmap, "title", None) or f"{project.title} Roadmap",
-                "content": roadmap.content,
-                "updated_at": (roadmap.updated_at or roadmap.created_at).isoformat() if roadmap.updated_at or roadmap.created_at else None,
+                "id": str(roadmap_id),
+                "title": roadmap_title,
+                "content": content,
+                "updated_at": touched_at.isoformat() if touched_at else None,
             }
-            for roadmap in roadmaps
+            for roadmap_id, content, touched_at in roadmaps
         ],
     }
 
 
+# Static instructions live in the system message so every call shares a byte-identical
+# prefix (eligible for provider prompt caching); per-project data goes in the user turn.
+STRATEGY_SYSTEM_PROMPT = (
+    "You are the AI Product Strategist (AI CPO) for this project. Respond only with valid JSON."
+    " Analyze the provided context and respond with JSON"
+    ' matching {"summary":{"narrative":"","focus_areas":[],"forecast":"","health_score":0.0},'
+    '"pillars":[{"title":"","description":"","progress_percent":0.0,'
+    '"related_prds":[{"id":"","title":""}],"related_roadmaps":[{"id":"","title":""}],'
+    '"related_tasks":[{"id":"","title":"","status":""}]}],'
+    '"insights":[{"title":"","description":"","severity":"info|warning|risk",'
+    '"source_type":"prd|roadmap|task","source_id":"","suggested_action":"","impact_score":0.0}]}.'
+    "Focus on clustering PRDs, roadmaps, and tasks into strategic pillars, highlight overlaps, and forecast outcomes."
+)
+STRATEGIST_ASK_SYSTEM_PROMPT = (
+    "You are the AI Product Strategist for this project and respond as an executive strategist."
+    " Answer concisely based on context."
+)
+
+
+def _dumps(value: Any) -> str:
+    # Encodes models, dataclasses, UUIDs and datetimes natively; anything else falls back to str().
+    return to_json(value, fallback=str).decode()
+
+
+def _stable_metrics(value: Any) -> Any:
+    """Round floats and truncate timestamps to the minute so repeat prompts encode identically."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    elif is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    if isinstance(value, dict):
+        return {key: _stable_metrics(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_stable_metrics(item) for item in value]
+    if isinstance(value, float):
+        return round(value, 3)
+    if isinstance(value, datetime):
+        return value.replace(second=0, microsecond=0)
+    return value
+
+
 def _build_strategy_prompt(metrics: dict[str, Any], context: dict[str, Any]) -> str:
-    return (
-        "You are the AI Product Strategist (AI CPO) for this project. Analyze the provided context and respond with JSON"
-        ' matching {"summary":{"narrative":"","focus_areas":[],"forecast":"","health_score":0.0},'
-        '"pillars":[{"title":"","description":"","progress_percent":0.0,'
-        '"related_prds":[{"id":"","title":""}],"related_roadmaps":[{"id":"","title":""}],'
-        '"related_tasks":[{"id":"","title":"","status":""}]}],'
-        '"insights":[{"title":"","description":"","severity":"info|warning|risk",'
-        '"source_type":"prd|roadmap|task","source_id":"","suggested_action":"","impact_score":0.0}]}.'
-        "Focus on clustering PRDs, roadmaps, and tasks into strategic pillars, highlight overlaps, and forecast outcomes."
-        f"\nWorkspace metrics: {json.dumps(metrics, default=str)}"
-        f"\nProject context: {json.dumps(context, default=str)}"
-    )
+    return f"Workspace metrics: {_dumps(_stable_metrics(metrics))}\nProject context: {_dumps(context)}"
 
 
 def _store_strategy(db: Session, workspace_id: UUID, project_id: UUID, payload: dict[str, Any]) -> tuple[list[models.StrategicPillar], list[models.StrategicInsight], models.StrategicSnapshot]:
-    db.query(models.StrategicPillar).filter(
+    # Regenerations mostly repeat titles, so rows are reconciled in place by title inside one
+    # transaction rather than wiped and re-inserted.
+    now = datetime.now(timezone.utc)
+    # Titles are not unique (defaulted titles, repeated LLM titles), so keep every row per title.
+    existing_pillars: dict[str, list[models.StrategicPillar]] = defaultdict(list)
+    for record in db.query(models.StrategicPillar).filter(
         models.StrategicPillar.workspace_id == workspace_id,
         models.StrategicPillar.project_id == project_id,
-    ).delete()
-    db.query(models.StrategicInsight).filter(
+    ):
+        existing_pillars[record.title].append(record)
+    existing_insights: dict[str, list[models.StrategicInsight]] = defaultdict(list)
+    for record in db.query(models.StrategicInsight).filter(
         models.StrategicInsight.workspace_id == workspace_id,
         models.StrategicInsight.project_id == project_id,
-    ).delete()
-    db.commit()
+    ):
+        existing_insights[record.title].append(record)
 
     pillars: list[models.StrategicPillar] = []
     for entry in payload.get("pillars", []) or []:
-        record = models.StrategicPillar(
+        title = entry.get("title") or "Strategic Pillar"
+        reusable = existing_pillars.get(title)
+        record = reusable.pop() if reusable else models.StrategicPillar(
             workspace_id=workspace_id,
             project_id=project_id,
-            title=entry.get("title") or "Strategic Pillar",
-            description=entry.get("description"),
-            progress_percent=float(entry.get("progress_percent") or 0.0),
-            related_prds=entry.get("related_prds") or [],
-            related_roadmaps=entry.get("related_roadmaps") or [],
-            related_tasks=entry.get("related_tasks") or [],
+            title=title,
         )
+        record.description = entry.get("description")
+        record.progress_percent = float(entry.get("progress_percent") or 0.0)
+        record.related_prds = entry.get("related_prds") or []
+        record.related_roadmaps = entry.get("related_roadmaps") or []
+        record.related_tasks = entry.get("related_tasks") or []
+        record.generated_at = now
         db.add(record)
         pillars.append(record)
 
     insights: list[models.StrategicInsight] = []
     for entry in payload.get("insights", []) or []:
-        record = models.StrategicInsight(
+        title = entry.get("title") or "Insight"
+        reusable = existing_insights.get(title)
+        record = reusable.pop() if reusable else models.StrategicInsight(
             workspace_id=workspace_id,
             project_id=project_id,
-            title=entry.get("title") or "Insight",
-            description=entry.get("description") or "",
-            severity=entry.get("severity"),
-            source_type=entry.get("source_type"),
-            source_id=entry.get("source_id"),
-            suggested_action=entry.get("suggested_action"),
-            impact_score=entry.get("impact_score"),
+            title=title,
         )
+        record.description = entry.get("description") or ""
+        record.severity = entry.get("severity")
+        record.source_type = entry.get("source_type")
+        record.source_id = entry.get("source_id")
+        record.suggested_action = entry.get("suggested_action")
+        record.impact_score = entry.get("impact_score")
+        record.generated_at = now
         db.add(record)
         insights.append(record)
 
-    db.commit()
+    # Bulk deletes by id; the stale objects are never read again, so skip session sync.
+    stale_pillar_ids = [record.id for records in existing_pillars.values() for record in records]
+    if stale_pillar_ids:
+        db.query(models.StrategicPillar).filter(
+            models.StrategicPillar.id.in_(stale_pillar_ids)
+        ).delete(synchronize_session=False)
+    stale_insight_ids = [record.id for records in existing_insights.values() for record in records]
+    if stale_insight_ids:
+        db.query(models.StrategicInsight).filter(
+            models.StrategicInsight.id.in_(stale_insight_ids)
+        ).delete(synchronize_session=False)
 
     summary_payload = payload.get("summary") or {}
     snapshot = (
@@ -208,7 +294,7 @@ def _store_strategy(db: Session, workspace_id: UUID, project_id: UUID, payload:
     snapshot.focus_areas = summary_payload.get("focus_areas") or []
     snapshot.forecast = summary_payload.get("forecast") or ""
     snapshot.health_score = summary_payload.get("health_score")
-    snapshot.generated_at = datetime.now(timezone.utc)
+    snapshot.generated_at = now
     db.add(snapshot)
     db.commit()
     db.refresh(snapshot)
@@ -230,7 +316,20 @@ def _build_overview_response(
     )
 
 
-def _get_cached_strategy(db: Session, workspace_id: UUID, project_id: UUID):
+def _get_snapshot(db: Session, workspace_id: UUID, project_id: UUID) -> models.StrategicSnapshot | None:
+    return (
+        db.query(models.StrategicSnapshot)
+        .filter(
+            models.StrategicSnapshot.workspace_id == workspace_id,
+            models.StrategicSnapshot.project_id == project_id,
+        )
+        .first()
+    )
+
+
+def _get_cached_records(
+    db: Session, workspace_id: UUID, project_id: UUID
+) -> tuple[list[models.StrategicPillar], list[models.StrategicInsight]]:
     pillars = (
         db.query(models.StrategicPillar)
         .filter(
@@ -250,15 +349,7 @@ def _get_cached_strategy(db: Session, workspace_id: UUID, project_id: UUID):
         .limit(20)
         .all()
     )
-    snapshot = (
-        db.query(models.StrategicSnapshot)
-        .filter(
-            models.StrategicSnapshot.workspace_id == workspace_id,
-            models.StrategicSnapshot.project_id == project_id,
-        )
-        .first()
-    )
-    return pillars, insights, snapshot
+    return pillars, insights
 
 
 def _generate_strategy(db: Session, workspace_id: UUID, project_id: UUID, user_id: UUID) -> schemas.StrategyOverviewResponse:
@@ -267,7 +358,7 @@ def _generate_strategy(db: Session, workspace_id: UUID, project_id: UUID, user_i
     if project.workspace_id != workspace_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Project does not belong to workspace")
 
-    metrics = collect_dashboard_metrics(db, workspace_id)
+    metrics = cached_dashboard_metrics(db, workspace_id)
     context = _pull_project_context(db, project)
     prompt = _build_strategy_prompt(metrics, context)
 
@@ -278,7 +369,7 @@ def _generate_strategy(db: Session, workspace_id: UUID, project_id: UUID, user_i
             model="gpt-4o-mini",
             temperature=0.2,
             messages=[
-                {"role": "system", "content": "You are an AI CPO. Respond only with valid JSON."},
+                {"role": "system", "content": STRATEGY_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
         )
@@ -316,11 +407,39 @@ def _generate_strategy(db: Session, workspace_id: UUID, project_id: UUID, user_i
     return _build_overview_response(pillars, insights, snapshot)
 
 
+STRATEGY_TTL = timedelta(hours=6)
+_REFRESHING: set[tuple[UUID, UUID]] = set()
+_REFRESHING_LOCK = threading.Lock()
+
+
+def _refresh_strategy(workspace_id: UUID, project_id: UUID, user_id: UUID) -> None:
+    """Regenerate a stale strategy outside the request that noticed it, on its own session."""
+    db = SessionLocal()
+    try:
+        _generate_strategy(db, workspace_id, project_id, user_id)
+    except Exception as exc:
+        logger.warning("Background strategy refresh failed for project %s: %s", project_id, exc)
+    finally:
+        db.close()
+        with _REFRESHING_LOCK:
+            _REFRESHING.discard((workspace_id, project_id))
+
+
+def _schedule_refresh(background_tasks: BackgroundTasks, workspace_id: UUID, project_id: UUID, user_id: UUID) -> None:
+    key = (workspace_id, project_id)
+    with _REFRESHING_LOCK:
+        if key in _REFRESHING:
+            return
+        _REFRESHING.add(key)
+    background_tasks.add_task(_refresh_strategy, workspace_id, project_id, user_id)
+
+
 @router.get("/projects/{project_id}", response_model=schemas.StrategyOverviewResponse)
 def get_project_strategy(
     project_id: UUID,
     workspace_id: UUID,
     user_id: UUID,
+    background_tasks: BackgroundTasks,
     force_refresh: bool = False,
     db: Session = Depends(get_db),
 ):
@@ -332,8 +451,12 @@ def get_project_strategy(
     if force_refresh:
         return _generate_strategy(db, workspace_id, project_id, user_id)
 
-    pillars, insights, snapshot = _get_cached_strategy(db, workspace_id, project_id)
-    if snapshot and snapshot.generated_at >= datetime.now(timezone.utc) - timedelta(hours=6):
+    # Any existing snapshot is served right away; a stale one is regenerated after the response.
+    snapshot = _get_snapshot(db, workspace_id, project_id)
+    if snapshot:
+        if snapshot.generated_at < datetime.now(timezone.utc) - STRATEGY_TTL:
+            _schedule_refresh(background_tasks, workspace_id, project_id, user_id)
+        pillars, insights = _get_cached_records(db, workspace_id, project_id)
         return _build_overview_response(pillars, insights, snapshot)
     return _generate_strategy(db, workspace_id, project_id, user_id)
 
@@ -349,49 +472,96 @@ def regenerate_project_strategy(
     return _generate_strategy(db, workspace_id, project_id, user_id)
 
 
-@router.post("/projects/{project_id}/ask", response_model=schemas.StrategyAskResponse)
-def ask_project_strategist(
-    project_id: UUID,
-    payload: schemas.StrategyAskRequest,
-    db: Session = Depends(get_db),
-):
+STRATEGIST_FALLBACK_ANSWER = "I'm analyzing your project. Please try again soon."
+
+
+def _strategist_context(db: Session, project_id: UUID, payload: schemas.StrategyAskRequest) -> dict[str, Any]:
     project = _get_project(db, project_id)
     if project.workspace_id != payload.workspace_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Project/workspace mismatch")
     ensure_project_access(db, payload.workspace_id, project_id, payload.user_id, required_role="viewer")
 
-    pillars, insights, snapshot = _get_cached_strategy(db, payload.workspace_id, project_id)
+    snapshot = _get_snapshot(db, payload.workspace_id, project_id)
     if not snapshot:
         overview = _generate_strategy(db, payload.workspace_id, project_id, payload.user_id)
         pillars = []
         insights = []
         summary = overview.summary
     else:
+        pillars, insights = _get_cached_records(db, payload.workspace_id, project_id)
         summary = _summarize_snapshot(snapshot)
 
-    context_payload = {
-        "pillars": [pillar.dict() for pillar in _serialize_pillars(pillars)],
-        "insights": [insight.dict() for insight in _serialize_insights(insights)],
+    # Plain dicts feed both the prompt and context_used, so no intermediate models are built.
+    return {
+        "pillars": [_pillar_to_dict(record) for record in pillars],
+        "insights": [_insight_to_dict(record) for record in insights],
         "summary": summary.model_dump(),
     }
 
-    prompt = (
-        "You are the AI Product Strategist for this project. Answer concisely based on context."
-        f"\nContext: {json.dumps(context_payload, default=str)}\nQuestion: {payload.question}"
-    )
-    answer = "I'm analyzing your project. Please try again soon."
+
+def _strategist_messages(context_payload: dict[str, Any], question: str) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": STRATEGIST_ASK_SYSTEM_PROMPT},
+        {"role": "user", "content": f"Context: {_dumps(context_payload)}\nQuestion: {question}"},
+    ]
+
+
+@router.post("/projects/{project_id}/ask", response_model=schemas.StrategyAskResponse)
+def ask_project_strategist(
+    project_id: UUID,
+    payload: schemas.StrategyAskRequest,
+    db: Session = Depends(get_db),
+):
+    context_payload = _strategist_context(db, project_id, payload)
+    answer = STRATEGIST_FALLBACK_ANSWER
     try:
         client = get_openai_client(db, payload.workspace_id)
         completion = client.chat.completions.create(
             model="gpt-4o-mini",
             temperature=0.3,
-            messages=[
-                {"role": "system", "content": "You respond as an executive strategist."},
-                {"role": "user", "content": prompt},
-            ],
+            messages=_strategist_messages(context_payload, payload.question),
         )
         answer = completion.choices[0].message.content or answer
     except Exception:
         pass
 
     return schemas.StrategyAskResponse(answer=answer, context_used=context_payload)
+
+
+@router.post("/projects/{project_id}/ask/stream", response_class=StreamingResponse)
+def stream_project_strategist(
+    project_id: UUID,
+    payload: schemas.StrategyAskRequest,
+    db: Session = Depends(get_db),
+):
+    """Same as ``/ask`` but streams the answer as plain text while the model decodes it."""
+    context_payload = _strategist_context(db, project_id, payload)
+    # Resolve the client up front: the session may be closed once streaming starts.
+    try:
+        client = get_openai_client(db, payload.workspace_id)
+    except Exception:
+        client = None
+
+    def answer_chunks() -> Iterator[str]:
+        if client is None:
+            yield STRATEGIST_FALLBACK_ANSWER
+            return
+        emitted = False
+        try:
+            stream = client.chat.completions.create(
+                model="gpt-4o-mini",
+                temperature=0.3,
+                messages=_strategist_messages(context_payload, payload.question),
+                stream=True,
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    emitted = True
+                    yield delta
+        except Exception:
+            pass
+        if not emitted:
+            yield STRATEGIST_FALLBACK_ANSWER
+
+    return StreamingResponse(answer_chunks(), media_type="text/plain; charset=utf-8")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import base64
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
 
 from backend import models, schemas
+from backend.dashboard_service import invalidate_dashboard_metrics
 from backend.database import get_db
 from backend.rbac import ensure_membership
 
@@ -14,34 +18,24 @@ task_router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
 def _serialize_task(task: models.Task) -> schemas.TaskResponse:
-    return schemas.TaskResponse(
-        id=task.id,
-        workspace_id=task.workspace_id,
-        project_id=task.project_id,
-        epic_id=task.epic_id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        assignee_id=task.assignee_id,
-        due_date=task.due_date,
-        roadmap_id=task.roadmap_id,
-        kb_entry_id=task.kb_entry_id,
-        prd_id=task.prd_id,
-        ai_generated=task.ai_generated,
-        created_by=task.created_by,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+    return schemas.fast_from_orm(schemas.TaskResponse, task)
+
+
+def _encode_cursor(task: models.Task) -> str:
+    raw = f"{task.created_at.isoformat()}|{task.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, task_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(task_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.") from exc
 
 
 def _get_task(db: Session, task_id: UUID) -> models.Task:
-    task = (
-        db.query(models.Task)
-        .options(joinedload(models.Task.comments))
-        .filter(models.Task.id == task_id)
-        .first()
-    )
+    task = db.query(models.Task).filter(models.Task.id == task_id).first()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
     return task
@@ -83,27 +77,50 @@ def create_task(
     )
     db.add(task)
     db.commit()
+    invalidate_dashboard_metrics(workspace_id)
     db.refresh(task)
     return _serialize_task(task)
 
 
-@workspace_router.get("/{workspace_id}/tasks", response_model=list[schemas.TaskResponse])
+@workspace_router.get(
+    "/{workspace_id}/tasks",
+    response_model=None,
+    responses={200: {"model": list[schemas.TaskResponse]}},
+)
 def list_tasks(
     workspace_id: UUID,
     user_id: UUID,
+    response: Response,
     project_id: UUID | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=200),
+    cursor: str | None = Query(None),
     db: Session = Depends(get_db),
 ):
+    """List tasks newest first; pass ``limit`` (and the ``X-Next-Cursor`` header value as ``cursor``) to page."""
     ensure_membership(db, workspace_id, user_id, required_role="viewer")
     query = (
         db.query(models.Task)
         .filter(models.Task.workspace_id == workspace_id)
-        .order_by(models.Task.created_at.desc())
+        .order_by(models.Task.created_at.desc(), models.Task.id.desc())
     )
     if project_id:
         query = query.filter(models.Task.project_id == project_id)
-    tasks = query.all()
-    return [_serialize_task(task) for task in tasks]
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                models.Task.created_at < cursor_created_at,
+                and_(models.Task.created_at == cursor_created_at, models.Task.id < cursor_id),
+            )
+        )
+    if limit is None:
+        return schemas.dump_tasks(query.all())
+
+    tasks = query.limit(limit + 1).all()
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(tasks[-1])
+    return schemas.dump_tasks(tasks)
 
 
 @task_router.put("/{task_id}", response_model=schemas.TaskResponse)
@@ -124,6 +141,7 @@ def update_task(
 
     db.add(task)
     db.commit()
+    invalidate_dashboard_metrics(workspace_id)
     db.refresh(task)
     return _serialize_task(task)
 
@@ -136,9 +154,14 @@ def delete_task(task_id: UUID, workspace_id: UUID, user_id: UUID, db: Session =
         raise HTTPException(status_code=404, detail="Task not found in this workspace.")
     db.delete(task)
     db.commit()
+    invalidate_dashboard_metrics(workspace_id)
 
 
-@task_router.get("/{task_id}/comments", response_model=list[schemas.TaskCommentResponse])
+@task_router.get(
+    "/{task_id}/comments",
+    response_model=None,
+    responses={200: {"model": list[schemas.TaskCommentResponse]}},
+)
 def list_task_comments(task_id: UUID, workspace_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
     ensure_membership(db, workspace_id, user_id, required_role="viewer")
     task = _get_task(db, task_id)
@@ -150,16 +173,7 @@ def list_task_comments(task_id: UUID, workspace_id: UUID, user_id: UUID, db: Ses
         .order_by(models.TaskComment.created_at.asc())
         .all()
     )
-    return [
-        schemas.TaskCommentResponse(
-            id=comment.id,
-            task_id=comment.task_id,
-            author_id=comment.author_id,
-            content=comment.content,
-            created_at=comment.created_at,
-        )
-        for comment in comments
-    ]
+    return Response(content=schemas.dump_task_comments(comments), media_type="application/json")
 
 
 @task_router.post("/{task_id}/comments", response_model=schemas.TaskCommentResponse)
@@ -182,10 +196,4 @@ def add_task_comment(
     db.add(comment)
     db.commit()
     db.refresh(comment)
-    return schemas.TaskCommentResponse(
-        id=comment.id,
-        task_id=comment.task_id,
-        author_id=comment.author_id,
-        content=comment.content,
-        created_at=comment.created_at,
-    )
+    return schemas.fast_from_orm(schemas.TaskCommentResponse, comment)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from uuid import UUID
-import re
+from textwrap import dedent
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -16,6 +17,21 @@ from backend.workspaces import get_project_in_workspace
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
+# Constant across calls; only the user turn varies per project.
+TASK_GENERATION_SYSTEM_PROMPT = dedent(
+    """
+    You output JSON only.
+    You are an expert technical program manager. Given the project details and source document, produce a JSON array of task breakdowns.
+    Each task must contain: title, description, priority (low|medium|high|critical), effort (small|medium|large), and status (todo|in_progress|done).
+    Focus on actionable engineering work and respect dependencies if mentioned. Do not include prose outside JSON.
+    """
+).strip()
+TASK_GENERATION_BATCH_SYSTEM_PROMPT = (
+    TASK_GENERATION_SYSTEM_PROMPT
+    + "\nSeveral numbered sources are given: reply with one JSON object mapping each source number"
+    " (as a string, e.g. \"1\") to its task array."
+)
+
 
 def _serialize_context(entries: list[models.KnowledgeBaseEntry]) -> list[schemas.KnowledgeBaseContextItem]:
     serialized: list[schemas.KnowledgeBaseContextItem] = []
@@ -32,25 +48,43 @@ def _serialize_context(entries: list[models.KnowledgeBaseEntry]) -> list[schemas
     return serialized
 
 
-def _extract_json_payload(raw: str) -> list[dict]:
-    """Best-effort parser to handle assistants that wrap JSON in prose or fences."""
-    if not raw:
-        return []
-    candidates: list[str] = []
-    trimmed = raw.strip()
+def _fenced_block(raw: str) -> str:
+    # Plain substring scans instead of a DOTALL regex; equivalent to ```(?:json)?\s*(.*?)```.
+    start = raw.find("```")
+    if start == -1:
+        return ""
+    end = raw.find("```", start + 3)
+    if end == -1:
+        return ""
+    snippet = raw[start + 3 : end]
+    if snippet[:4].lower() == "json":
+        snippet = snippet[4:]
+    return snippet.strip()
+
+
+def _json_candidates(raw: str) -> Iterator[object]:
+    """Best-effort parser to handle assistants that wrap JSON in prose or fences.
+
+    Candidates are parsed lazily, so a bare JSON reply never pays for the fence scan.
+    """
+    trimmed = (raw or "").strip()
     if trimmed:
-        candidates.append(trimmed)
-    fence = re.search(r"```(?:json)?\s*(.*?)```", raw, re.DOTALL | re.IGNORECASE)
-    if fence:
-        snippet = fence.group(1).strip()
-        if snippet:
-            candidates.append(snippet)
-
-    for candidate in candidates:
         try:
-            parsed = json.loads(candidate)
+            yield json.loads(trimmed)
         except json.JSONDecodeError:
-            continue
+            pass
+    snippet = _fenced_block(raw or "")
+    if snippet:
+        try:
+            yield json.loads(snippet)
+        except json.JSONDecodeError:
+            pass
+
+
+def _extract_json_payload(raw: str) -> list[dict]:
+    if not raw:
+        return []
+    for parsed in _json_candidates(raw):
         if isinstance(parsed, dict):
             tasks = parsed.get("tasks")
             if isinstance(tasks, list):
@@ -60,42 +94,56 @@ def _extract_json_payload(raw: str) -> list[dict]:
     raise ValueError("Assistant did not return valid JSON.")
 
 
-@router.post("/generate-tasks", response_model=schemas.TaskGenerationResponse)
-def generate_tasks(payload: schemas.TaskGenerationRequest, db: Session = Depends(get_db)):
-    ensure_membership(db, payload.workspace_id, payload.user_id, required_role="editor")
-    project = get_project_in_workspace(db, str(payload.project_id), payload.workspace_id)
-
-    source_text = ""
-    if payload.prd_id:
+def _extract_batched_payload(raw: str, source_count: int) -> dict[str, list]:
+    """Map source numbers "1".."N" to task arrays; any other keys the model invents are ignored."""
+    expected = [str(index) for index in range(1, source_count + 1)]
+    for parsed in _json_candidates(raw):
+        if isinstance(parsed, dict):
+            batched = {key: parsed[key] for key in expected if isinstance(parsed.get(key), list)}
+            if batched:
+                return batched
+            if source_count == 1 and isinstance(parsed.get("tasks"), list):
+                return {"1": parsed["tasks"]}
+        if isinstance(parsed, list) and source_count == 1:
+            return {"1": parsed}
+    raise ValueError("Assistant did not return tasks keyed by source number.")
+
+
+def _source_text(
+    db: Session,
+    project_id: UUID,
+    prd_id: UUID | None,
+    roadmap_id: UUID | None,
+    instructions: str | None,
+) -> str:
+    if prd_id:
         prd = (
             db.query(models.PRD)
-            .filter(models.PRD.id == payload.prd_id, models.PRD.project_id == payload.project_id)
+            .filter(models.PRD.id == prd_id, models.PRD.project_id == project_id)
             .first()
         )
         if not prd:
             raise HTTPException(status_code=404, detail="PRD not found for this project.")
-        source_text = prd.content or prd.description or ""
-    elif payload.roadmap_id:
+        return prd.content or prd.description or ""
+    if roadmap_id:
         roadmap = (
             db.query(models.Roadmap)
-            .filter(models.Roadmap.id == payload.roadmap_id, models.Roadmap.project_id == payload.project_id)
+            .filter(models.Roadmap.id == roadmap_id, models.Roadmap.project_id == project_id)
             .first()
         )
         if not roadmap:
             raise HTTPException(status_code=404, detail="Roadmap not found for this project.")
-        source_text = roadmap.content or ""
-    else:
-        source_text = payload.instructions or ""
+        return roadmap.content or ""
+    return instructions or ""
 
-    kb_entries = get_relevant_entries(db, payload.workspace_id, source_text or project.description or "", top_n=4)
-    context_items = _serialize_context(kb_entries)
-    context_block = "\n\n".join(f"{item.title} ({item.type})\n{item.snippet}" for item in context_items) or "No context provided."
-
-    prompt = f"""
-You are an expert technical program manager. Given the project details and source document below, produce a JSON array of task breakdowns.
-Each task must contain: title, description, priority (low|medium|high|critical), effort (small|medium|large), and status (todo|in_progress|done).
-Focus on actionable engineering work and respect dependencies if mentioned. Do not include prose outside JSON.
 
+def _source_prompt(
+    project: models.Project,
+    source_text: str,
+    context_items: list[schemas.KnowledgeBaseContextItem],
+) -> str:
+    context_block = "\n\n".join(f"{item.title} ({item.type})\n{item.snippet}" for item in context_items) or "No context provided."
+    return f"""
 Project: {project.title}
 Goals: {project.goals}
 Source document:
@@ -105,21 +153,26 @@ Relevant knowledge base context:
 {context_block}
 """
 
-    try:
-        client = get_openai_client(db, payload.workspace_id)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            temperature=0.2,
-            messages=[
-                {"role": "system", "content": "You output JSON only."},
-                {"role": "user", "content": prompt},
-            ],
-        )
-        raw = response.choices[0].message.content or ""
-        parsed = _extract_json_payload(raw)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to generate tasks: {exc}") from exc
 
+def _complete_tasks(
+    db: Session,
+    workspace_id: UUID,
+    prompt: str,
+    system_prompt: str = TASK_GENERATION_SYSTEM_PROMPT,
+) -> str:
+    client = get_openai_client(db, workspace_id)
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        temperature=0.2,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ],
+    )
+    return response.choices[0].message.content or ""
+
+
+def _normalize_tasks(parsed: list) -> list[schemas.TaskGenerationItem]:
     items: list[schemas.TaskGenerationItem] = []
     for entry in parsed:
         if not isinstance(entry, dict):
@@ -144,5 +197,53 @@ Relevant knowledge base context:
                 status=status_value,  # type: ignore[arg-type]
             )
         )
+    return items
+
+
+@router.post("/generate-tasks", response_model=schemas.TaskGenerationResponse)
+def generate_tasks(payload: schemas.TaskGenerationRequest, db: Session = Depends(get_db)):
+    ensure_membership(db, payload.workspace_id, payload.user_id, required_role="editor")
+    project = get_project_in_workspace(db, str(payload.project_id), payload.workspace_id)
+    source_text = _source_text(db, payload.project_id, payload.prd_id, payload.roadmap_id, payload.instructions)
 
-    return schemas.TaskGenerationResponse(tasks=items, context_entries=context_items)
+    kb_entries = get_relevant_entries(db, payload.workspace_id, source_text or project.description or "", top_n=4)
+    context_items = _serialize_context(kb_entries)
+
+    try:
+        parsed = _extract_json_payload(_complete_tasks(db, payload.workspace_id, _source_prompt(project, source_text, context_items)))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to generate tasks: {exc}") from exc
+
+    return schemas.TaskGenerationResponse(tasks=_normalize_tasks(parsed), context_entries=context_items)
+
+
+@router.post("/generate-tasks-batch", response_model=list[schemas.TaskGenerationResponse])
+def generate_tasks_batch(payload: schemas.TaskGenerationBatchRequest, db: Session = Depends(get_db)):
+    """Generate task sets for several sources with a single completion; results follow request order."""
+    ensure_membership(db, payload.workspace_id, payload.user_id, required_role="editor")
+
+    sections: list[str] = []
+    contexts: list[list[schemas.KnowledgeBaseContextItem]] = []
+    for index, source in enumerate(payload.sources, start=1):
+        project = get_project_in_workspace(db, str(source.project_id), payload.workspace_id)
+        source_text = _source_text(db, source.project_id, source.prd_id, source.roadmap_id, source.instructions)
+        kb_entries = get_relevant_entries(db, payload.workspace_id, source_text or project.description or "", top_n=4)
+        context_items = _serialize_context(kb_entries)
+        contexts.append(context_items)
+        sections.append(f"Source {index}:{_source_prompt(project, source_text, context_items)}")
+
+    try:
+        batched = _extract_batched_payload(
+            _complete_tasks(db, payload.workspace_id, "\n".join(sections), TASK_GENERATION_BATCH_SYSTEM_PROMPT),
+            len(payload.sources),
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to generate tasks: {exc}") from exc
+
+    return [
+        schemas.TaskGenerationResponse(
+            tasks=_normalize_tasks(batched.get(str(index), [])),
+            context_entries=context_items,
+        )
+        for index, context_items in enumerate(contexts, start=1)
+    ]
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import os
 from typing import Tuple
 from uuid import UUID
 
 import sqlalchemy as sa
 from fastapi import HTTPException, status
+from sqlalchemy.dialects.postgresql import distinct_on
 from sqlalchemy.orm import Session
 
 from backend import models
 
+# Development/test guard: with STRICT_LOADING set, any relationship the template queries
+# did not load up front raises instead of silently issuing a lazy query per row.
+STRICT_LOADING = os.getenv("STRICT_LOADING", "").lower() in {"1", "true", "yes"}
 
-def get_accessible_template(db: Session, workspace_id: UUID, template_id: UUID) -> models.Template:
+
+def template_load_options(*, load_versions: bool = True) -> list[sa.orm.interfaces.LoaderOption]:
+    versions_loader = sa.orm.selectinload if load_versions else sa.orm.lazyload
+    options: list[sa.orm.interfaces.LoaderOption] = [versions_loader(models.Template.versions)]
+    if STRICT_LOADING:
+        options.append(sa.orm.raiseload("*"))
+    return options
+
+
+def get_accessible_template(
+    db: Session, workspace_id: UUID, template_id: UUID, *, load_versions: bool = True
+) -> models.Template:
     template = (
         db.query(models.Template)
-        .options(sa.orm.selectinload(models.Template.versions))
+        .options(*template_load_options(load_versions=load_versions))
         .filter(
             models.Template.id == template_id,
             sa.or_(
@@ -33,7 +49,21 @@ def get_accessible_template(db: Session, workspace_id: UUID, template_id: UUID)
 def get_latest_version(template: models.Template) -> models.TemplateVersion:
     if not template.versions:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Template missing version history")
-    return max(template.versions, key=lambda version: version.version_number)
+    # Template.versions is ordered by version_number, so the newest is always last.
+    return template.versions[-1]
+
+
+def get_latest_versions(db: Session, template_ids: list[UUID]) -> dict[UUID, models.TemplateVersion]:
+    """Newest version per template in one DISTINCT ON query, without loading older versions."""
+    if not template_ids:
+        return {}
+    versions = db.scalars(
+        sa.select(models.TemplateVersion)
+        .where(models.TemplateVersion.template_id.in_(template_ids))
+        .ext(distinct_on(models.TemplateVersion.template_id))
+        .order_by(models.TemplateVersion.template_id, models.TemplateVersion.version_number.desc())
+    )
+    return {version.template_id: version for version in versions}
 
 
 def get_template_version(db: Session, workspace_id: UUID, template_id: UUID, version_number: int | None = None) -> Tuple[models.Template, models.TemplateVersion]:
@@ -42,16 +72,8 @@ def get_template_version(db: Session, workspace_id: UUID, template_id: UUID, ver
         version = get_latest_version(template)
         return template, version
 
+    # get_accessible_template selectin-loads every version, so a miss here is a real 404.
     version = next((item for item in template.versions if item.version_number == version_number), None)
-    if not version:
-        version = (
-            db.query(models.TemplateVersion)
-            .filter(
-                models.TemplateVersion.template_id == template_id,
-                models.TemplateVersion.version_number == version_number,
-            )
-            .first()
-        )
     if not version:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template version not found")
     return template, version
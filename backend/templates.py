@@ -1,23 +1,33 @@
 from __future__ import annotations
 
-from typing import Iterable
+import base64
+from types import MappingProxyType
+from typing import Iterable, Mapping
 from uuid import UUID
 
 import sqlalchemy as sa
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
 
 from backend import models, schemas
 from backend.database import get_db
+from backend.knowledge_base_service import contains_pattern
 from backend.rbac import ensure_membership, role_allows
-from backend.template_service import get_accessible_template, get_latest_version, get_template_version
+from backend.template_service import (
+    get_accessible_template,
+    get_latest_version,
+    get_latest_versions,
+    get_template_version,
+    template_load_options,
+)
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/templates", tags=["templates"])
 
-DEFAULT_SYSTEM_TEMPLATES: list[dict[str, object]] = [
-    {
+# Read-only seed data: a tuple of mapping proxies so no request can mutate it in place.
+DEFAULT_SYSTEM_TEMPLATES: tuple[Mapping[str, object], ...] = (
+    MappingProxyType({
         "title": "PM Assist • Lean MVP PRD",
         "category": "PRD",
         "description": "Concise PRD focused on problem framing, assumptions, and MVP release criteria.",
@@ -43,8 +53,8 @@ DEFAULT_SYSTEM_TEMPLATES: list[dict[str, object]] = [
 - Launch checklist
 - Support plan
 """,
-    },
-    {
+    }),
+    MappingProxyType({
         "title": "PM Assist • AI Feature PRD",
         "category": "PRD",
         "description": "Template optimized for AI-driven features with model, data, and evaluation sections.",
@@ -77,8 +87,8 @@ DEFAULT_SYSTEM_TEMPLATES: list[dict[str, object]] = [
 ## Open Questions
 - Question
 """,
-    },
-    {
+    }),
+    MappingProxyType({
         "title": "PM Assist • Enterprise PRD",
         "category": "PRD",
         "description": "Full PRD for enterprise launches covering compliance, rollout, and GTM.",
@@ -111,8 +121,8 @@ DEFAULT_SYSTEM_TEMPLATES: list[dict[str, object]] = [
 - Links
 - Prior art
 """,
-    },
-    {
+    }),
+    MappingProxyType({
         "title": "PM Assist • Outcome Roadmap",
         "category": "Roadmap",
         "description": "Sequence initiatives around measurable customer and business outcomes.",
@@ -138,8 +148,8 @@ DEFAULT_SYSTEM_TEMPLATES: list[dict[str, object]] = [
 ## Risks & Assumptions
 - Risk/assumption
 """,
-    },
-    {
+    }),
+    MappingProxyType({
         "title": "PM Assist • Theme Roadmap",
         "category": "Roadmap",
         "description": "Roadmap organized into strategic themes with linked initiatives and KPIs.",
@@ -169,8 +179,8 @@ DEFAULT_SYSTEM_TEMPLATES: list[dict[str, object]] = [
 ## Notes
 - Alignment callouts or guardrails
 """,
-    },
-    {
+    }),
+    MappingProxyType({
         "title": "PM Assist • Platform Investment Roadmap",
         "category": "Roadmap",
         "description": "Plan foundational workstreams across experience, data, and infrastructure tracks.",
@@ -197,26 +207,22 @@ DEFAULT_SYSTEM_TEMPLATES: list[dict[str, object]] = [
 - Partner teams
 - Decision / review cadence
 """,
-    },
-]
+    }),
+)
+
+_DEFAULT_BY_TITLE: dict[object, Mapping[str, object]] = {template["title"]: template for template in DEFAULT_SYSTEM_TEMPLATES}
+_DEFAULT_SYSTEM_TITLES = frozenset(_DEFAULT_BY_TITLE)
 
 
 def _normalize_tags(values: Iterable[str] | None) -> list[str]:
     if not values:
         return []
-    normalized = []
-    seen = set()
-    for value in values:
-        cleaned = value.strip().lower()
-        if not cleaned or cleaned in seen:
-            continue
-        seen.add(cleaned)
-        normalized.append(cleaned)
-    return normalized
+    # dict.fromkeys dedupes while keeping first-seen order.
+    return list(dict.fromkeys(cleaned for value in values if (cleaned := value.strip().lower())))
 
 
 def _serialize_version(version: models.TemplateVersion) -> schemas.TemplateVersionResponse:
-    return schemas.TemplateVersionResponse(
+    return schemas.TemplateVersionResponse.model_construct(
         id=version.id,
         template_id=version.template_id,
         version_number=version.version_number,
@@ -228,8 +234,13 @@ def _serialize_version(version: models.TemplateVersion) -> schemas.TemplateVersi
     )
 
 
-def _serialize_template(template: models.Template, *, include_versions: bool = False) -> schemas.TemplateResponse:
-    latest_version = get_latest_version(template)
+def _serialize_template(
+    template: models.Template,
+    *,
+    include_versions: bool = False,
+    latest_version: models.TemplateVersion | None = None,
+) -> schemas.TemplateResponse:
+    latest_version = latest_version or get_latest_version(template)
     payload: dict[str, object] = {
         "id": template.id,
         "workspace_id": template.workspace_id,
@@ -247,11 +258,55 @@ def _serialize_template(template: models.Template, *, include_versions: bool = F
         "updated_at": template.updated_at,
         "latest_version": _serialize_version(latest_version),
     }
-    base = schemas.TemplateResponse(**payload)
+    # Every value is read from typed ORM columns, so the models are built without re-validation.
     if include_versions:
         versions = [_serialize_version(version) for version in template.versions]
-        return schemas.TemplateDetailResponse(**base.model_dump(), versions=versions)
-    return base
+        return schemas.TemplateDetailResponse.model_construct(**payload, versions=versions)
+    return schemas.TemplateResponse.model_construct(**payload)
+
+
+# Encoded list rows keyed by (id, updated_at). Every column change, including a
+# version bump or recommendation flag, moves updated_at, so stale keys just age out.
+_TEMPLATE_JSON_CACHE: dict[tuple[UUID, datetime], bytes] = {}
+_TEMPLATE_JSON_CACHE_SIZE = 1024
+
+
+# Whole list bodies keyed by workspace and query, tagged with the (count, max updated_at)
+# of the templates the workspace can see. Every create, update, fork, rollback and delete
+# changes that pair, so a stale body is never served, even from another worker.
+_TEMPLATE_LIST_CACHE: dict[tuple[object, ...], tuple[tuple[object, ...], bytes, str | None]] = {}
+_TEMPLATE_LIST_CACHE_SIZE = 1024
+
+
+def _template_list_json(template: models.Template, latest_version: models.TemplateVersion | None = None) -> bytes:
+    key = (template.id, template.updated_at)
+    encoded = _TEMPLATE_JSON_CACHE.get(key)
+    if encoded is None:
+        encoded = _serialize_template(template, latest_version=latest_version).model_dump_json().encode()
+        if len(_TEMPLATE_JSON_CACHE) >= _TEMPLATE_JSON_CACHE_SIZE:
+            _TEMPLATE_JSON_CACHE.clear()
+        _TEMPLATE_JSON_CACHE[key] = encoded
+    return encoded
+
+
+def _encode_template_cursor(template: models.Template) -> str:
+    raw = f"{int(bool(template.is_recommended))}|{template.updated_at.isoformat()}|{template.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_template_cursor(cursor: str) -> tuple[bool, datetime, UUID]:
+    try:
+        recommended, updated_at, template_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 2)
+        return recommended == "1", datetime.fromisoformat(updated_at), UUID(template_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.") from exc
+
+
+def _template_list_response(body: bytes, next_cursor: str | None) -> Response:
+    response = Response(content=body, media_type="application/json")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 
 def _assert_visibility_permission(role: str, visibility: str) -> None:
@@ -262,7 +317,7 @@ def _assert_visibility_permission(role: str, visibility: str) -> None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions to manage this template.")
 
 
-@router.get("", response_model=list[schemas.TemplateResponse])
+@router.get("", response_model=None, responses={200: {"model": list[schemas.TemplateResponse]}})
 def list_templates(
     workspace_id: UUID,
     user_id: UUID,
@@ -270,21 +325,34 @@ def list_templates(
     visibility: schemas.TemplateVisibilityLiteral | None = Query(default=None),
     tag: str | None = Query(default=None),
     search: str | None = Query(default=None),
-    limit: int = Query(default=100, le=200),
+    limit: int = Query(default=100, ge=1, le=200),
+    cursor: str | None = Query(default=None),
     db: Session = Depends(get_db),
 ):
+    """List visible templates, recommended and most recently updated first.
+
+    When more rows remain, the ``X-Next-Cursor`` header carries the value to pass as ``cursor``.
+    """
     ensure_membership(db, workspace_id, user_id, required_role="viewer")
     _ensure_system_templates(db)
 
+    visible = sa.or_(
+        models.Template.visibility == "system",
+        models.Template.workspace_id == workspace_id,
+    )
+    cache_key = (workspace_id, category, visibility, tag, search, limit, cursor)
+    fingerprint = tuple(
+        db.query(sa.func.count(models.Template.id), sa.func.max(models.Template.updated_at)).filter(visible).one()
+    )
+    cached = _TEMPLATE_LIST_CACHE.get(cache_key)
+    if cached and cached[0] == fingerprint:
+        return _template_list_response(cached[1], cached[2])
+
+    # Only the newest version of each row is serialized, so the full history is not loaded.
     query = (
         db.query(models.Template)
-        .options(sa.orm.selectinload(models.Template.versions))
-        .filter(
-            sa.or_(
-                models.Template.visibility == "system",
-                models.Template.workspace_id == workspace_id,
-            )
-        )
+        .options(*template_load_options(load_versions=False))
+        .filter(visible)
     )
     if category:
         query = query.filter(sa.func.lower(models.Template.category) == category.strip().lower())
@@ -296,19 +364,42 @@ def list_templates(
     if tag:
         query = query.filter(models.Template.tags.contains([tag.strip().lower()]))
     if search:
-        like = f"%{search.lower()}%"
+        # Plain ILIKE on the columns so the pg_trgm GIN indexes can serve it.
+        like = contains_pattern(search)
         query = query.filter(
             sa.or_(
-                sa.func.lower(models.Template.title).like(like),
-                sa.func.lower(models.Template.description).like(like),
+                models.Template.title.ilike(like, escape="\\"),
+                models.Template.description.ilike(like, escape="\\"),
             )
         )
+    if cursor:
+        query = query.filter(
+            sa.tuple_(models.Template.is_recommended, models.Template.updated_at, models.Template.id)
+            < sa.tuple_(*_decode_template_cursor(cursor))
+        )
     templates = (
-        query.order_by(models.Template.is_recommended.desc(), models.Template.updated_at.desc())
-        .limit(limit)
+        query.order_by(
+            models.Template.is_recommended.desc(),
+            models.Template.updated_at.desc(),
+            models.Template.id.desc(),
+        )
+        .limit(limit + 1)
         .all()
     )
-    return [_serialize_template(template) for template in templates]
+    next_cursor = None
+    if len(templates) > limit:
+        templates = templates[:limit]
+        if templates:
+            next_cursor = _encode_template_cursor(templates[-1])
+    uncached = [template.id for template in templates if (template.id, template.updated_at) not in _TEMPLATE_JSON_CACHE]
+    latest_versions = get_latest_versions(db, uncached)
+    body = b"[" + b",".join(
+        _template_list_json(template, latest_versions.get(template.id)) for template in templates
+    ) + b"]"
+    if len(_TEMPLATE_LIST_CACHE) >= _TEMPLATE_LIST_CACHE_SIZE:
+        _TEMPLATE_LIST_CACHE.clear()
+    _TEMPLATE_LIST_CACHE[cache_key] = (fingerprint, body, next_cursor)
+    return _template_list_response(body, next_cursor)
 
 
 @router.get("/{template_id}", response_model=schemas.TemplateDetailResponse)
@@ -338,19 +429,18 @@ def create_template(
         version=1,
         created_by=user_id,
         updated_by=user_id,
+        # Attaching through the relationship lets one flush at commit insert both rows.
+        versions=[
+            models.TemplateVersion(
+                version_number=1,
+                content=payload.content,
+                content_format=payload.content_format,
+                content_metadata=payload.metadata,
+                created_by=user_id,
+            )
+        ],
     )
     db.add(template)
-    db.flush()
-
-    version = models.TemplateVersion(
-        template_id=template.id,
-        version_number=1,
-        content=payload.content,
-        content_format=payload.content_format,
-        content_metadata=payload.metadata,
-        created_by=user_id,
-    )
-    db.add(version)
     db.commit()
     db.refresh(template)
     return _serialize_template(template, include_versions=True)
@@ -434,29 +524,62 @@ def fork_template(
         version=1,
         created_by=user_id,
         updated_by=user_id,
+        versions=[
+            models.TemplateVersion(
+                version_number=1,
+                content=latest_version.content,
+                content_format=latest_version.content_format,
+                content_metadata=latest_version.content_metadata,
+                created_by=user_id,
+            )
+        ],
     )
     db.add(forked)
-    db.flush()
-
-    forked_version = models.TemplateVersion(
-        template_id=forked.id,
-        version_number=1,
-        content=latest_version.content,
-        content_format=latest_version.content_format,
-        content_metadata=latest_version.content_metadata,
-        created_by=user_id,
-    )
-    db.add(forked_version)
     db.commit()
     db.refresh(forked)
     return _serialize_template(forked, include_versions=True)
 
 
 @router.get("/{template_id}/versions", response_model=list[schemas.TemplateVersionResponse])
-def list_versions(workspace_id: UUID, template_id: UUID, user_id: UUID, db: Session = Depends(get_db)):
+def list_versions(
+    workspace_id: UUID,
+    template_id: UUID,
+    user_id: UUID,
+    include_content: bool = Query(default=True),
+    db: Session = Depends(get_db),
+):
     ensure_membership(db, workspace_id, user_id, required_role="viewer")
-    template = get_accessible_template(db, workspace_id, template_id)
-    return [_serialize_version(version) for version in template.versions]
+    if include_content:
+        template = get_accessible_template(db, workspace_id, template_id)
+        return [_serialize_version(version) for version in template.versions]
+
+    # Metadata-only listing: never pull the markdown bodies off the database.
+    get_accessible_template(db, workspace_id, template_id, load_versions=False)
+    rows = db.execute(
+        sa.select(
+            models.TemplateVersion.id,
+            models.TemplateVersion.version_number,
+            models.TemplateVersion.content_format,
+            models.TemplateVersion.content_metadata,
+            models.TemplateVersion.created_by,
+            models.TemplateVersion.created_at,
+        )
+        .where(models.TemplateVersion.template_id == template_id)
+        .order_by(models.TemplateVersion.version_number)
+    )
+    return [
+        schemas.TemplateVersionResponse.model_construct(
+            id=row.id,
+            template_id=template_id,
+            version_number=row.version_number,
+            content="",
+            content_format=row.content_format,
+            metadata=row.content_metadata,
+            created_by=row.created_by,
+            created_at=row.created_at,
+        )
+        for row in rows
+    ]
 
 
 @router.post("/{template_id}/versions/{version_number}/rollback", response_model=schemas.TemplateDetailResponse)
@@ -496,42 +619,64 @@ def apply_template(workspace_id: UUID, template_id: UUID, user_id: UUID, version
     return schemas.TemplateApplyResponse(template=serialized, version=_serialize_version(template_version))
 
 
+_system_templates_seeded = False
+
+
 def _ensure_system_templates(db: Session) -> None:
-    existing = {
-        title
-        for title, in db.query(models.Template.title)
+    global _system_templates_seeded
+    if _system_templates_seeded:
+        return
+    system_count = (
+        db.query(sa.func.count(models.Template.id))
         .filter(models.Template.visibility == "system")
-        .all()
-    }
-    created = False
-    for template in DEFAULT_SYSTEM_TEMPLATES:
-        title = template["title"]
-        if title in existing:
-            continue
-        tmpl = models.Template(
-            workspace_id=None,
-            title=title,
-            description=template["description"],
-            category=template["category"],
-            visibility="system",
-            tags=template["tags"],
-            version=1,
-            is_recommended=True,
-            created_by=None,
-            updated_by=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+        .scalar()
+    )
+    if system_count == len(_DEFAULT_SYSTEM_TITLES):
+        _system_templates_seeded = True
+        return
+    # Serializes first-boot seeding across workers; released when the transaction ends.
+    db.execute(sa.text("SELECT pg_advisory_xact_lock(hashtext('pm_assist_system_templates'))"))
+    existing = set(
+        db.execute(sa.select(models.Template.title).where(models.Template.visibility == "system")).scalars()
+    )
+    now = datetime.utcnow()
+    template_rows: list[dict[str, object]] = []
+    version_rows: list[dict[str, object]] = []
+    for title in _DEFAULT_SYSTEM_TITLES - existing:
+        template = _DEFAULT_BY_TITLE[title]
+        template_id = uuid.uuid4()
+        template_rows.append(
+            {
+                "id": template_id,
+                "workspace_id": None,
+                "title": title,
+                "description": template["description"],
+                "category": template["category"],
+                "visibility": "system",
+                "tags": template["tags"],
+                "version": 1,
+                "is_recommended": True,
+                "created_by": None,
+                "updated_by": None,
+                "created_at": now,
+                "updated_at": now,
+            }
         )
-        db.add(tmpl)
-        db.flush()
-        version = models.TemplateVersion(
-            template_id=tmpl.id,
-            version_number=1,
-            content=template["content"],
-            content_format="markdown",
-            created_at=datetime.utcnow(),
+        version_rows.append(
+            {
+                "id": uuid.uuid4(),
+                "template_id": template_id,
+                "version_number": 1,
+                "content": template["content"],
+                "content_format": "markdown",
+                "created_at": now,
+            }
         )
-        db.add(version)
-        created = True
-    if created:
+    if template_rows:
+        # Two executemany statements instead of a flush per template.
+        db.execute(sa.insert(models.Template), template_rows)
+        db.execute(sa.insert(models.TemplateVersion), version_rows)
         db.commit()
+    else:
+        db.rollback()
+    _system_templates_seeded = True
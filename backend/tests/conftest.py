@@ -0,0 +1,42 @@
+import os
+
+import pytest
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# Make template queries raise on any lazy load they did not opt into.
+os.environ.setdefault("STRICT_LOADING", "1")
+
+# backend.database raises at import without DATABASE_URL. Honour .env first, then fall back
+# to an in-memory SQLite URL so every module collects; db_engine skips the Postgres tests.
+load_dotenv()
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or database_url.startswith("sqlite"):
+        pytest.skip("DATABASE_URL env var not set to Postgres; skipping database tests")
+
+    from backend import models
+
+    engine = create_engine(database_url, pool_pre_ping=True, pool_size=5)
+    models.Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """Session bound to an outer transaction; app-level commits release SAVEPOINTs and everything rolls back."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
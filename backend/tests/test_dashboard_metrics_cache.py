@@ -0,0 +1,22 @@
+import uuid
+
+from backend import dashboard_service
+
+
+def test_cached_dashboard_metrics_reuses_result_until_invalidated(monkeypatch):
+    dashboard_service._METRICS_CACHE.clear()
+    calls: list[uuid.UUID] = []
+
+    def fake_collect(db, workspace_id):
+        calls.append(workspace_id)
+        return {"call": len(calls)}
+
+    monkeypatch.setattr(dashboard_service, "collect_dashboard_metrics", fake_collect)
+    workspace_id = uuid.uuid4()
+
+    first = dashboard_service.cached_dashboard_metrics(None, workspace_id)
+    assert dashboard_service.cached_dashboard_metrics(None, workspace_id) is first
+    assert len(calls) == 1
+
+    dashboard_service.invalidate_dashboard_metrics(workspace_id)
+    assert dashboard_service.cached_dashboard_metrics(None, workspace_id) == {"call": 2}
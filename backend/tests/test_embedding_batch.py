@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from backend import models, prd_service
+from backend.knowledge import embeddings
+
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, *, model, input):
+        self.calls.append(input)
+        data = [SimpleNamespace(index=i, embedding=[float(i)]) for i in range(len(input))]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+def test_generate_embeddings_sends_one_request_in_input_order(monkeypatch):
+    fake = FakeEmbeddings()
+    monkeypatch.setattr(embeddings, "get_openai_client", lambda db, workspace_id: SimpleNamespace(embeddings=fake))
+
+    result = embeddings.generate_embeddings(["a", "b", "c"])
+
+    assert fake.calls == [["a", "b", "c"]]
+    assert result == [[0.0], [1.0], [2.0]]
+    assert embeddings.generate_embeddings([]) == []
+    assert len(fake.calls) == 1
+
+
+class FakeQuery:
+    def filter(self, *criteria):
+        return self
+
+    def delete(self):
+        return 0
+
+    def all(self):
+        return []
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+
+    def query(self, model):
+        return FakeQuery()
+
+    def add(self, record):
+        self.added.append(record)
+
+    def add_all(self, records):
+        self.added.extend(records)
+
+
+def test_refresh_prd_embeddings_falls_back_per_chunk_when_batch_fails(monkeypatch):
+    def failing_batch(texts, *, db=None, workspace_id=None):
+        raise RuntimeError("batch rejected")
+
+    def single(text, *, db=None, workspace_id=None):
+        if "bad" in text:
+            raise RuntimeError("bad input")
+        return [0.1]
+
+    monkeypatch.setattr(prd_service, "generate_embeddings", failing_batch)
+    monkeypatch.setattr(prd_service, "generate_embedding", single)
+    monkeypatch.setattr(prd_service, "_chunk_markdown", lambda content: ["good one", "bad one", "good two"])
+    prd = models.PRD(id=uuid4(), project_id=uuid4(), workspace_id=uuid4(), version=1, content="ignored")
+    db = FakeSession()
+
+    prd_service.refresh_prd_embeddings(db, prd)
+
+    assert [(record.chunk_index, record.chunk) for record in db.added] == [(0, "good one"), (2, "good two")]
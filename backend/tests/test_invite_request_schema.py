@@ -0,0 +1,14 @@
+import pytest
+from pydantic import ValidationError
+
+from backend import schemas
+
+
+def test_invite_request_rejects_malformed_email():
+    with pytest.raises(ValidationError):
+        schemas.WorkspaceInviteRequest(email="a@b..c")
+
+
+def test_login_accepts_shape_checked_email():
+    payload = schemas.AuthLogin(email="pm@example.com", password="secret")
+    assert payload.email == "pm@example.com"
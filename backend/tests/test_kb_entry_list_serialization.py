@@ -0,0 +1,32 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+from backend import models, schemas
+from backend.knowledge_base import _serialize_entry
+from backend.knowledge_base_service import contains_pattern
+
+
+def test_kb_entry_list_dump_matches_validated_payload():
+    now = datetime.now(timezone.utc)
+    entry = models.KnowledgeBaseEntry(
+        id=uuid.uuid4(),
+        kb_id=uuid.uuid4(),
+        type="insight",
+        title="Churn drivers",
+        content="Onboarding friction",
+        tags=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+    payload = json.loads(schemas.dump_kb_entries([_serialize_entry(entry)]))
+
+    expected = schemas.KnowledgeBaseEntryResponse.model_validate(payload[0]).model_dump(mode="json")
+    assert payload == [expected]
+    assert payload[0]["tags"] == []
+    assert payload[0]["file_url"] is None
+
+
+def test_contains_pattern_escapes_like_wildcards():
+    assert contains_pattern("50%_off\\") == "%50\\%\\_off\\\\%"
@@ -0,0 +1,14 @@
+from backend import knowledge_base_service, models
+
+
+def test_entry_text_source_stops_joining_documents_at_limit():
+    entry = models.KnowledgeBaseEntry(title="Upload", content=None, type="document")
+    entry.documents = [
+        models.Document(chunk_index=str(index), content=f"chunk{index}-" + "x" * 20)
+        for index in range(50)
+    ]
+    full = " ".join(doc.content for doc in entry.documents)
+
+    text = knowledge_base_service._entry_text_source(entry, limit=100)
+
+    assert text == full[:100]
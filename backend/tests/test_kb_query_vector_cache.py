@@ -0,0 +1,23 @@
+import uuid
+
+from backend import knowledge_base_service
+
+
+def test_query_vector_literal_embeds_each_text_once_per_workspace(monkeypatch):
+    knowledge_base_service._QUERY_VECTOR_CACHE.clear()
+    calls: list[str] = []
+
+    def fake_embedding(text, *, db=None, workspace_id=None):
+        calls.append(text)
+        return [0.5, 0.25]
+
+    monkeypatch.setattr(knowledge_base_service, "generate_embedding", fake_embedding)
+    workspace_id = uuid.uuid4()
+
+    literal = knowledge_base_service.query_vector_literal(None, workspace_id, "roadmap status")
+    assert literal == "[0.5000000000,0.2500000000]"
+    assert knowledge_base_service.query_vector_literal(None, workspace_id, "roadmap status") is literal
+    assert calls == ["roadmap status"]
+
+    knowledge_base_service.query_vector_literal(None, uuid.uuid4(), "roadmap status")
+    assert len(calls) == 2
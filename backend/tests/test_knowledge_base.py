@@ -1,45 +1,20 @@
-import os
 import uuid
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import create_engine
 from sqlalchemy import inspect
-from sqlalchemy.orm import sessionmaker
 
 from backend import models
 from backend.knowledge_base import create_text_entry, list_kb_entries
 from backend.knowledge_base_service import ensure_workspace_kb
 from backend.schemas import KnowledgeBaseEntryCreate
 
-DATABASE_URL = os.getenv("DATABASE_URL")
 
-if not DATABASE_URL:
-    pytest.skip("DATABASE_URL env var not set; skipping knowledge base tests", allow_module_level=True)
-
-engine = create_engine(DATABASE_URL)
-SessionTesting = sessionmaker(bind=engine)
-inspector = inspect(engine)
-document_columns = {column["name"] for column in inspector.get_columns("documents")}
-
-if "kb_entry_id" not in document_columns:
-    pytest.skip(
-        "documents table missing kb_entry_id column; run latest migrations before KB tests",
-        allow_module_level=True,
-    )
-
-
-@pytest.fixture
-def db_session():
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = SessionTesting(bind=connection)
-    try:
-        yield session
-    finally:
-        session.close()
-        transaction.rollback()
-        connection.close()
+@pytest.fixture(scope="module", autouse=True)
+def require_kb_schema(db_engine):
+    document_columns = {column["name"] for column in inspect(db_engine).get_columns("documents")}
+    if "kb_entry_id" not in document_columns:
+        pytest.skip("documents table missing kb_entry_id column; run latest migrations before KB tests")
 
 
 def create_workspace(db_session):
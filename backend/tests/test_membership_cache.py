@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from backend import models, rbac
+
+
+class FakeQuery:
+    def __init__(self, session):
+        self.session = session
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        self.session.queries += 1
+        return self.session.membership
+
+
+class FakeSession:
+    def __init__(self, membership):
+        self.info = {}
+        self.membership = membership
+        self.queries = 0
+
+    def query(self, *entities):
+        return FakeQuery(self)
+
+
+def test_ensure_membership_reuses_row_within_session():
+    workspace_id, user_id = uuid.uuid4(), uuid.uuid4()
+    membership = models.WorkspaceMember(workspace_id=workspace_id, user_id=user_id, role="editor")
+    db = FakeSession(membership)
+
+    assert rbac.ensure_membership(db, workspace_id, user_id).role == "editor"
+    assert rbac.get_membership_role(db, workspace_id, user_id) == "editor"
+    with pytest.raises(HTTPException):
+        rbac.ensure_membership(db, workspace_id, user_id, required_role="admin")
+    assert db.queries == 1
+
+    rbac.forget_membership(db, workspace_id, user_id)
+    db.membership = None
+    with pytest.raises(HTTPException):
+        rbac.ensure_membership(db, workspace_id, user_id)
+    assert db.queries == 2
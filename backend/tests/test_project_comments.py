@@ -1,36 +1,9 @@
-import os
 import uuid
 
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
 from backend import models, schemas
 from backend.knowledge import comments as comments_router
 from backend.workspaces import create_workspace_with_owner
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    pytest.skip("DATABASE_URL env var not set; skipping project comment tests", allow_module_level=True)
-
-
-engine = create_engine(DATABASE_URL)
-SessionTesting = sessionmaker(bind=engine)
-
-
-@pytest.fixture
-def db_session():
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = SessionTesting(bind=connection)
-    try:
-        yield session
-    finally:
-        session.close()
-        transaction.rollback()
-        connection.close()
-
 
 def test_comment_lifecycle(db_session):
     author = models.User(email=f"commenter_{uuid.uuid4()}@example.com", password_hash="dummy")
@@ -1,36 +1,9 @@
-import os
 import uuid
 
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
 from backend import models, schemas
 from backend.knowledge import links as links_router
 from backend.workspaces import create_workspace_with_owner
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    pytest.skip("DATABASE_URL env var not set; skipping project link tests", allow_module_level=True)
-
-engine = create_engine(DATABASE_URL)
-SessionTesting = sessionmaker(bind=engine)
-
-
-@pytest.fixture
-def db_session():
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = SessionTesting(bind=connection)
-    models.Base.metadata.create_all(bind=connection)
-    try:
-        yield session
-    finally:
-        session.close()
-        transaction.rollback()
-        connection.close()
-
 
 def test_link_crud(db_session):
     owner = models.User(email=f"link_owner_{uuid.uuid4()}@example.com", password_hash="dummy")
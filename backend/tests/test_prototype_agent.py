@@ -1,41 +1,14 @@
-import os
 import uuid
 
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
 from backend import models, schemas
 from backend.knowledge import prototype_agent
 from backend.workspaces import create_workspace_with_owner
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    pytest.skip("DATABASE_URL env var not set; skipping prototype agent tests", allow_module_level=True)
-
-engine = create_engine(DATABASE_URL)
-SessionTesting = sessionmaker(bind=engine)
-
-
-@pytest.fixture
-def db_session():
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = SessionTesting(bind=connection)
-    models.Base.metadata.create_all(bind=connection)
-    try:
-        yield session
-    finally:
-        session.close()
-        transaction.rollback()
-        connection.close()
-
 
 def test_prototype_agent_flow(db_session):
     owner = models.User(email=f"agent_owner_{uuid.uuid4()}@example.com", password_hash="dummy")
     db_session.add(owner)
-    db_session.commit()
+    db_session.flush()
 
     workspace = create_workspace_with_owner(db_session, name="Agent Space", owner_id=owner.id)
 
@@ -46,7 +19,7 @@ def test_prototype_agent_flow(db_session):
         workspace_id=workspace.id,
     )
     db_session.add(project)
-    db_session.commit()
+    db_session.flush()
 
     create_payload = schemas.PrototypeSessionCreateRequest(workspace_id=workspace.id, prompt="Create onboarding experience")
     session_response = prototype_agent.start_session(
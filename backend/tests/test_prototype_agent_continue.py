@@ -1,62 +1,94 @@
-from uuid import uuid4
+from collections import defaultdict
 from datetime import datetime, timezone
+from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy.sql import operators
 
 from backend import models, schemas
 from backend.knowledge import prototype_agent
 
 
+def _criterion_matches(criterion, row) -> bool:
+    actual = getattr(row, criterion.left.key)
+    expected = criterion.right.value
+    if criterion.operator is operators.eq:
+        return actual == expected
+    if criterion.operator is operators.in_op:
+        return actual in expected
+    raise NotImplementedError(f"Operator not supported: {criterion.operator}")
+
+
 class FakeQuery:
-    def __init__(self, data):
-        self._data = data
+    def __init__(self, rows: dict):
+        self._rows = rows
+        self._criteria: list = []
+        self._equals: dict = {}
 
-    def filter(self, *args, **kwargs):
+    def filter(self, *criteria):
+        self._criteria.extend(criteria)
         return self
 
     def filter_by(self, **kwargs):
+        self._equals.update(kwargs)
         return self
 
     def order_by(self, *args, **kwargs):
         return self
 
+    def _candidates(self):
+        for criterion in self._criteria:
+            if criterion.left.key == "id" and criterion.operator is operators.eq:
+                row = self._rows.get(criterion.right.value)
+                return [row] if row is not None else []
+        if "id" in self._equals:
+            row = self._rows.get(self._equals["id"])
+            return [row] if row is not None else []
+        return self._rows.values()
+
+    def _matches(self, row) -> bool:
+        return all(getattr(row, key) == value for key, value in self._equals.items()) and all(
+            _criterion_matches(criterion, row) for criterion in self._criteria
+        )
+
     def all(self):
-        if isinstance(self._data, list):
-            return self._data
-        return [self._data]
+        return [row for row in self._candidates() if self._matches(row)]
 
     def first(self):
-        if isinstance(self._data, list):
-            return self._data[0] if self._data else None
-        return self._data
+        return next((row for row in self._candidates() if self._matches(row)), None)
 
 
 class FakeSession:
     def __init__(self, project, proto_session):
-        self.project = project
-        self.proto_session = proto_session
-        self.messages = []
-        self._last_added = None
+        self.projects: dict[str, models.Project] = {project.id: project}
+        self.proto_sessions: dict[UUID, models.PrototypeSession] = {}
+        self.messages_by_session: dict[UUID, list[models.PrototypeMessage]] = defaultdict(list)
+        self.message_index: dict[UUID, models.PrototypeMessage] = {}
+        if proto_session is not None:
+            self.proto_sessions[proto_session.id] = proto_session
 
     def query(self, model):
         if model is models.Project:
-            return FakeQuery(self.project)
+            return FakeQuery(self.projects)
         if model is models.PrototypeSession:
-            return FakeQuery(self.proto_session)
+            return FakeQuery(self.proto_sessions)
         if model is models.PrototypeMessage:
-            return FakeQuery(self.messages)
+            return FakeQuery(self.message_index)
         raise NotImplementedError(f"Query not supported for {model}")
 
     def add(self, obj):
         if isinstance(obj, models.PrototypeMessage):
             obj.created_at = datetime.now(timezone.utc)
             obj.id = uuid4()
-            self.messages.append(obj)
-            if self.proto_session and hasattr(self.proto_session, "messages"):
-                self.proto_session.messages.append(obj)
+            self.message_index[obj.id] = obj
+            self.messages_by_session[obj.session_id].append(obj)
+            proto_session = self.proto_sessions.get(obj.session_id)
+            if proto_session is not None and obj not in proto_session.messages:
+                proto_session.messages.append(obj)
         elif isinstance(obj, models.PrototypeSession):
-            self.proto_session = obj
-        self._last_added = obj
+            if obj.id is None:
+                obj.id = uuid4()
+            self.proto_sessions[obj.id] = obj
 
     def flush(self):
         return None
@@ -142,3 +174,26 @@ def test_continue_session_persists_assistant_metrics(monkeypatch, setup_project)
     assistant_messages = [msg for msg in response.messages if msg.role == "assistant"]
     assert assistant_messages
     assert assistant_messages[-1].content == "Updated metrics"
+    assert len(fake_db.messages_by_session[proto_session.id]) == 2
+
+
+def test_fake_query_applies_session_filters(setup_project):
+    project, proto_session = setup_project
+    fake_db = FakeSession(project, proto_session)
+
+    found = (
+        fake_db.query(models.PrototypeSession)
+        .filter(
+            models.PrototypeSession.id == proto_session.id,
+            models.PrototypeSession.workspace_id.in_([project.workspace_id, None]),
+        )
+        .first()
+    )
+    assert found is proto_session
+    assert (
+        fake_db.query(models.PrototypeSession)
+        .filter(models.PrototypeSession.workspace_id.in_([uuid4(), None]))
+        .first()
+        is None
+    )
+    assert fake_db.query(models.Project).filter(models.Project.id == str(uuid4())).first() is None
@@ -0,0 +1,13 @@
+from backend import rbac
+
+
+def test_normalize_role_maps_aliases_and_unknown_values():
+    assert [rbac.normalize_role(role) for role in ("admin", "Owner", "member", "EDITOR", None, "", "guest")] == [
+        "admin",
+        "admin",
+        "editor",
+        "editor",
+        "viewer",
+        "viewer",
+        "viewer",
+    ]
@@ -0,0 +1,92 @@
+from uuid import uuid4
+
+from sqlalchemy.sql import operators
+
+from backend import models
+from backend.strategy import _store_strategy
+
+
+def _matches(criterion, row) -> bool:
+    actual = getattr(row, criterion.left.key)
+    expected = criterion.right.value
+    if criterion.operator is operators.eq:
+        return actual == expected
+    if criterion.operator is operators.in_op:
+        return actual in expected
+    raise NotImplementedError(f"Operator not supported: {criterion.operator}")
+
+
+class FakeQuery:
+    def __init__(self, session, model):
+        self._session = session
+        self._model = model
+        self._criteria: list = []
+
+    def filter(self, *criteria):
+        self._criteria.extend(criteria)
+        return self
+
+    def _rows(self):
+        return [
+            row
+            for row in self._session.rows
+            if isinstance(row, self._model) and all(_matches(c, row) for c in self._criteria)
+        ]
+
+    def __iter__(self):
+        return iter(self._rows())
+
+    def first(self):
+        rows = self._rows()
+        return rows[0] if rows else None
+
+    def delete(self, synchronize_session=None):
+        doomed = self._rows()
+        self._session.rows = [row for row in self._session.rows if row not in doomed]
+        return len(doomed)
+
+
+class FakeSession:
+    def __init__(self):
+        self.rows: list = []
+
+    def query(self, model):
+        return FakeQuery(self, model)
+
+    def add(self, row):
+        if row.id is None:
+            row.id = uuid4()
+        if row not in self.rows:
+            self.rows.append(row)
+
+    def commit(self):
+        pass
+
+    def refresh(self, row):
+        pass
+
+
+def _payload(pillar_titles, insight_titles):
+    return {
+        "pillars": [{"title": title} for title in pillar_titles],
+        "insights": [{"title": title, "description": "d"} for title in insight_titles],
+        "summary": {},
+    }
+
+
+def test_store_strategy_reuses_and_prunes_rows_with_duplicate_titles():
+    db = FakeSession()
+    workspace_id, project_id = uuid4(), uuid4()
+
+    first, _, _ = _store_strategy(db, workspace_id, project_id, _payload([None, None, "Growth"], [None, None]))
+    first_ids = {record.id for record in first}
+
+    pillars, insights, _ = _store_strategy(db, workspace_id, project_id, _payload([None, "Retention"], [None]))
+
+    stored_pillars = [row for row in db.rows if isinstance(row, models.StrategicPillar)]
+    stored_insights = [row for row in db.rows if isinstance(row, models.StrategicInsight)]
+    assert sorted(row.title for row in stored_pillars) == ["Retention", "Strategic Pillar"]
+    assert [row.title for row in stored_insights] == ["Insight"]
+    assert {row.id for row in stored_pillars} == {record.id for record in pillars}
+    assert {row.id for row in stored_insights} == {record.id for record in insights}
+    assert pillars[0].id in first_ids
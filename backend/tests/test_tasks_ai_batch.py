@@ -0,0 +1,70 @@
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from backend import schemas, tasks_ai
+
+TASK = {"title": "Ship onboarding", "description": "Build it", "priority": "high", "status": "todo"}
+
+
+def test_batched_payload_keeps_only_numbered_sources():
+    raw = json.dumps({"1": [TASK], "source_2": [TASK], "2": [TASK, TASK], "3": [TASK]})
+    assert tasks_ai._extract_batched_payload(raw, 2) == {"1": [TASK], "2": [TASK, TASK]}
+
+
+def test_batched_payload_accepts_single_source_shapes():
+    assert tasks_ai._extract_batched_payload(json.dumps({"tasks": [TASK]}), 1) == {"1": [TASK]}
+    assert tasks_ai._extract_batched_payload(f"```json\n{json.dumps([TASK])}\n```", 1) == {"1": [TASK]}
+
+
+def test_batched_payload_rejects_replies_without_source_keys():
+    with pytest.raises(ValueError):
+        tasks_ai._extract_batched_payload(json.dumps({"tasks": [TASK]}), 2)
+    with pytest.raises(ValueError):
+        tasks_ai._extract_batched_payload(json.dumps({"source_1": [TASK]}), 1)
+
+
+def _patch_generation(monkeypatch, reply: str) -> list[str]:
+    system_prompts: list[str] = []
+
+    def create(**kwargs):
+        system_prompts.append(kwargs["messages"][0]["content"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    project = SimpleNamespace(title="Atlas", goals="Grow", description="Atlas project")
+    monkeypatch.setattr(tasks_ai, "ensure_membership", lambda *args, **kwargs: None)
+    monkeypatch.setattr(tasks_ai, "get_project_in_workspace", lambda *args: project)
+    monkeypatch.setattr(tasks_ai, "_source_text", lambda db, project_id, *args: f"source for {project_id}")
+    monkeypatch.setattr(tasks_ai, "get_relevant_entries", lambda *args, **kwargs: [])
+    monkeypatch.setattr(tasks_ai, "get_openai_client", lambda db, workspace_id: client)
+    return system_prompts
+
+
+def _batch_request(count: int) -> schemas.TaskGenerationBatchRequest:
+    return schemas.TaskGenerationBatchRequest(
+        workspace_id=uuid4(),
+        user_id=uuid4(),
+        sources=[schemas.TaskGenerationSource(project_id=uuid4()) for _ in range(count)],
+    )
+
+
+def test_generate_tasks_batch_fans_results_out_in_request_order(monkeypatch):
+    system_prompts = _patch_generation(monkeypatch, json.dumps({"2": [TASK], "1": []}))
+
+    responses = tasks_ai.generate_tasks_batch(_batch_request(2), db=None)
+
+    assert [len(response.tasks) for response in responses] == [0, 1]
+    assert responses[1].tasks[0].title == "Ship onboarding"
+    assert system_prompts == [tasks_ai.TASK_GENERATION_BATCH_SYSTEM_PROMPT]
+
+
+def test_generate_tasks_batch_fails_when_reply_has_no_source_keys(monkeypatch):
+    _patch_generation(monkeypatch, json.dumps({"tasks": [TASK]}))
+
+    with pytest.raises(HTTPException) as excinfo:
+        tasks_ai.generate_tasks_batch(_batch_request(2), db=None)
+    assert excinfo.value.status_code == 500
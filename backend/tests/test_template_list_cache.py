@@ -0,0 +1,66 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import models
+from backend import templates
+from backend.database import get_db
+
+
+def _template(updated_at: datetime) -> models.Template:
+    template_id = uuid.uuid4()
+    template = models.Template(
+        id=template_id,
+        workspace_id=None,
+        title="Lean PRD",
+        description="Short PRD",
+        category="PRD",
+        visibility="system",
+        tags=["prd"],
+        version=1,
+        is_recommended=True,
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
+    template.versions = [
+        models.TemplateVersion(
+            id=uuid.uuid4(),
+            template_id=template_id,
+            version_number=1,
+            content="# Objective",
+            content_format="markdown",
+            created_at=updated_at,
+        )
+    ]
+    return template
+
+
+def test_template_list_json_reuses_encoding_until_updated_at_changes():
+    templates._TEMPLATE_JSON_CACHE.clear()
+    now = datetime.now(timezone.utc)
+    template = _template(now)
+
+    first = templates._template_list_json(template)
+    assert json.loads(first)["title"] == "Lean PRD"
+
+    template.title = "Renamed"
+    assert templates._template_list_json(template) is first
+
+    template.updated_at = now + timedelta(seconds=1)
+    assert json.loads(templates._template_list_json(template))["title"] == "Renamed"
+
+
+def test_list_templates_rejects_zero_limit():
+    app = FastAPI()
+    app.include_router(templates.router)
+    app.dependency_overrides[get_db] = lambda: None
+
+    response = TestClient(app).get(
+        f"/workspaces/{uuid.uuid4()}/templates",
+        params={"user_id": str(uuid.uuid4()), "limit": 0},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,23 @@
+import uuid
+from datetime import datetime, timezone
+
+from backend import models
+from backend import workspace_ai
+
+
+def test_insight_response_is_built_once_per_stored_row():
+    workspace_ai._INSIGHT_RESPONSE_CACHE.clear()
+    record = models.WorkspaceInsight(
+        id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+        summary="Steady progress",
+        recommendations=[{"title": "Review", "description": "Check owners", "severity": "info"}],
+        metrics={},
+        context_entries=[],
+        confidence=0.5,
+        generated_at=datetime.now(timezone.utc),
+    )
+
+    first = workspace_ai._insight_to_schema(record)
+    assert first.recommendations[0].title == "Review"
+    assert workspace_ai._insight_to_schema(record) is first
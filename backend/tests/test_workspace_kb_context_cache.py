@@ -0,0 +1,31 @@
+import uuid
+
+from backend import models
+from backend import workspace_ai
+
+
+def test_kb_context_reuses_lookup_until_refresh(monkeypatch):
+    workspace_ai._KB_CONTEXT_CACHE.clear()
+    calls: list[str] = []
+
+    def fake_entries(db, workspace_id, query, top_n=5):
+        calls.append(query)
+        return [models.KnowledgeBaseEntry(id=uuid.uuid4(), title="Roadmap notes", type="insight", content="Ship beta in Q3")]
+
+    monkeypatch.setattr(workspace_ai, "get_relevant_entries", fake_entries)
+    workspace_id = uuid.uuid4()
+
+    items, block, payload = workspace_ai._kb_context(None, workspace_id, "roadmap", 4)
+    assert [item.marker for item in items] == ["CTX1"]
+    assert block.startswith("[CTX1] Roadmap notes")
+    assert payload[0]["title"] == "Roadmap notes"
+
+    items.append(items[0])
+    cached_items, _, cached_payload = workspace_ai._kb_context(None, workspace_id, "roadmap", 4)
+    assert len(cached_items) == 1
+    assert cached_payload is payload
+    assert calls == ["roadmap"]
+
+    workspace_ai._kb_context(None, workspace_id, "roadmap", 4, refresh=True)
+    workspace_ai._kb_context(None, workspace_id, "roadmap", 5)
+    assert len(calls) == 3
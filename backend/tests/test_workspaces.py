@@ -1,40 +1,23 @@
-import os
 import uuid
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from backend import models
-from backend.workspaces import create_workspace_with_owner, get_project_in_workspace
-
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    pytest.skip("DATABASE_URL env var not set; skipping workspace tests", allow_module_level=True)
-
-engine = create_engine(DATABASE_URL)
-SessionTesting = sessionmaker(bind=engine)
-
-
-@pytest.fixture
-def db_session():
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = SessionTesting(bind=connection)
-    try:
-        yield session
-    finally:
-        session.close()
-        transaction.rollback()
-        connection.close()
+from backend import models, schemas
+from backend.workspaces import (
+    _ensure_remaining_admins,
+    accept_workspace_invitation,
+    create_workspace_with_owner,
+    get_project_in_workspace,
+    remove_workspace_member,
+)
 
 
 def test_create_workspace_with_owner(db_session):
     user = models.User(email=f"workspace_test_{uuid.uuid4()}@example.com", password_hash="dummy")
     db_session.add(user)
-    db_session.commit()
+    db_session.flush()
 
     workspace = create_workspace_with_owner(db_session, name="QA Workspace", owner_id=user.id)
 
@@ -54,7 +37,7 @@ def test_create_workspace_with_owner(db_session):
 def test_get_project_in_workspace(db_session):
     owner = models.User(email=f"workspace_lookup_{uuid.uuid4()}@example.com", password_hash="dummy")
     db_session.add(owner)
-    db_session.commit()
+    db_session.flush()
 
     workspace = create_workspace_with_owner(db_session, name="Lookup Space", owner_id=owner.id)
 
@@ -66,10 +49,88 @@ def test_get_project_in_workspace(db_session):
         workspace_id=workspace.id,
     )
     db_session.add(project)
-    db_session.commit()
+    db_session.flush()
 
     found = get_project_in_workspace(db_session, project.id, workspace.id)
     assert found.id == project.id
 
     with pytest.raises(HTTPException):
         get_project_in_workspace(db_session, project.id, uuid.uuid4())
+
+
+def test_ensure_remaining_admins_counts_legacy_owner_role(db_session):
+    owner = models.User(email=f"workspace_admins_{uuid.uuid4()}@example.com", password_hash="dummy")
+    legacy = models.User(email=f"workspace_legacy_{uuid.uuid4()}@example.com", password_hash="dummy")
+    db_session.add_all([owner, legacy])
+    db_session.flush()
+
+    workspace = create_workspace_with_owner(db_session, name="Admins Space", owner_id=owner.id)
+    owner_membership = (
+        db_session.query(models.WorkspaceMember)
+        .filter(models.WorkspaceMember.workspace_id == workspace.id)
+        .one()
+    )
+
+    with pytest.raises(HTTPException):
+        _ensure_remaining_admins(db_session, workspace.id, exclude_member_id=owner_membership.id)
+
+    db_session.add(models.WorkspaceMember(workspace_id=workspace.id, user_id=legacy.id, role="Owner"))
+    db_session.flush()
+
+    _ensure_remaining_admins(db_session, workspace.id, exclude_member_id=owner_membership.id)
+
+
+def test_accept_workspace_invitation_creates_membership(db_session):
+    owner = models.User(email=f"workspace_inviter_{uuid.uuid4()}@example.com", password_hash="dummy")
+    invitee = models.User(email=f"workspace_invitee_{uuid.uuid4()}@example.com", password_hash="dummy")
+    db_session.add_all([owner, invitee])
+    db_session.flush()
+
+    workspace = create_workspace_with_owner(db_session, name="Invite Space", owner_id=owner.id)
+    invite = models.WorkspaceInvitation(
+        workspace_id=workspace.id,
+        email=invitee.email,
+        role="editor",
+        token=f"token-{uuid.uuid4()}",
+        invited_by=owner.id,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+    )
+    db_session.add(invite)
+    db_session.flush()
+
+    payload = schemas.WorkspaceInvitationAcceptRequest(user_id=invitee.id)
+    response = accept_workspace_invitation(invite.token, payload, db_session)
+
+    assert response.user_id == invitee.id
+    assert response.email == invitee.email
+    assert response.role == "editor"
+    assert response.joined_at is not None
+
+    with pytest.raises(HTTPException):
+        accept_workspace_invitation(invite.token, payload, db_session)
+
+
+def test_remove_workspace_member_drops_project_memberships(db_session):
+    owner = models.User(email=f"workspace_remover_{uuid.uuid4()}@example.com", password_hash="dummy")
+    member_user = models.User(email=f"workspace_removed_{uuid.uuid4()}@example.com", password_hash="dummy")
+    db_session.add_all([owner, member_user])
+    db_session.flush()
+
+    workspace = create_workspace_with_owner(db_session, name="Removal Space", owner_id=owner.id)
+    project = models.Project(
+        title="Project",
+        description="",
+        goals="",
+        north_star_metric=None,
+        workspace_id=workspace.id,
+    )
+    member = models.WorkspaceMember(workspace_id=workspace.id, user_id=member_user.id, role="editor")
+    db_session.add_all([project, member])
+    db_session.flush()
+    db_session.add(models.ProjectMember(project_id=project.id, user_id=member_user.id, role="contributor"))
+    db_session.flush()
+
+    remove_workspace_member(workspace.id, member.id, owner.id, db_session)
+
+    assert db_session.query(models.WorkspaceMember).filter_by(id=member.id).first() is None
+    assert db_session.query(models.ProjectMember).filter_by(project_id=project.id).count() == 0
@@ -1,42 +1,82 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from pydantic_core import from_json
 from sqlalchemy.orm import Session
 
 from backend import models, schemas
 from backend.ai_guardrails import DECLINE_PHRASE, bundle_context_entries, render_context_block, verify_citations, verify_from_items
 from backend.ai_providers import get_openai_client
-from backend.dashboard_service import collect_dashboard_metrics
-from backend.database import get_db
+from backend.dashboard_service import cached_dashboard_metrics, collect_dashboard_metrics
+from backend.database import SessionLocal, get_db
 from backend.knowledge_base_service import get_relevant_entries
 from backend.prd_service import search_prd_embeddings, build_prd_context_items
-from backend.rbac import ensure_membership
+from backend.rbac import check_membership, ensure_membership
 
 router = APIRouter(prefix="/workspace-ai", tags=["workspace-ai"])
+logger = logging.getLogger(__name__)
+
+KB_CONTEXT_CACHE_TTL_SECONDS = 30
+_KB_CONTEXT_CACHE: dict[tuple[UUID, bytes, int], tuple[float, tuple]] = {}
+_KB_CONTEXT_CACHE_SIZE = 1024
+_KB_CONTEXT_LOCK = threading.Lock()
+
+INSIGHT_SYSTEM_PROMPT = "You are an AI workspace coach. Respond only with valid JSON."
+INSIGHT_PROMPT_PREAMBLE = (
+    "Act as an embedded AI product coach. Study the workspace metrics and knowledge context, then respond in strict JSON:\n"
+    '{"summary":"...", "recommendations":[{"title":"","description":"","severity":"info|opportunity|warning|risk","related_entry_title":"","citations":["CTX1"]}], "confidence":0.0}. '
+    f"Each factual statement must cite at least one context marker such as [CTX1]. If the context does not contain an answer, reply with the exact phrase: {DECLINE_PHRASE}\n"
+)
+WORKSPACE_CHAT_SYSTEM_PROMPT = (
+    "You answer questions about this workspace succinctly, only using provided metrics and knowledge snippets."
+    f" Cite snippets using [CTX#]. If the context is insufficient, respond with the exact phrase '{DECLINE_PHRASE}'."
+)
+WORKSPACE_CHAT_PROMPT_PREAMBLE = (
+    "You are the Ask My Workspace assistant. Answer clearly with actionable details using only workspace context.\n"
+    f"Reference evidence using the exact marker syntax like [CTX1]. If the context does not contain the answer, reply with the exact phrase: {DECLINE_PHRASE}\n"
+)
+
+# Prior chat turns replayed to the model; older turns are dropped to bound prompt size.
+CHAT_HISTORY_WINDOW = 8
+
+# Stored insights are never updated in place, so a built response stays valid for its row.
+_INSIGHT_RESPONSE_CACHE: dict[tuple[UUID, datetime], schemas.WorkspaceInsightResponse] = {}
+_INSIGHT_RESPONSE_CACHE_SIZE = 512
 
 
-def _jsonable(model) -> dict:
-    return json.loads(model.model_dump_json())
+def _insight_to_schema(record: models.WorkspaceInsight) -> schemas.WorkspaceInsightResponse:
+    key = (record.id, record.generated_at)
+    response = _INSIGHT_RESPONSE_CACHE.get(key)
+    if response is None:
+        response = _build_insight_response(record)
+        if len(_INSIGHT_RESPONSE_CACHE) >= _INSIGHT_RESPONSE_CACHE_SIZE:
+            _INSIGHT_RESPONSE_CACHE.clear()
+        _INSIGHT_RESPONSE_CACHE[key] = response
+    return response
 
 
-def _insight_to_schema(record: models.WorkspaceInsight) -> schemas.WorkspaceInsightResponse:
+def _build_insight_response(record: models.WorkspaceInsight) -> schemas.WorkspaceInsightResponse:
     metrics_payload = record.metrics or {}
     try:
         metrics_model = schemas.DashboardOverviewResponse(**metrics_payload)
     except Exception:
         # fallback to sane defaults if schema mismatch
+        now = datetime.now(timezone.utc)
         metrics_model = schemas.DashboardOverviewResponse(
             prds=[],
             roadmap=schemas.DashboardRoadmapSummary(current_phase=None, completion_percent=0.0, total_tasks=0, done_tasks=0),
             tasks=schemas.DashboardTaskSummary(total=0, todo=0, in_progress=0, done=0),
             sprint=schemas.DashboardSprintSummary(
-                velocity=0.0, completed_last_7_days=0, velocity_trend=[], updated_at=datetime.now(timezone.utc)
+                velocity=0.0, completed_last_7_days=0, velocity_trend=[], updated_at=now
             ),
-            updated_at=datetime.now(timezone.utc),
+            updated_at=now,
         )
     rec_payload = record.recommendations or []
     recommendations: list[schemas.WorkspaceRecommendation] = []
@@ -89,30 +129,61 @@ def _render_inline_context(items: list[schemas.KnowledgeBaseContextItem]) -> str
     return "\n".join(lines)
 
 
-def _generate_and_store_insight(db: Session, workspace_id: UUID, user_id: UUID) -> models.WorkspaceInsight:
-    metrics = collect_dashboard_metrics(db, workspace_id)
-    kb_entries = get_relevant_entries(db, workspace_id, "workspace roadmap health", top_n=4)
-    context_bundle = bundle_context_entries(kb_entries)
-    context_items = [item.to_schema() for item in context_bundle]
+def _kb_context(
+    db: Session, workspace_id: UUID, query: str, top_n: int, *, refresh: bool = False
+) -> tuple[list[schemas.KnowledgeBaseContextItem], str | None, list[dict]]:
+    """Return (context items, rendered block, JSON payload) for a KB lookup.
+
+    Results are shared across requests for a short TTL; the block is None when no entries matched.
+    """
+    key = (workspace_id, hashlib.blake2b(query.encode(), digest_size=16).digest(), top_n)
+    now = time.monotonic()
+    if not refresh:
+        with _KB_CONTEXT_LOCK:
+            cached = _KB_CONTEXT_CACHE.get(key)
+        if cached and now - cached[0] < KB_CONTEXT_CACHE_TTL_SECONDS:
+            items, block, payload = cached[1]
+            return list(items), block, payload
+
+    context_bundle = bundle_context_entries(get_relevant_entries(db, workspace_id, query, top_n=top_n))
+    items = tuple(item.to_schema() for item in context_bundle)
+    block = render_context_block(context_bundle) if context_bundle else None
+    payload = [item.model_dump(mode="json") for item in items]
+    with _KB_CONTEXT_LOCK:
+        if len(_KB_CONTEXT_CACHE) >= _KB_CONTEXT_CACHE_SIZE:
+            _KB_CONTEXT_CACHE.clear()
+        _KB_CONTEXT_CACHE[key] = (now, (items, block, payload))
+    return list(items), block, payload
+
+
+def _tasks_summary(tasks: schemas.DashboardTaskSummary) -> str:
+    return f"Tasks: total={tasks.total}, todo={tasks.todo}, in_progress={tasks.in_progress}, done={tasks.done}."
+
+
+def _generate_and_store_insight(
+    db: Session, workspace_id: UUID, user_id: UUID, *, refresh: bool = False
+) -> models.WorkspaceInsight:
+    metrics = collect_dashboard_metrics(db, workspace_id) if refresh else cached_dashboard_metrics(db, workspace_id)
+    context_items, context_block, context_payload = _kb_context(
+        db, workspace_id, "workspace roadmap health", 4, refresh=refresh
+    )
 
     prd_lines = "\n".join(
         f"- {item.title} (status: {item.status}, updated {item.updated_at.strftime('%Y-%m-%d')})"
         for item in metrics["prds"]
     ) or "No active PRDs tracked."
-    tasks = metrics["tasks"]
     roadmap = metrics["roadmap"]
     sprint = metrics["sprint"]
-    context_block = render_context_block(context_bundle)
+    context_block = context_block or render_context_block([])
     allowed_markers = {item.marker for item in context_items if item.marker}
 
     prompt = (
-        "Act as an embedded AI product coach. Study the workspace metrics and knowledge context, then respond in strict JSON:\n"
-        '{"summary":"...", "recommendations":[{"title":"","description":"","severity":"info|opportunity|warning|risk","related_entry_title":"","citations":["CTX1"]}], "confidence":0.0}. '
-        f"Each factual statement must cite at least one context marker such as [CTX1]. If the context does not contain an answer, reply with the exact phrase: {DECLINE_PHRASE}\n"
+        f"{INSIGHT_PROMPT_PREAMBLE}"
         f"Active PRDs:\n{prd_lines}\n\n"
         f"Roadmap: phase={roadmap.current_phase}, completion={roadmap.completion_percent}%, done={roadmap.done_tasks}/{roadmap.total_tasks}.\n"
-        f"Tasks: total={tasks.total}, todo={tasks.todo}, in_progress={tasks.in_progress}, done={tasks.done}.\n"
-        f"Sprint velocity={sprint.velocity} tasks/day, completed last 7 days={sprint.completed_last_7_days}, trend={sprint.velocity_trend}.\n"
+        f"{_tasks_summary(metrics['tasks'])}\n"
+        f"Sprint velocity={sprint.velocity} tasks/day, completed last 7 days={sprint.completed_last_7_days}, "
+        f"trend={','.join(f'{value:.2f}' for value in sprint.velocity_trend)}.\n"
         f"Knowledge context:\n{context_block}\n"
     )
 
@@ -133,12 +204,13 @@ def _generate_and_store_insight(db: Session, workspace_id: UUID, user_id: UUID)
             model="gpt-4o-mini",
             temperature=0.2,
             messages=[
-                {"role": "system", "content": "You are an AI workspace coach. Respond only with valid JSON."},
+                {"role": "system", "content": INSIGHT_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
+            response_format={"type": "json_object"},
         )
         content = completion.choices[0].message.content or ""
-        data = json.loads(content)
+        data = from_json(content)
         summary = data.get("summary") or summary
         raw_recs = data.get("recommendations") or []
         if isinstance(raw_recs, list):
@@ -168,8 +240,7 @@ def _generate_and_store_insight(db: Session, workspace_id: UUID, user_id: UUID)
         confidence = 0.0
 
     overview = schemas.DashboardOverviewResponse(**metrics)
-    metrics_payload = _jsonable(overview)
-    context_payload = [json.loads(item.model_dump_json()) for item in context_items]
+    metrics_payload = overview.model_dump(mode="json")
 
     record = models.WorkspaceInsight(
         workspace_id=workspace_id,
@@ -182,57 +253,83 @@ def _generate_and_store_insight(db: Session, workspace_id: UUID, user_id: UUID)
     )
     db.add(record)
     db.commit()
-    db.refresh(record)
     return record
 
 
+INSIGHT_TTL = timedelta(hours=6)
+_REFRESHING: set[UUID] = set()
+_REFRESHING_LOCK = threading.Lock()
+
+
+def _refresh_insight(workspace_id: UUID, user_id: UUID) -> None:
+    """Store a fresh insight after the response has been sent, on its own session."""
+    db = SessionLocal()
+    try:
+        _generate_and_store_insight(db, workspace_id, user_id)
+    except Exception as exc:
+        logger.warning("Background insight refresh failed for workspace %s: %s", workspace_id, exc)
+    finally:
+        db.close()
+        with _REFRESHING_LOCK:
+            _REFRESHING.discard(workspace_id)
+
+
+def _schedule_refresh(background_tasks: BackgroundTasks, workspace_id: UUID, user_id: UUID) -> None:
+    with _REFRESHING_LOCK:
+        if workspace_id in _REFRESHING:
+            return
+        _REFRESHING.add(workspace_id)
+    background_tasks.add_task(_refresh_insight, workspace_id, user_id)
+
+
 @router.get("/insights", response_model=schemas.WorkspaceInsightResponse)
-def get_workspace_insight(workspace_id: UUID, user_id: UUID, force_refresh: bool = False, db: Session = Depends(get_db)):
-    ensure_membership(db, workspace_id, user_id, required_role="viewer")
-
-    if not force_refresh:
-        insight = (
-            db.query(models.WorkspaceInsight)
-            .filter(models.WorkspaceInsight.workspace_id == workspace_id)
-            .order_by(models.WorkspaceInsight.generated_at.desc())
+def get_workspace_insight(
+    workspace_id: UUID,
+    user_id: UUID,
+    background_tasks: BackgroundTasks,
+    force_refresh: bool = False,
+    db: Session = Depends(get_db),
+):
+    if force_refresh:
+        ensure_membership(db, workspace_id, user_id, required_role="viewer")
+    else:
+        # Authorize and fetch the latest insight in one round-trip.
+        row = (
+            db.query(models.WorkspaceMember, models.WorkspaceInsight)
+            .outerjoin(models.WorkspaceInsight, models.WorkspaceInsight.workspace_id == models.WorkspaceMember.workspace_id)
+            .filter(models.WorkspaceMember.workspace_id == workspace_id, models.WorkspaceMember.user_id == user_id)
+            .order_by(models.WorkspaceInsight.generated_at.desc().nullslast())
             .first()
         )
+        membership, insight = row if row else (None, None)
+        check_membership(membership, required_role="viewer")
         if insight:
+            # Serve the stored insight now; a stale one is regenerated after the response.
+            if insight.generated_at < datetime.now(timezone.utc) - INSIGHT_TTL:
+                _schedule_refresh(background_tasks, workspace_id, user_id)
             return _insight_to_schema(insight)
 
-    record = _generate_and_store_insight(db, workspace_id, user_id)
+    record = _generate_and_store_insight(db, workspace_id, user_id, refresh=force_refresh)
     return _insight_to_schema(record)
 
 
 @router.post("/insights/regenerate", response_model=schemas.WorkspaceInsightResponse)
 def regenerate_workspace_insight(payload: schemas.WorkspaceInsightRegenerateRequest, db: Session = Depends(get_db)):
     ensure_membership(db, payload.workspace_id, payload.user_id, required_role="editor")
-    record = _generate_and_store_insight(db, payload.workspace_id, payload.user_id)
+    record = _generate_and_store_insight(db, payload.workspace_id, payload.user_id, refresh=True)
     return _insight_to_schema(record)
 
 
-def _serialize_chat_messages(raw_messages: list[dict]) -> list[schemas.WorkspaceChatMessage]:
-    serialized: list[schemas.WorkspaceChatMessage] = []
-    for item in raw_messages:
-        try:
-            created = item.get("created_at")
-            created_dt = (
-                datetime.fromisoformat(created)
-                if isinstance(created, str)
-                else created
-                if isinstance(created, datetime)
-                else datetime.now(timezone.utc)
-            )
-            serialized.append(
-                schemas.WorkspaceChatMessage(
-                    role=item.get("role") if item.get("role") in {"user", "assistant"} else "assistant",
-                    content=str(item.get("content") or ""),
-                    created_at=created_dt,
-                )
-            )
-        except Exception:
-            continue
-    return serialized
+def _serialize_chat_messages(rows: list[models.WorkspaceAIChatMessage]) -> list[schemas.WorkspaceChatMessage]:
+    # Rows come from our own table with a normalized role, so skip per-message validation.
+    return [
+        schemas.WorkspaceChatMessage.model_construct(
+            role=row.role if row.role in {"user", "assistant"} else "assistant",
+            content=row.content or "",
+            created_at=row.created_at,
+        )
+        for row in rows
+    ]
 
 
 def _chat_response(session: models.WorkspaceAIChat, context_entries: list[schemas.KnowledgeBaseContextItem]) -> schemas.WorkspaceChatTurnResponse:
@@ -244,7 +341,7 @@ def _chat_response(session: models.WorkspaceAIChat, context_entries: list[schema
             except Exception:
                 continue
 
-    messages = _serialize_chat_messages(session.messages or [])
+    messages = _serialize_chat_messages(session.messages)
     last_answer = ""
     for msg in reversed(messages):
         if msg.role == "assistant":
@@ -267,21 +364,28 @@ def _chat_response(session: models.WorkspaceAIChat, context_entries: list[schema
 
 @router.post("/ask", response_model=schemas.WorkspaceChatTurnResponse)
 def ask_workspace(payload: schemas.WorkspaceChatTurnRequest, db: Session = Depends(get_db)):
-    ensure_membership(db, payload.workspace_id, payload.user_id, required_role="viewer")
-
     session: models.WorkspaceAIChat | None = None
     if payload.session_id:
-        session = (
-            db.query(models.WorkspaceAIChat)
+        # Authorize and load the chat session in one round-trip.
+        row = (
+            db.query(models.WorkspaceMember, models.WorkspaceAIChat)
+            .outerjoin(
+                models.WorkspaceAIChat,
+                (models.WorkspaceAIChat.workspace_id == models.WorkspaceMember.workspace_id)
+                & (models.WorkspaceAIChat.id == payload.session_id),
+            )
             .filter(
-                models.WorkspaceAIChat.id == payload.session_id,
-                models.WorkspaceAIChat.workspace_id == payload.workspace_id,
+                models.WorkspaceMember.workspace_id == payload.workspace_id,
+                models.WorkspaceMember.user_id == payload.user_id,
             )
             .first()
         )
+        membership, session = row if row else (None, None)
+        check_membership(membership, required_role="viewer")
         if not session:
             raise HTTPException(status_code=404, detail="Chat session not found.")
     else:
+        ensure_membership(db, payload.workspace_id, payload.user_id, required_role="viewer")
         session = models.WorkspaceAIChat(
             workspace_id=payload.workspace_id,
             user_id=payload.user_id,
@@ -289,15 +393,11 @@ def ask_workspace(payload: schemas.WorkspaceChatTurnRequest, db: Session = Depen
             messages=[],
         )
         db.add(session)
-        db.flush()
 
-    messages = list(session.messages or [])
     now = datetime.now(timezone.utc)
-    messages.append({"role": "user", "content": payload.question, "created_at": now.isoformat()})
+    session.messages.append(models.WorkspaceAIChatMessage(role="user", content=payload.question, created_at=now))
 
-    kb_entries = get_relevant_entries(db, payload.workspace_id, payload.question or "workspace summary", top_n=5)
-    context_bundle = bundle_context_entries(kb_entries)
-    context_items = [item.to_schema() for item in context_bundle]
+    context_items, kb_text, _ = _kb_context(db, payload.workspace_id, payload.question or "workspace summary", 5)
     prd_records = search_prd_embeddings(
         db,
         payload.workspace_id,
@@ -309,25 +409,25 @@ def ask_workspace(payload: schemas.WorkspaceChatTurnRequest, db: Session = Depen
     if prd_records:
         prd_context_items = build_prd_context_items(prd_records, start_index=len(context_items) + 1)
         context_items.extend(prd_context_items)
-    context_text = render_context_block(context_bundle)
+    context_text = kb_text or render_context_block([])
     if prd_context_items:
         prd_text = _render_inline_context(prd_context_items)
-        if context_bundle:
+        if kb_text:
             context_text = "\n".join(block for block in [context_text, prd_text] if block)
         else:
             context_text = prd_text
     allowed_markers = {item.marker for item in context_items if item.marker}
-    metrics = collect_dashboard_metrics(db, payload.workspace_id)
+    metrics = cached_dashboard_metrics(db, payload.workspace_id)
     sprint = metrics["sprint"]
     metrics_text = (
-        f"Tasks: total={metrics['tasks'].total}, todo={metrics['tasks'].todo}, in_progress={metrics['tasks'].in_progress}, done={metrics['tasks'].done}. "
+        f"{_tasks_summary(metrics['tasks'])} "
         f"Roadmap completion={metrics['roadmap'].completion_percent}%. Sprint velocity={sprint.velocity} completing {sprint.completed_last_7_days} tasks last week."
     )
 
-    conversation = [{"role": msg["role"], "content": msg["content"]} for msg in messages]
+    history = [msg for msg in session.messages[:-1] if msg.content][-CHAT_HISTORY_WINDOW:]
+    conversation = [{"role": msg.role, "content": msg.content} for msg in history]
     prompt_boost = (
-        f"You are the Ask My Workspace assistant. Answer clearly with actionable details using only workspace context.\n"
-        f"Reference evidence using the exact marker syntax like [CTX1]. If the context does not contain the answer, reply with the exact phrase: {DECLINE_PHRASE}\n"
+        f"{WORKSPACE_CHAT_PROMPT_PREAMBLE}"
         f"Workspace metrics summary: {metrics_text}\n"
         f"Knowledge references:\n{context_text}\n"
         f"User question: {payload.question}"
@@ -340,15 +440,9 @@ def ask_workspace(payload: schemas.WorkspaceChatTurnRequest, db: Session = Depen
             model="gpt-4o-mini",
             temperature=0.2,
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You answer questions about this workspace succinctly, only using provided metrics and knowledge snippets."
-                        f" Cite snippets using [CTX#]. If the context is insufficient, respond with the exact phrase '{DECLINE_PHRASE}'."
-                    ),
-                }
+                {"role": "system", "content": WORKSPACE_CHAT_SYSTEM_PROMPT}
             ]
-            + conversation[:-1]
+            + conversation
             + [{"role": "user", "content": prompt_boost}],
         )
         answer = completion.choices[0].message.content or answer
@@ -359,12 +453,11 @@ def ask_workspace(payload: schemas.WorkspaceChatTurnRequest, db: Session = Depen
         answer = DECLINE_PHRASE
         verification = schemas.VerificationDetails(status="failed", message="Assistant response could not be verified.")
 
-    messages.append({"role": "assistant", "content": answer, "created_at": datetime.now(timezone.utc).isoformat()})
-    session.messages = messages
-    session.context_entries = [json.loads(item.model_dump_json()) for item in context_items]
-    session.last_message_at = datetime.now(timezone.utc)
+    answered_at = datetime.now(timezone.utc)
+    session.messages.append(models.WorkspaceAIChatMessage(role="assistant", content=answer, created_at=answered_at))
+    session.context_entries = [item.model_dump(mode="json") for item in context_items]
+    session.last_message_at = answered_at
     db.commit()
-    db.refresh(session)
 
     response = _chat_response(session, context_items)
     if verification:
@@ -1,13 +1,16 @@
 import secrets
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+import sqlalchemy as sa
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from .database import get_db
 from . import models, schemas
-from backend.rbac import ensure_membership, normalize_role, validate_role_input, ROLE_ORDER
+from backend.rbac import check_membership, ensure_membership, forget_membership, normalize_role, validate_role_input, ROLE_ALIASES, ROLE_ORDER
 from backend.knowledge_base_service import ensure_workspace_kb
 from backend.ai_providers import (
     upsert_global_openai_credentials,
@@ -21,12 +24,16 @@ workspaces_router = APIRouter(prefix="/workspaces", tags=["workspaces"])
 user_workspaces_router = APIRouter(prefix="/users", tags=["workspaces"])
 
 INVITE_TTL_DAYS = 14
+# Stored role strings that normalize_role treats as admin; kept in sync with ix_workspace_members_admins.
+ADMIN_ROLE_VALUES = ("admin", *sorted(alias for alias, role in ROLE_ALIASES.items() if role == "admin"))
 
 
 def _normalize_email(value: str) -> str:
     return value.strip().lower()
 
 
+# Member lists repeat the same few emails on every request; derive each name once.
+@lru_cache(maxsize=4096)
 def _display_name(email: str | None) -> str:
     if not email:
         return "Unknown"
@@ -37,7 +44,7 @@ def _display_name(email: str | None) -> str:
 
 def _serialize_member(member: models.WorkspaceMember) -> schemas.WorkspaceMemberResponse:
     email = member.user.email if member.user and member.user.email else ""
-    return schemas.WorkspaceMemberResponse(
+    return schemas.WorkspaceMemberResponse.model_construct(
         id=member.id,
         user_id=member.user_id,
         email=email,
@@ -100,16 +107,13 @@ def _serialize_ai_provider_status(
 
 
 def _ensure_remaining_admins(db: Session, workspace_id: UUID, exclude_member_id: UUID | None = None):
-    memberships = (
-        db.query(models.WorkspaceMember)
-        .filter(models.WorkspaceMember.workspace_id == workspace_id)
-        .all()
+    query = db.query(func.count(models.WorkspaceMember.id)).filter(
+        models.WorkspaceMember.workspace_id == workspace_id,
+        func.lower(models.WorkspaceMember.role).in_(ADMIN_ROLE_VALUES),
     )
-    admins = [
-        member
-        for member in memberships
-        if normalize_role(member.role) == "admin" and member.id != exclude_member_id
-    ]
+    if exclude_member_id is not None:
+        query = query.filter(models.WorkspaceMember.id != exclude_member_id)
+    admins = query.scalar()
     if not admins:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -160,28 +164,31 @@ def create_workspace_with_owner(
     return workspace
 
 
-@user_workspaces_router.get("/{user_id}/workspaces", response_model=list[schemas.WorkspaceResponse])
+@user_workspaces_router.get(
+    "/{user_id}/workspaces",
+    response_model=None,
+    responses={200: {"model": list[schemas.WorkspaceResponse]}},
+)
 def list_user_workspaces(user_id: UUID, db: Session = Depends(get_db)):
     memberships = (
-        db.query(models.Workspace, models.WorkspaceMember)
+        db.query(models.Workspace, models.WorkspaceMember.role)
         .join(models.WorkspaceMember, models.WorkspaceMember.workspace_id == models.Workspace.id)
         .filter(models.WorkspaceMember.user_id == user_id)
         .order_by(models.Workspace.created_at.asc())
         .all()
     )
-    results: list[schemas.WorkspaceResponse] = []
-    for workspace, membership in memberships:
-        results.append(
-            schemas.WorkspaceResponse(
-                id=workspace.id,
-                name=workspace.name,
-                owner_id=workspace.owner_id,
-                created_at=workspace.created_at,
-                updated_at=workspace.updated_at,
-                role=normalize_role(membership.role),
-            )
+    results = [
+        schemas.WorkspaceResponse.model_construct(
+            id=workspace.id,
+            name=workspace.name,
+            owner_id=workspace.owner_id,
+            created_at=workspace.created_at,
+            updated_at=workspace.updated_at,
+            role=normalize_role(role),
         )
-    return results
+        for workspace, role in memberships
+    ]
+    return Response(content=schemas.dump_workspaces(results), media_type="application/json")
 
 
 @workspaces_router.post("", response_model=schemas.WorkspaceResponse, status_code=status.HTTP_201_CREATED)
@@ -219,10 +226,9 @@ def update_workspace(
     if not workspace.name:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Workspace name required")
 
-    db.add(workspace)
-    db.commit()
-    db.refresh(workspace)
-    return schemas.WorkspaceResponse(
+    # The UPDATE returns updated_at, so build the response before commit expires the row.
+    db.flush()
+    response = schemas.WorkspaceResponse(
         id=workspace.id,
         name=workspace.name,
         owner_id=workspace.owner_id,
@@ -230,6 +236,8 @@ def update_workspace(
         updated_at=workspace.updated_at,
         role=ctx.role,
     )
+    db.commit()
+    return response
 
 
 @workspaces_router.delete("/{workspace_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -288,10 +296,9 @@ def update_workspace_member_role(
         _ensure_remaining_admins(db, workspace_id, exclude_member_id=member.id)
 
     member.role = new_role
-    db.add(member)
+    response = _serialize_member(member)
     db.commit()
-    db.refresh(member)
-    return _serialize_member(member)
+    return response
 
 
 @workspaces_router.delete("/{workspace_id}/members/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -318,17 +325,26 @@ def remove_workspace_member(workspace_id: UUID, member_id: UUID, user_id: UUID,
     if normalize_role(member.role) == "admin":
         _ensure_remaining_admins(db, workspace_id, exclude_member_id=member.id)
 
-    db.delete(member)
-
-    (
-        db.query(models.ProjectMember)
-        .join(models.Project, models.ProjectMember.project_id == models.Project.id)
-        .filter(
-            models.Project.workspace_id == workspace_id,
-            models.ProjectMember.user_id == member.user_id,
+    # Drop the membership and the user's project memberships in this workspace in one statement.
+    removed = (
+        sa.delete(models.WorkspaceMember)
+        .where(models.WorkspaceMember.id == member.id)
+        .returning(models.WorkspaceMember.user_id)
+        .cte("removed_member")
+    )
+    db.execute(
+        sa.delete(models.ProjectMember)
+        .where(
+            models.ProjectMember.user_id.in_(sa.select(removed.c.user_id)),
+            models.ProjectMember.project_id.in_(
+                sa.select(models.Project.id).where(models.Project.workspace_id == workspace_id)
+            ),
         )
-        .delete(synchronize_session=False)
+        .add_cte(removed)
+        .execution_options(synchronize_session=False)
     )
+    db.expunge(member)
+    forget_membership(db, workspace_id, member.user_id)
     db.commit()
 
 
@@ -428,34 +444,37 @@ def invite_workspace_member(
     user_id: UUID,
     db: Session = Depends(get_db),
 ):
-    ensure_membership(db, workspace_id, user_id, required_role="admin")
-
     normalized_email = _normalize_email(payload.email)
-    requested_role = validate_role_input(payload.role)
-
-    existing_user = (
-        db.query(models.User)
-        .filter(models.User.email == normalized_email)
-        .first()
-    )
-    if existing_user:
-        existing_member = (
-            db.query(models.WorkspaceMember)
-            .filter(
-                models.WorkspaceMember.workspace_id == workspace_id,
-                models.WorkspaceMember.user_id == existing_user.id,
-            )
-            .first()
+    # One round trip: the caller's membership plus the duplicate-member and pending-invite checks.
+    invitee_member = aliased(models.WorkspaceMember)
+    already_member = (
+        db.query(invitee_member.id)
+        .join(models.User, models.User.id == invitee_member.user_id)
+        .filter(
+            invitee_member.workspace_id == workspace_id,
+            models.User.email == normalized_email,
         )
-        if existing_member:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User is already a member")
-
-    active_invite = (
+        .exists()
+    )
+    already_invited = (
         _pending_invites_query(db, workspace_id)
         .filter(models.WorkspaceInvitation.email == normalized_email)
-        .first()
+        .exists()
     )
-    if active_invite:
+    caller, is_member, has_invite = (
+        db.query(models.WorkspaceMember, already_member, already_invited)
+        .filter(
+            models.WorkspaceMember.workspace_id == workspace_id,
+            models.WorkspaceMember.user_id == user_id,
+        )
+        .first()
+    ) or (None, False, False)
+    check_membership(caller, required_role="admin")
+    requested_role = validate_role_input(payload.role)
+
+    if is_member:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User is already a member")
+    if has_invite:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invitation already sent to this email")
 
     token = secrets.token_urlsafe(24)
@@ -480,13 +499,24 @@ def accept_workspace_invitation(
     payload: schemas.WorkspaceInvitationAcceptRequest,
     db: Session = Depends(get_db),
 ):
-    invite = (
-        db.query(models.WorkspaceInvitation)
+    # Invite, accepting user and any existing membership in one round trip.
+    row = (
+        db.query(models.WorkspaceInvitation, models.User, models.WorkspaceMember)
+        .select_from(models.WorkspaceInvitation)
+        .outerjoin(models.User, models.User.id == payload.user_id)
+        .outerjoin(
+            models.WorkspaceMember,
+            and_(
+                models.WorkspaceMember.workspace_id == models.WorkspaceInvitation.workspace_id,
+                models.WorkspaceMember.user_id == payload.user_id,
+            ),
+        )
         .filter(models.WorkspaceInvitation.token == token)
         .first()
     )
-    if not invite:
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invitation not found")
+    invite, user, membership = row
     if invite.cancelled_at:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invitation was cancelled")
     if invite.accepted_at:
@@ -494,29 +524,17 @@ def accept_workspace_invitation(
     if invite.expires_at < datetime.now(timezone.utc):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invitation expired")
 
-    user = db.query(models.User).filter(models.User.id == payload.user_id).first()
     if not user or not user.email:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User profile incomplete")
 
     if _normalize_email(user.email) != invite.email:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invitation email mismatch")
 
-    membership = (
-        db.query(models.WorkspaceMember)
-        .options(joinedload(models.WorkspaceMember.user))
-        .filter(
-            models.WorkspaceMember.workspace_id == invite.workspace_id,
-            models.WorkspaceMember.user_id == payload.user_id,
-        )
-        .first()
-    )
-
     desired_role = validate_role_input(invite.role)
     if membership:
         current_role = normalize_role(membership.role)
         if ROLE_ORDER[current_role] < ROLE_ORDER[desired_role]:
             membership.role = desired_role
-            db.add(membership)
     else:
         membership = models.WorkspaceMember(
             workspace_id=invite.workspace_id,
@@ -524,15 +542,11 @@ def accept_workspace_invitation(
             role=desired_role,
         )
         db.add(membership)
+    membership.user = user
 
     invite.accepted_at = datetime.now(timezone.utc)
-    db.add(invite)
+    # Flushing returns the new row's id and created_at, so the response is built before commit expires it.
+    db.flush()
+    response = _serialize_member(membership)
     db.commit()
-
-    refreshed = (
-        db.query(models.WorkspaceMember)
-        .options(joinedload(models.WorkspaceMember.user))
-        .filter(models.WorkspaceMember.workspace_id == invite.workspace_id, models.WorkspaceMember.user_id == payload.user_id)
-        .first()
-    )
-    return _serialize_member(refreshed or membership)
+    return response